@@ -1,18 +1,489 @@
+from gloomformat import BinaryCodec, SaveCompression, StreamingJSON
+from gloommodel import diff_encounters, digest_dict, merge_encounters
+import abc
+import hashlib
+import itertools
+import json
+import mmap
 import os
+import zlib
 
 
-class Backend:
+class Storage(abc.ABC):
+    """
+    What the Controller needs from a place to keep campaign saves
+
+    Saves are handed over as save info, the indented JSON text of a save
+    (whole or in chunks), with optional save records of the changes since
+    the previous save and a summary of the save.
+    They come back as the parsed save or as text.
+    Child classes implement the abstract methods,
+    the others work on top of those unless overridden.
+    """
+
+    @abc.abstractmethod
+    def check_saves(self) -> list:
+        """
+        Returns the names of the saves in storage (list of str)
+        """
+
+    def get_catalog(self) -> dict:
+        """
+        Returns the summary of saves by save name, as far as known (dict)
+        """
+
+        return {}
+
+    @abc.abstractmethod
+    def save_to_file(
+        self,
+        save_file: str,
+        save_info,
+        save_records: list = None,
+        save_summary: dict = None
+    ):
+        """
+        save_file (str): name of the save
+        save_info (str or iterable of str): save info, whole or in chunks
+        save_records (list of str): JSON records of the changes, if known
+        save_summary (dict): summary of the save, if known
+
+        Stores the save.
+        """
+
+    @abc.abstractmethod
+    def load_save_file(self, save_file: str) -> dict:
+        """
+        save_file (str): name of the save
+
+        Returns the contents of the save (dict)
+        """
+
+    def iter_encounters(self, save_file: str):
+        """
+        save_file (str): name of the save
+
+        Yields the dict representations of the encounters in the save, in order,
+        from the loaded save unless the storage can stream them
+        """
+
+        yield from self.load_save_file(save_file=save_file)["EnounterList"]
+
+    def diff_saves(self, save_file: str, other_file: str) -> list:
+        """
+        save_file (str): name of the save to compare
+        other_file (str): name of the save to compare with
+
+        Compares the saves by structural digests of their encounters,
+        streaming both, see gloommodel.diff_encounters.
+
+        Returns the encounters added, removed and changed in the other save (list)
+        """
+
+        assert isinstance(save_file, str)
+        assert isinstance(other_file, str)
+
+        return diff_encounters(
+            self.iter_encounters(save_file=save_file),
+            self.iter_encounters(save_file=other_file)
+        )
+
+    def find_ancestor(self, save_file: str, other_file: str) -> dict:
+        """
+        save_file (str): name of our save
+        other_file (str): name of the other save
+
+        Saves only have a common ancestor where one was forked from
+        the other or both from the same save, which this storage
+        does not keep track of. A backup both saves start with
+        is no fork point, so no ancestor is guessed from backups,
+        merge_saves then needs one to be given.
+
+        Returns the save, backup generation and number of encounters
+        of the common ancestor of the saves, or None if there is none (dict)
+        """
+
+        assert isinstance(save_file, str)
+        assert isinstance(other_file, str)
+
+        return None
+
+    def iter_ancestor(self, ancestor: dict):
+        """
+        ancestor (dict):
+            save, backup generation (0 for the save itself)
+            and number of encounters (None for all) of a common ancestor
+
+        Yields the dict representations of the encounters of the ancestor, in order
+        """
+
+        if ancestor.get("generation", 0):
+            encounter_dicts = self.load_backup(
+                save_file=ancestor["save"],
+                generation=ancestor["generation"]
+            )["EnounterList"]
+        else:
+            encounter_dicts = self.iter_encounters(save_file=ancestor["save"])
+
+        yield from itertools.islice(encounter_dicts, ancestor.get("encounters"))
+
+    def merge_saves(self, save_file: str, other_file: str, ancestor: dict = None) -> tuple:
+        """
+        save_file (str): name of our save
+        other_file (str): name of the save to merge into ours
+        ancestor (dict):
+            common ancestor of the saves, as found by find_ancestor
+            when left as None
+
+        Merges the saves by structural digests of their encounters,
+        streaming the ancestor and the other save,
+        see gloommodel.merge_encounters. Nothing is saved.
+
+        Returns the merged save contents (dict) and the conflicts (list)
+        """
+
+        assert isinstance(save_file, str)
+        assert isinstance(other_file, str)
+
+        if ancestor is None:
+            ancestor = self.find_ancestor(save_file=save_file, other_file=other_file)
+        assert ancestor is not None, \
+            f"{save_file} and {other_file} have no common ancestor"
+
+        encounter_list, conflicts = merge_encounters(
+            self.iter_ancestor(ancestor=ancestor),
+            self.iter_encounters(save_file=save_file),
+            self.iter_encounters(save_file=other_file)
+        )
+
+        return {"EnounterList": encounter_list}, conflicts
+
+    def check_backups(self, save_file: str) -> int:
+        """
+        save_file (str): name of the save
+
+        Returns the number of earlier versions of the save kept (int)
+        """
+
+        return 0
+
+    def load_backup(self, save_file: str, generation: int) -> dict:
+        """
+        save_file (str): name of the save
+        generation (int): which earlier version, 1 being the most recent
+
+        Storage keeps no earlier versions unless a child class does,
+        so by default there is no backup to load.
+
+        Returns the contents of the earlier version of the save (dict)
+        """
+
+        raise ValueError(f"{save_file} has no backup {generation}")
+
+    def fork_save(self, save_file: str, fork_file: str):
+        """
+        save_file (str): name of the save to fork
+        fork_file (str): name of the new save
+
+        Starts a new save with the encounters of the save so far,
+        as a plain copy unless the storage can share them.
+        """
+
+        assert isinstance(save_file, str)
+        assert isinstance(fork_file, str)
+        assert fork_file not in self.check_saves(), f"{fork_file} already exists"
+
+        save_dict = self.load_save_file(save_file=save_file)
+
+        self.save_to_file(
+            save_file=fork_file,
+            save_info=json.dumps(save_dict, indent=2, sort_keys=True),
+            save_summary=self.summarize_save_dict(save_dict)
+        )
+
+    def load_save_file_as_text(self, save_file: str) -> str:
+        """
+        save_file (str): name of the save
+
+        Returns the save info of the save (str)
+        """
+
+        return json.dumps(
+            self.load_save_file(save_file=save_file),
+            indent=2,
+            sort_keys=True
+        )
+
+    @staticmethod
+    def apply_save_record(save_dict: dict, save_record: dict) -> dict:
+        """
+        save_dict (dict): contents of a save
+        save_record (dict): index and encounter (or None) of a change
+
+        Cuts the encounter list back to the index and appends the encounter,
+        so applying a record twice is harmless.
+
+        Returns the changed save contents (dict)
+        """
+
+        encounter_list = save_dict["EnounterList"]
+
+        del encounter_list[save_record["index"]:]
+        if save_record["encounter"] is not None:
+            encounter_list.append(save_record["encounter"])
+
+        return save_dict
+
+    @staticmethod
+    def summarize_save_dict(save_dict: dict) -> dict:
+        """
+        save_dict (dict): contents of a save
+
+        Returns the number of encounters in the save, the number per type
+        and the type and identifier of the last one (dict)
+        """
+
+        encounter_list = save_dict["EnounterList"]
+
+        encounter_types = {}
+        for encounter_as_dict in encounter_list:
+            encounter_types[encounter_as_dict["type"]] = \
+                encounter_types.get(encounter_as_dict["type"], 0) + 1
+
+        if encounter_list:
+            last_encounter = {
+                "type": encounter_list[-1]["type"],
+                "identifier": encounter_list[-1]["data"]["identifier"]
+            }
+        else:
+            last_encounter = None
+
+        return {
+            "encounters": len(encounter_list),
+            "types": encounter_types,
+            "last_encounter": last_encounter
+        }
+
+
+class BackendMemory(Storage):
+    """
+    Keeps saves in memory only, for benchmarks and isolated sessions
+
+    Saves are kept parsed, so saving and loading cost no more than
+    encoding and decoding the save info.
+    """
+
+    def __init__(self):
+
+        super().__init__()
+
+        # parsed saves by save name
+        self.saves = {}
+
+    def check_saves(self) -> list:
+        """
+        Check for current saves in memory
+        """
+
+        return list(self.saves)
+
+    def get_catalog(self) -> dict:
+        """
+        Get the summary of every save in memory by save name
+        """
+
+        return {
+            save_file: dict(self.summarize_save_dict(save_dict), format="memory")
+            for save_file, save_dict in self.saves.items()
+        }
+
+    def save_to_file(
+        self,
+        save_file: str,
+        save_info,
+        save_records: list = None,
+        save_summary: dict = None
+    ):
+        """
+        save_file (str): name of the save
+        save_info (str or iterable of str): save info, whole or in chunks
+        save_records (list of str): JSON records of the changes, if known
+        save_summary (dict): unused, the summary is worked out when asked
+
+        Applies the save records to a known save,
+        otherwise parses the save info.
+        """
+
+        assert isinstance(save_file, str)
+        assert isinstance(save_info, str) or hasattr(save_info, "__iter__")
+
+        if save_records is not None and save_file in self.saves:
+            for save_record in save_records:
+                self.apply_save_record(
+                    save_dict=self.saves[save_file],
+                    save_record=json.loads(save_record)
+                )
+        else:
+            if not isinstance(save_info, str):
+                save_info = "".join(save_info)
+            self.saves[save_file] = json.loads(save_info)
+
+    def load_save_file(self, save_file: str) -> dict:
+        """
+        Get the contents of a save in memory.
+        The encounter list is a copy, the encounter dicts are shared,
+        as loading only ever reads them.
+        """
+        assert isinstance(save_file, str)
+
+        return {"EnounterList": list(self.saves[save_file]["EnounterList"])}
+
+
+class Backend(Storage):
     # this value is also in .gitignore, change it together with this one
     save_path = "__gloomsave__"
     save_extension = ".json.gml"
     backup_extension = ".prev"
-    delete_extension = ".old"
     new_extension = ".new"
+    journal_extension = ".journal"
+    history_extension = ".history"
+    fork_extension = ".fork"
+    fork_point_extension = ".forkpoint"
+    forks_extension = ".forks"
+
+    # when journaling, new encounters are appended to a journal file
+    # instead of rewriting the whole save file on every change
+    journal = False
+    # journal size in bytes above which it is compacted into the save file
+    journal_limit = 65536
+
+    # number of earlier versions of a save that can be restored,
+    # past the backup file they are kept as deltas in a history file
+    backup_generations = 1
+
+    # format new save files are written in,
+    # loading detects the format of a save file by itself
+    save_format = "json"
+    save_formats = ("json", "binary")
+    # version of the save formats, recorded in the catalog
+    save_format_version = 1
+
+    # the catalog keeps a summary of every save in the save directory,
+    # so saves can be listed and described without reading them
+    catalog = False
+    catalog_file = "__catalog__.json"
+
+    # the header is a fixed size summary in front of the save data,
+    # so a save can be described with a single small read
+    header = False
+    header_magic = b"GLMH\x01"
+    header_size = 1024
+
+    # how sure a save is to survive a crash or power cut once written:
+    # not synced, the save data synced, or the save data and its directory
+    durability = "none"
+    durability_levels = ("none", "fsync-file", "fsync-file-and-dir")
+
+    # compression of new save files and so of their backups,
+    # loading detects the compression of a save file by itself
+    compression = "none"
+    compressions = SaveCompression.compressions
+    # from 0 to 9, None for the default of the compression
+    compression_level = None
+
+    def __init__(
+        self,
+        journal: bool = None,
+        journal_limit: int = None,
+        save_format: str = None,
+        catalog: bool = None,
+        header: bool = None,
+        durability: str = None,
+        compression: str = None,
+        compression_level: int = None,
+        save_path: str = None,
+        backup_generations: int = None
+    ):
+        """
+        journal (bool):
+            append save records to a journal instead of rewriting the save
+        journal_limit (int):
+            journal size in bytes above which the save file is rewritten
+        save_format ("json" or "binary"):
+            format to write save files in
+        catalog (bool):
+            keep a catalog of the saves in the save directory
+        header (bool):
+            start save files with a fixed size summary header
+        durability ("none", "fsync-file" or "fsync-file-and-dir"):
+            what to sync to disk before a save counts as written
+        compression ("none", "zlib" or "lzma"):
+            compression to write save files with
+        compression_level (int):
+            compression level from 0 (fastest) to 9 (smallest)
+        save_path (str):
+            directory of the save files
+        backup_generations (int):
+            number of earlier versions of a save to keep
+
+        Leave a parameter as None to use the class default.
+        """
+
+        super().__init__()
+
+        # the catalog as last read or written, with the directory mtime
+        self.catalog_cache = None
+
+        if journal is not None:
+            assert isinstance(journal, bool)
+            self.journal = journal
+
+        if journal_limit is not None:
+            assert isinstance(journal_limit, int)
+            assert journal_limit >= 0
+            self.journal_limit = journal_limit
+
+        if save_format is not None:
+            assert save_format in self.save_formats
+            self.save_format = save_format
+
+        if catalog is not None:
+            assert isinstance(catalog, bool)
+            self.catalog = catalog
+
+        if header is not None:
+            assert isinstance(header, bool)
+            self.header = header
+
+        if durability is not None:
+            assert durability in self.durability_levels
+            self.durability = durability
+
+        if compression is not None:
+            assert compression in self.compressions
+            self.compression = compression
+
+        if compression_level is not None:
+            assert isinstance(compression_level, int)
+            assert 0 <= compression_level <= 9
+            self.compression_level = compression_level
+
+        if save_path is not None:
+            assert isinstance(save_path, str)
+            self.save_path = save_path
+
+        if backup_generations is not None:
+            assert isinstance(backup_generations, int)
+            assert backup_generations >= 1
+            self.backup_generations = backup_generations
 
     def check_saves(self) -> list:
         """
         Check for current save files on disk
         """
+        if self.catalog:
+            return list(self.get_catalog())
+
         list_saves = []
 
         if os.path.exists(self.save_path):
@@ -24,96 +495,2103 @@ class Backend:
 
         return list_saves
 
-    @staticmethod
-    def write_new_text_file(file_name: str, file_text: str):
+    def get_catalog(self) -> dict:
         """
-        file_name (str): path name of the file to write
-        file_text (str): text to write in the file
+        Get the summary of every save on disk by save name.
+        Summaries hold the size, mtime, number of encounters, last encounter
+        and format of a save.
 
-        Write a new text file to disk.
+        The catalog is only rebuilt from the saves themselves
+        when the save directory changed since the catalog was written.
         """
 
-        assert isinstance(file_name, str)
-        assert isinstance(file_text, str)
+        if not self.catalog or not os.path.exists(self.save_path):
+            return {}
 
-        with open(file_name, "x") as file:
-            file.write(file_text)
+        directory_mtime = os.stat(self.save_path).st_mtime_ns
 
-    def _backup_creation_(self, save_file: str):
+        if (
+            self.catalog_cache is not None
+            and self.catalog_cache["directory_mtime"] == directory_mtime
+        ):
+            return self.catalog_cache["saves"]
+
+        try:
+            with open(self.save_path + "/" + self.catalog_file, "r") as file:
+                catalog = json.load(file)
+            assert catalog["directory_mtime"] == directory_mtime
+            self.catalog_cache = catalog
+        except (OSError, ValueError, KeyError, AssertionError):
+            self._catalog_rebuild_()
+
+        return self.catalog_cache["saves"]
+
+    def _catalog_rebuild_(self):
         """
-        This function should only be used by saveToFile.
+        This function should only be used by get_catalog.
         Use at your own risk.
 
-        save_file (str): file name of the save file
-
-        Sets the current save file to become a backup file.
-        Sets the new save file to become the current save file.
+        Summarizes every save on disk and writes a new catalog.
         """
 
-        assert isinstance(save_file, str)
+        catalog_saves = {}
 
-        os.rename(save_file, save_file + self.backup_extension)
-        os.rename(save_file + self.new_extension, save_file)
+        for save_file in os.listdir(self.save_path):
+            if save_file.endswith(self.save_extension):
+                save_name = save_file.replace(self.save_extension, "")
+                # saves with a header are summarized without reading them
+                save_summary = self.read_save_header(save_file=save_name)
+                if save_summary is None:
+                    save_summary = self.summarize_save_dict(
+                        self.load_save_file(save_file=save_name)
+                    )
+                catalog_saves[save_name] = self.summarize_save(
+                    save_file=save_name,
+                    save_summary=save_summary
+                )
 
-    def save_to_file(
-        self,
-        save_file: str,
-        save_info: str,
-        save_path: str = None,
-        save_extension: str = None
-    ):
+        self.write_catalog(catalog_saves=catalog_saves)
+
+    def write_catalog(self, catalog_saves: dict):
         """
-        save_path (str): relative path where to save the file
-        save_file (str): base name of the save file to write
-        save_info (str): save info to write in the file
+        catalog_saves (dict): summary of every save on disk by save name
 
-        Saves text to a file.
-        Also, checks if a directory for saving and backups exist,
-        creates a directory and rotates saves and backups if present.
+        Writes the catalog along with the current mtime of the save directory.
+        The catalog is written next to the old one and moved in place,
+        so a crash while writing never leaves half a catalog.
+        Moving it changes the mtime of the directory,
+        which is then set back to the mtime the catalog holds,
+        as the catalog itself is no change to the saves.
         """
 
-        if save_path is None:
-            save_path = self.save_path
+        assert isinstance(catalog_saves, dict)
 
-        if save_extension is None:
-            save_extension = self.save_extension
+        catalog_file = self.save_path + "/" + self.catalog_file
+        new_file = catalog_file + self.new_extension
+
+        directory_stat = os.stat(self.save_path)
+        catalog = {
+            "directory_mtime": directory_stat.st_mtime_ns,
+            "saves": catalog_saves
+        }
+
+        if os.path.exists(new_file):
+            os.remove(new_file)
+
+        self.write_new_text_file(
+            file_name=new_file,
+            file_text=json.dumps(catalog, indent=2, sort_keys=True)
+        )
+
+        if self.durability != "none":
+            self.sync_file(file_name=new_file)
+
+        os.replace(new_file, catalog_file)
+        os.utime(
+            self.save_path,
+            ns=(directory_stat.st_atime_ns, directory_stat.st_mtime_ns)
+        )
+
+        self.catalog_cache = catalog
+
+    def summarize_save(self, save_file: str, save_summary: dict) -> dict:
+        """
+        save_file (str): base name of a save file on disk
+        save_summary (dict): number of encounters and last encounter
+
+        Returns the catalog summary of the save (dict)
+        """
 
         assert isinstance(save_file, str)
-        assert isinstance(save_info, str)
-        assert isinstance(save_path, str)
-        assert isinstance(save_extension, str)
+        assert isinstance(save_summary, dict)
 
-        save_file = save_path + "/" + save_file + save_extension
+        file_name = self.save_path + "/" + save_file + self.save_extension
+        file_names = [file_name]
+        if os.path.exists(file_name + self.journal_extension):
+            file_names.append(file_name + self.journal_extension)
 
-        if os.path.exists(save_path):
-            if os.path.exists(save_file):
-                self.write_new_text_file(
-                    file_name=save_file + self.new_extension,
-                    file_text=save_info
-                )
-                if os.path.exists(save_file + self.backup_extension):
-                    os.rename(
-                        save_file + self.backup_extension,
-                        save_file + self.delete_extension
-                    )
-                    self._backup_creation_(save_file=save_file)
-                    os.remove(save_file + self.delete_extension)
-                else:
-                    self._backup_creation_(save_file=save_file)
-                return
+        save_header = self.read_save_header(save_file=save_file)
+
+        if save_header is not None:
+            save_format = save_header["format"]
+            compression = save_header["compression"]
         else:
-            os.mkdir(save_path)
+            with open(file_name, "rb") as file:
+                save_data = file.read(SaveCompression.chunk_size)
+            compression = SaveCompression.detect(save_data)
+            if compression != "none":
+                save_data = SaveCompression.decompress_prefix(
+                    save_data=save_data,
+                    compression=compression,
+                    length=len(BinaryCodec.magic)
+                )
+            if BinaryCodec.is_binary(save_data):
+                save_format = "binary"
+            else:
+                save_format = "json"
 
-        self.write_new_text_file(file_name=save_file, file_text=save_info)
+        return {
+            "size": sum(os.path.getsize(name) for name in file_names),
+            "mtime": max(os.stat(name).st_mtime_ns for name in file_names),
+            "encounters": save_summary["encounters"],
+            "last_encounter": save_summary["last_encounter"],
+            "format": save_format,
+            "compression": compression,
+            "version": self.save_format_version
+        }
 
     @classmethod
-    def load_save_file_as_text(cls, save_file: str) -> str:
+    def summarize_save_text(cls, save_text: str) -> dict:
+        """
+        save_text (str): text info of a save
+
+        Returns the number of encounters in the save, the number per type
+        and the type and identifier of the last one (dict)
+        """
+
+        return cls.summarize_save_dict(json.loads(save_text))
+
+    @staticmethod
+    def summarize_save_chunks(save_info, save_summary: dict):
+        """
+        save_info (str or iterable of str): save info, whole or in chunks
+        save_summary (dict): filled in with the summary of the save
+
+        Yields the save info chunk by chunk as it is, parsing the chunks
+        along the way, see StreamingJSON.iter_encounters,
+        so the whole save is never in memory to summarize it.
+        Once every chunk is yielded, the summary holds the number of encounters,
+        the number per type and the type and identifier of the last one.
+        """
+
+        assert isinstance(save_info, str) or hasattr(save_info, "__iter__")
+        assert isinstance(save_summary, dict)
+
+        if isinstance(save_info, str):
+            save_info = (save_info,)
+
+        # chunks read by the parser, passed on once it is done with them
+        read_chunks = []
+
+        def chunk_reading():
+            for text_chunk in save_info:
+                read_chunks.append(text_chunk)
+                yield text_chunk.encode("utf-8")
+
+        encounter_count = 0
+        encounter_types = {}
+        last_encounter = None
+
+        for encounter_as_dict in StreamingJSON.iter_encounters(chunk_reading()):
+            encounter_count += 1
+            encounter_types[encounter_as_dict["type"]] = \
+                encounter_types.get(encounter_as_dict["type"], 0) + 1
+            last_encounter = {
+                "type": encounter_as_dict["type"],
+                "identifier": encounter_as_dict["data"]["identifier"]
+            }
+            yield from read_chunks
+            read_chunks.clear()
+
+        yield from read_chunks
+
+        save_summary.update(
+            encounters=encounter_count,
+            types=encounter_types,
+            last_encounter=last_encounter
+        )
+
+    def make_save_header(
+        self,
+        save_summary: dict,
+        save_format: str,
+        checksum: int,
+        compression: str = "none"
+    ) -> bytes:
+        """
+        save_summary (dict):
+            number of encounters, number per type and last encounter
+        save_format ("json" or "binary"): format of the save data
+        checksum (int): CRC-32 of the stored save data following the header
+        compression ("none", "zlib" or "lzma"): compression of the save data
+
+        A summary too large for the header is left out of it,
+        the number per type and last encounter first,
+        readers then have to read the save itself for it.
+
+        Returns the fixed size header for the save data (bytes)
+        """
+
+        assert isinstance(save_summary, dict)
+        assert save_format in self.save_formats
+        assert isinstance(checksum, int)
+        assert compression in self.compressions
+
+        save_header = {
+            "version": self.save_format_version,
+            "format": save_format,
+            "compression": compression,
+            "checksum": checksum
+        }
+        header_space = self.header_size - len(self.header_magic) - 1
+
+        for summary_fields in (
+            ("encounters", "types", "last_encounter"),
+            ("encounters",),
+            ()
+        ):
+            header_text = json.dumps(
+                dict(
+                    save_header,
+                    **{field: save_summary[field] for field in summary_fields}
+                ),
+                sort_keys=True
+            ).encode("utf-8")
+            if len(header_text) <= header_space:
+                break
+        else:
+            raise ValueError(f"save header does not fit in {self.header_size} bytes")
+
+        # padded with spaces, so the header can be rewritten in place
+        padding = header_space - len(header_text)
+
+        return self.header_magic + header_text + b" " * padding + b"\n"
+
+    def read_save_header(self, save_file: str):
         """
-        Get the text info in a save file on disk
+        save_file (str): base name of a save file on disk
+
+        Reads no more than the fixed size header of the save file.
+
+        Returns the header of the save as a dict,
+        or None if the save file has no header
         """
+
         assert isinstance(save_file, str)
 
-        with open(cls.save_path + "/" + save_file + cls.save_extension, "r") as file:
-            save_text = file.read()
+        file_name = self.save_path + "/" + save_file + self.save_extension
+
+        with open(file_name, "rb") as file:
+            return self.parse_save_header(file.read(self.header_size))
+
+    @classmethod
+    def parse_save_header(cls, save_data):
+        """
+        save_data (bytes-like): save data starting with a header or not
+
+        Returns the header as a dict, or None if there is no header
+        """
+
+        if bytes(save_data[:len(cls.header_magic)]) != cls.header_magic:
+            return None
+
+        assert len(save_data) >= cls.header_size
+
+        return json.loads(
+            bytes(save_data[len(cls.header_magic):cls.header_size])
+        )
+
+    @classmethod
+    def strip_save_header(cls, save_data: bytes):
+        """
+        save_data (bytes): contents of a save file
+
+        Removes the header, if any, after verifying the checksum in it.
+
+        Returns the save data after the header (bytes-like)
+        """
+
+        save_header = cls.parse_save_header(save_data)
+
+        if save_header is None:
+            return save_data
+
+        save_data = memoryview(save_data)[cls.header_size:]
+        assert zlib.crc32(save_data) == save_header["checksum"], \
+            "save file does not match its header checksum"
+
+        return save_data
+
+    def update_save_header(self, file_name: str, save_summary: dict):
+        """
+        file_name (str): path name of a save file with a header
+        save_summary (dict):
+            number of encounters, number per type and last encounter
+
+        Rewrites the summary in the header in place,
+        keeping the checksum and format of the save data.
+        Save files without a header are left alone.
+        """
+
+        assert isinstance(file_name, str)
+        assert isinstance(save_summary, dict)
+
+        with open(file_name, "r+b") as file:
+            save_header = self.parse_save_header(file.read(self.header_size))
+            if save_header is None:
+                return
+
+            file.seek(0)
+            file.write(
+                self.make_save_header(
+                    save_summary=save_summary,
+                    save_format=save_header["format"],
+                    checksum=save_header["checksum"],
+                    compression=save_header["compression"]
+                )
+            )
+            if self.durability != "none":
+                file.flush()
+                os.fsync(file.fileno())
+
+    @staticmethod
+    def write_new_text_file(file_name: str, file_text):
+        """
+        file_name (str): path name of the file to write
+        file_text (str or iterable of str):
+            text to write in the file, whole or in chunks
+
+        Write a new text file to disk.
+        Chunks are written one by one through the file buffer.
+        """
+
+        assert isinstance(file_name, str)
+
+        if isinstance(file_text, str):
+            file_text = (file_text,)
+
+        with open(file_name, "x") as file:
+            for text_chunk in file_text:
+                assert isinstance(text_chunk, str)
+                file.write(text_chunk)
+
+    @staticmethod
+    def write_new_binary_file(file_name: str, file_data: bytes):
+        """
+        file_name (str): path name of the file to write
+        file_data (bytes): data to write in the file
+
+        Write a new binary file to disk.
+        """
+
+        assert isinstance(file_name, str)
+        assert isinstance(file_data, bytes)
+
+        with open(file_name, "xb") as file:
+            file.write(file_data)
+
+    def write_new_save_file(
+        self,
+        file_name: str,
+        save_info,
+        save_summary: dict = None
+    ):
+        """
+        file_name (str): path name of the file to write
+        save_info (str or iterable of str):
+            save info to write in the file, whole or in chunks
+        save_summary (dict): summary for the header, when writing one
+
+        Write a new save file to disk in the save format
+        and with the compression of this Backend.
+        JSON saves are streamed and compressed chunk by chunk,
+        binary saves need the whole save to be encoded first.
+        """
+
+        if isinstance(save_info, str):
+            save_info = (save_info,)
+
+        if self.save_format == "binary":
+            save_chunks = (BinaryCodec.encode(json.loads("".join(save_info))),)
+        elif self.header or self.compression != "none":
+            save_chunks = (text_chunk.encode("utf-8") for text_chunk in save_info)
+        else:
+            self.write_new_text_file(file_name=file_name, file_text=save_info)
+            return
+
+        self._save_streaming_(
+            file_name=file_name,
+            save_chunks=save_chunks,
+            save_summary=save_summary
+        )
+
+    def _save_streaming_(
+        self,
+        file_name: str,
+        save_chunks,
+        save_summary: dict
+    ):
+        """
+        This function should only be used by write_new_save_file.
+        Use at your own risk.
+
+        file_name (str): path name of the file to write
+        save_chunks (iterable of bytes): save data to write in the file
+        save_summary (dict): summary for the header, when writing one
+
+        Streams the save data through the compressor, if any,
+        after room for the header, which is filled in last,
+        once the checksum of the stored data is known.
+        """
+
+        if self.compression != "none":
+            compressor = SaveCompression.make_compressor(
+                compression=self.compression,
+                level=self.compression_level
+            )
+        else:
+            compressor = None
+
+        checksum = 0
+
+        with open(file_name, "xb") as file:
+            if self.header:
+                file.write(b" " * self.header_size)
+
+            for chunk_data in save_chunks:
+                if compressor is not None:
+                    chunk_data = compressor.compress(chunk_data)
+                checksum = zlib.crc32(chunk_data, checksum)
+                file.write(chunk_data)
+
+            if compressor is not None:
+                chunk_data = compressor.flush()
+                checksum = zlib.crc32(chunk_data, checksum)
+                file.write(chunk_data)
+
+            if self.header:
+                file.seek(0)
+                file.write(
+                    self.make_save_header(
+                        save_summary=save_summary,
+                        save_format=self.save_format,
+                        checksum=checksum,
+                        compression=self.compression
+                    )
+                )
+
+    @staticmethod
+    def sync_file(file_name: str):
+        """
+        file_name (str): path name of the file to sync
+
+        Makes sure the contents of a file are on disk.
+        """
+
+        assert isinstance(file_name, str)
+
+        # opened for writing, as Windows only flushes writable files
+        file_descriptor = os.open(file_name, os.O_RDWR)
+        try:
+            os.fsync(file_descriptor)
+        finally:
+            os.close(file_descriptor)
+
+    @staticmethod
+    def sync_directory(directory_name: str):
+        """
+        directory_name (str): path name of the directory to sync
+
+        Makes sure renamed, linked and removed files in a directory
+        are on disk. Windows cannot sync directories, so it is skipped there.
+        """
+
+        assert isinstance(directory_name, str)
+
+        if os.name == "nt":
+            return
+
+        file_descriptor = os.open(directory_name, os.O_RDONLY)
+        try:
+            os.fsync(file_descriptor)
+        finally:
+            os.close(file_descriptor)
+
+    def _backup_creation_(self, save_file: str):
+        """
+        This function should only be used by saveToFile.
+        Use at your own risk.
+
+        save_file (str): file name of the save file
+
+        Sets the current save file to become a backup file.
+        Sets the new save file to become the current save file.
+
+        When syncing, the backup is a hard link to the current save file,
+        which the new save file then atomically replaces,
+        so there is a current save file at every moment.
+        Otherwise the current save file is moved aside instead,
+        as replacing it makes some file systems (ext4) write out
+        the new save file right away, costing about as much as a sync.
+        It replaces the backup file in one atomic step,
+        so there is a backup at every moment.
+        """
+
+        assert isinstance(save_file, str)
+
+        backup_file = save_file + self.backup_extension
+
+        if self.durability == "none":
+            os.replace(save_file, backup_file)
+        else:
+            # a hard link cannot replace an existing file
+            if os.path.exists(backup_file):
+                os.remove(backup_file)
+            try:
+                os.link(save_file, backup_file)
+            except OSError:
+                # for file systems without hard links
+                os.replace(save_file, backup_file)
+
+        os.replace(save_file + self.new_extension, save_file)
+
+    def _journal_removal_(self, save_file: str):
+        """
+        This function should only be used by saveToFile.
+        Use at your own risk.
+
+        save_file (str): file name of the save file
+
+        Removes the journal of a save file after it has been compacted.
+        """
+
+        assert isinstance(save_file, str)
+
+        if os.path.exists(save_file + self.journal_extension):
+            os.remove(save_file + self.journal_extension)
+
+    def append_to_journal(self, save_file: str, save_records: list):
+        """
+        save_file (str): file name of the save file
+        save_records (list of str): JSON save records to append
+
+        Appends save records to the journal of a save file, one per line.
+        Returns the size of the journal afterwards (int)
+        """
+
+        assert isinstance(save_file, str)
+        assert isinstance(save_records, list)
+
+        with open(save_file + self.journal_extension, "a") as file:
+            for save_record in save_records:
+                assert isinstance(save_record, str)
+                assert "\n" not in save_record
+                file.write(save_record + "\n")
+            if self.durability != "none":
+                file.flush()
+                os.fsync(file.fileno())
+
+        return os.path.getsize(save_file + self.journal_extension)
+
+    def save_to_file(
+        self,
+        save_file: str,
+        save_info,
+        save_path: str = None,
+        save_extension: str = None,
+        save_records: list = None,
+        save_summary: dict = None
+    ):
+        """
+        save_path (str): relative path where to save the file
+        save_file (str): base name of the save file to write
+        save_info (str or iterable of str):
+            save info to write in the file, whole or in chunks
+        save_records (list of str):
+            JSON records of the changes since the last save,
+            used instead of save_info when journaling
+        save_summary (dict):
+            number of encounters and last encounter for the catalog,
+            worked out from the save itself when left out
+
+        Saves text to a file, streaming it when given in chunks.
+        Also, checks if a directory for saving and backups exist,
+        creates a directory and rotates saves and backups if present.
+
+        When journaling and the save file already exists,
+        only the save records are appended to its journal,
+        save info given in chunks is then not even encoded.
+        Once the journal outgrows journal_limit,
+        save_info is written as usual and the journal is removed.
+
+        When keeping a catalog, the entry of the save is updated as well.
+        When writing headers, the header is kept up to date with the journal.
+
+        The new save file is synced and moved in place according to the
+        durability level, see _backup_creation_ for the rotation.
+
+        A fork only writes the encounters after the ones it shares,
+        see fork_save. Forks of this save that share encounters
+        the change touches are given a full copy of them first,
+        see _forks_copying_. Without save records, the shared encounters
+        are digested while the save info is written, so those forks
+        are copied once it is written, before it replaces the save.
+        """
+
+        if save_path is None:
+            save_path = self.save_path
+
+        if save_extension is None:
+            save_extension = self.save_extension
+
+        assert isinstance(save_file, str)
+        assert isinstance(save_info, str) or hasattr(save_info, "__iter__")
+        assert isinstance(save_path, str)
+        assert isinstance(save_extension, str)
+
+        save_name = save_file
+        save_file = save_path + "/" + save_file + save_extension
+
+        in_save_path = (
+            save_path == self.save_path
+            and save_extension == self.save_extension
+        )
+
+        if in_save_path:
+            fork = self.read_fork(save_file=save_name)
+            forks = self.find_forks(save_file=save_name)
+        else:
+            fork = None
+            forks = {}
+
+        fork_digests = None
+        if forks and save_records is not None:
+            self._forks_copying_(forks=forks, save_records=save_records)
+            forks = {}
+        elif forks:
+            # filled in while the save info is written, see _save_writing_
+            fork_digests = dict.fromkeys(fork["encounters"] for fork in forks.values())
+            save_info = self.digest_save_chunks(
+                save_info=save_info,
+                fork_digests=fork_digests
+            )
+
+        use_catalog = self.catalog and in_save_path
+        if use_catalog:
+            # read before writing, the write changes the directory mtime
+            catalog_saves = dict(self.get_catalog())
+
+        if self.header and (save_summary is None or "types" not in save_summary):
+            # filled in while the save info is written, before the header is
+            save_summary = {}
+            save_info = self.summarize_save_chunks(
+                save_info=save_info,
+                save_summary=save_summary
+            )
+
+        copied_forks = self._save_writing_(
+            file_name=save_file,
+            save_info=save_info,
+            save_records=save_records,
+            save_summary=save_summary,
+            fork=fork,
+            forks=forks,
+            fork_digests=fork_digests
+        )
+
+        if use_catalog:
+            for fork_file in copied_forks:
+                if fork_file in catalog_saves:
+                    catalog_saves[fork_file] = self.summarize_save(
+                        save_file=fork_file,
+                        save_summary=catalog_saves[fork_file]
+                    )
+            if save_summary is None:
+                save_summary = self.summarize_save_dict(
+                    self.load_save_file(save_file=save_name)
+                )
+            catalog_saves[save_name] = self.summarize_save(
+                save_file=save_name,
+                save_summary=save_summary
+            )
+            self.write_catalog(catalog_saves=catalog_saves)
+
+    def _save_writing_(
+        self,
+        file_name: str,
+        save_info,
+        save_records: list = None,
+        save_summary: dict = None,
+        fork: dict = None,
+        forks: dict = None,
+        fork_digests: dict = None
+    ):
+        """
+        This function should only be used by saveToFile.
+        Use at your own risk.
+
+        file_name (str): path name of the save file
+        save_info (str or iterable of str): save info to write in the file
+        save_records (list of str): JSON records to journal instead
+        save_summary (dict): summary for the header, when writing one
+        fork (dict): fork descriptor, when the save file is a fork
+        forks (dict): fork descriptors of forks to copy if they changed
+        fork_digests (dict): digests filled in while the save info is written
+
+        Writes, rotates or journals the save file as described in saveToFile.
+        Keeping more than one backup generation, the version being replaced
+        is added to the history as a delta against the new save file.
+
+        Returns the base names of the forks copied along the way (list)
+        """
+
+        save_file = file_name
+        save_path = os.path.dirname(save_file)
+        history_file = save_file + self.history_extension
+
+        # journal the replaced version of the save file ends with
+        replaced_journal_size = None
+
+        if self.journal and save_records and os.path.exists(save_file):
+            journal_file = save_file + self.journal_extension
+            if os.path.exists(journal_file):
+                replaced_journal_size = os.path.getsize(journal_file)
+            else:
+                replaced_journal_size = 0
+            journal_size = self.append_to_journal(
+                save_file=save_file,
+                save_records=save_records
+            )
+            if journal_size <= self.journal_limit:
+                if self.header:
+                    # a summary worked out from the save info needs it read
+                    if not save_summary:
+                        for _ in save_info:
+                            pass
+                    self.update_save_header(
+                        file_name=save_file,
+                        save_summary=save_summary
+                    )
+                return []
+
+        if not os.path.exists(save_path):
+            os.mkdir(save_path)
+            if self.durability == "fsync-file-and-dir":
+                self.sync_directory(
+                    directory_name=os.path.dirname(os.path.abspath(save_path))
+                )
+
+        if fork is not None:
+            save_info, still_fork = self.strip_fork(save_info=save_info, fork=fork)
+        else:
+            still_fork = True
+
+        new_file = save_file + self.new_extension
+
+        # a new file left behind by an interrupted save is incomplete
+        if os.path.exists(new_file):
+            os.remove(new_file)
+
+        self.write_new_save_file(
+            file_name=new_file,
+            save_info=save_info,
+            save_summary=save_summary
+        )
+
+        if self.durability != "none":
+            self.sync_file(file_name=new_file)
+
+        # the save they share encounters with is still the old one
+        if forks:
+            copied_forks = self._forks_copying_(forks=forks, fork_digests=fork_digests)
+        else:
+            copied_forks = []
+
+        backup_delta = None
+        rebased_delta = None
+
+        if os.path.exists(save_file):
+            if self.backup_generations > 1:
+                rebased_delta = self._delta_rebasing_(
+                    save_file=save_file,
+                    replaced_journal_size=replaced_journal_size
+                )
+                backup_delta = self._delta_making_(
+                    save_file=save_file,
+                    save_records=save_records,
+                    replaced_journal_size=replaced_journal_size
+                )
+            self._backup_creation_(save_file=save_file)
+        else:
+            os.replace(new_file, save_file)
+
+        self._journal_removal_(save_file=save_file)
+
+        # the backup of a fork that is no fork anymore is written in full,
+        # as the save it was forked from is free to change from now on
+        if not still_fork:
+            if os.path.exists(save_file + self.backup_extension):
+                self._full_rewriting_(file_name=save_file + self.backup_extension)
+            self._fork_point_keeping_(file_name=save_file, fork=fork)
+
+        if backup_delta is not None:
+            self._history_appending_(
+                save_file=save_file,
+                backup_delta=backup_delta,
+                rebased_delta=rebased_delta
+            )
+        elif os.path.exists(history_file):
+            # a history no longer matches a save file written without it
+            os.remove(history_file)
+
+        if self.durability == "fsync-file-and-dir":
+            self.sync_directory(directory_name=save_path)
+
+        return copied_forks
+
+    @staticmethod
+    def digest_encounters(encounter_dicts: list) -> str:
+        """
+        encounter_dicts (list of dict): dict representations of encounters
+
+        Hashes the canonical JSON of the encounters, in order.
+
+        Returns the digest as hexadecimal string (str)
+        """
+
+        assert isinstance(encounter_dicts, list)
+
+        canonical_json = json.dumps(encounter_dicts, sort_keys=True, separators=(",", ":"))
+
+        return hashlib.blake2b(canonical_json.encode("utf-8"), digest_size=16).hexdigest()
+
+    def fork_save(self, save_file: str, fork_file: str):
+        """
+        save_file (str): base name of the save file to fork
+        fork_file (str): base name of the new save file
+
+        Starts a new save that shares the encounters of the save so far.
+        The fork file only holds its own encounters, after a "ForkOf"
+        entry with the name of the save, the number of shared encounters
+        and their digest. Loading the fork reads the shared encounters
+        from the save, so they are never copied on disk.
+        The save lists its forks next to it, so saving it finds them
+        without looking through the save directory.
+        The list and a fork descriptor next to the fork file
+        are written first, so a fork is never missed.
+        Once the fork no longer shares encounters, the descriptor is kept
+        to remember the fork point, see _fork_point_keeping_.
+        """
+
+        assert isinstance(save_file, str)
+        assert isinstance(fork_file, str)
+        assert fork_file not in self.check_saves(), f"{fork_file} already exists"
+
+        save_dict = self.load_save_file(save_file=save_file)
+        encounter_list = save_dict["EnounterList"]
+
+        fork = {
+            "save": save_file,
+            "encounters": len(encounter_list),
+            "digest": self.digest_encounters(encounter_list)
+        }
+
+        if not os.path.exists(self.save_path):
+            os.mkdir(self.save_path)
+
+        # listed with the save first, so the save finds the fork from the start
+        self._forks_listing_(
+            save_file=save_file,
+            fork_files=list(self.find_forks(save_file=save_file)) + [fork_file]
+        )
+        self._fork_writing_(
+            file_name=self.save_path + "/" + fork_file + self.save_extension,
+            fork=fork
+        )
+
+        self.save_to_file(
+            save_file=fork_file,
+            save_info=json.dumps(
+                {"EnounterList": [], "ForkOf": fork},
+                indent=2,
+                sort_keys=True
+            ),
+            save_summary=self.summarize_save_dict(save_dict)
+        )
+
+    def read_fork(self, save_file: str):
+        """
+        save_file (str): base name of a save file on disk
+
+        Returns the fork descriptor of the save as a dict,
+        or None if the save is no fork sharing encounters
+        """
+
+        fork = self.read_fork_point(save_file=save_file)
+
+        if fork is None or not fork.get("shared", True):
+            return None
+
+        return fork
+
+    def read_fork_point(self, save_file: str):
+        """
+        save_file (str): base name of a save file on disk
+
+        Returns the fork descriptor of the save as a dict,
+        whether it still shares encounters or not,
+        or None if the save was never forked
+        """
+
+        assert isinstance(save_file, str)
+
+        descriptor_file = self.save_path + "/" + save_file + self.save_extension \
+            + self.fork_extension
+
+        if not os.path.exists(descriptor_file):
+            return None
+
+        with open(descriptor_file, "r") as file:
+            return json.load(file)
+
+    def _fork_writing_(self, file_name: str, fork: dict):
+        """
+        This function should only be used by fork_save and _fork_point_keeping_.
+        Use at your own risk.
+
+        file_name (str): path name of the fork file
+        fork (dict): fork descriptor of the fork
+
+        Writes the fork descriptor next to the fork file and moves it in place.
+        """
+
+        descriptor_file = file_name + self.fork_extension
+        new_file = descriptor_file + self.new_extension
+
+        # left behind by an interrupted write
+        if os.path.exists(new_file):
+            os.remove(new_file)
+
+        self.write_new_text_file(
+            file_name=new_file,
+            file_text=json.dumps(fork, sort_keys=True)
+        )
+
+        if self.durability != "none":
+            self.sync_file(file_name=new_file)
+
+        os.replace(new_file, descriptor_file)
+
+    def _fork_point_keeping_(self, file_name: str, fork: dict):
+        """
+        This function should only be used by saveToFile and copy_fork.
+        Use at your own risk.
+
+        file_name (str): path name of a fork file written in full
+        fork (dict): fork descriptor of the fork
+
+        Keeps the encounters the fork was forked from next to it,
+        read from the save it was forked from, which still has them,
+        and marks the descriptor as no longer sharing them,
+        after which the save no longer lists the fork.
+        So a merge still finds the fork point
+        once the save it was forked from has moved on.
+        """
+
+        shared_list = list(itertools.islice(
+            self.iter_encounters(save_file=fork["save"]),
+            fork["encounters"]
+        ))
+
+        assert (
+            len(shared_list) == fork["encounters"]
+            and self.digest_encounters(shared_list) == fork["digest"]
+        ), f"fork no longer matches {fork['save']}"
+
+        fork_point_file = file_name + self.fork_point_extension
+        new_file = fork_point_file + self.new_extension
+
+        if os.path.exists(new_file):
+            os.remove(new_file)
+
+        self.write_new_text_file(
+            file_name=new_file,
+            file_text=json.dumps({"EnounterList": shared_list}, indent=2, sort_keys=True)
+        )
+
+        if self.durability != "none":
+            self.sync_file(file_name=new_file)
+
+        os.replace(new_file, fork_point_file)
+
+        self._fork_writing_(file_name=file_name, fork=dict(fork, shared=False))
+
+        # unlisted last, a listed fork that no longer shares is passed over
+        self._forks_listing_(
+            save_file=fork["save"],
+            fork_files=list(self.find_forks(save_file=fork["save"]))
+        )
+
+    def find_forks(self, save_file: str) -> dict:
+        """
+        save_file (str): base name of a save file on disk
+
+        Reads the forks listed with the save, leaving out
+        the ones that no longer share its encounters.
+
+        Returns the fork descriptors of the forks of the save by fork name (dict)
+        """
+
+        assert isinstance(save_file, str)
+
+        forks_file = self.save_path + "/" + save_file + self.save_extension \
+            + self.forks_extension
+
+        if not os.path.exists(forks_file):
+            return {}
+
+        with open(forks_file, "r") as file:
+            fork_files = json.load(file)
+
+        forks = {}
+        for fork_file in fork_files:
+            fork = self.read_fork(save_file=fork_file)
+            if fork is not None and fork["save"] == save_file:
+                forks[fork_file] = fork
+
+        return forks
+
+    def _forks_listing_(self, save_file: str, fork_files: list):
+        """
+        This function should only be used by fork_save and _fork_point_keeping_.
+        Use at your own risk.
+
+        save_file (str): base name of a save file on disk
+        fork_files (list of str): base names of the forks sharing its encounters
+
+        Writes the list of forks next to the save and moves it in place,
+        or removes it when the save has no forks left.
+        """
+
+        forks_file = self.save_path + "/" + save_file + self.save_extension \
+            + self.forks_extension
+        new_file = forks_file + self.new_extension
+
+        if not fork_files:
+            if os.path.exists(forks_file):
+                os.remove(forks_file)
+            return
+
+        if os.path.exists(new_file):
+            os.remove(new_file)
+
+        self.write_new_text_file(
+            file_name=new_file,
+            file_text=json.dumps(fork_files)
+        )
+
+        if self.durability != "none":
+            self.sync_file(file_name=new_file)
+
+        os.replace(new_file, forks_file)
+
+    def find_ancestor(self, save_file: str, other_file: str) -> dict:
+        """
+        save_file (str): base name of our save file on disk
+        other_file (str): base name of the other save file on disk
+
+        The point one save was forked from the other,
+        or both from the same save, is taken as their common ancestor,
+        from the save they were forked from while the forks share its encounters
+        and from the kept fork point once they do not.
+        Forks of the same save share the encounters of the earlier fork point
+        only if the save kept them until the later one.
+        Saves without such a fork point have no common ancestor.
+
+        Returns the save, backup generation and number of encounters
+        of the common ancestor of the saves, or None if there is none (dict)
+        """
+
+        fork = self.read_fork_point(save_file=save_file)
+        other_fork = self.read_fork_point(save_file=other_file)
+
+        if other_fork is not None and other_fork["save"] == save_file:
+            return self.fork_point_ancestor(fork_file=other_file, fork=other_fork)
+
+        if fork is not None and fork["save"] == other_file:
+            return self.fork_point_ancestor(fork_file=save_file, fork=fork)
+
+        if fork is not None and other_fork is not None and fork["save"] == other_fork["save"]:
+            encounter_count = min(fork["encounters"], other_fork["encounters"])
+            ancestor, other_ancestor = (
+                self.fork_point_ancestor(
+                    fork_file=fork_file,
+                    fork=dict(fork_point, encounters=encounter_count)
+                )
+                for fork_file, fork_point in ((save_file, fork), (other_file, other_fork))
+            )
+            if [
+                digest_dict(encounter_dict)
+                for encounter_dict in self.iter_ancestor(ancestor=ancestor)
+            ] != [
+                digest_dict(encounter_dict)
+                for encounter_dict in self.iter_ancestor(ancestor=other_ancestor)
+            ]:
+                return None
+            return ancestor
+
+        return super().find_ancestor(save_file=save_file, other_file=other_file)
+
+    def fork_point_ancestor(self, fork_file: str, fork: dict) -> dict:
+        """
+        fork_file (str): base name of a fork file on disk
+        fork (dict): fork descriptor of the fork
+
+        Returns the fork point of the fork as a common ancestor,
+        see find_ancestor (dict)
+        """
+
+        assert isinstance(fork_file, str)
+        assert isinstance(fork, dict)
+
+        if fork.get("shared", True):
+            return {"save": fork["save"], "generation": 0, "encounters": fork["encounters"]}
+
+        return {"save": fork_file, "fork_point": True, "encounters": fork["encounters"]}
+
+    def iter_ancestor(self, ancestor: dict):
+        """
+        ancestor (dict):
+            common ancestor as found by find_ancestor,
+            with "fork_point" set for the kept fork point of the save
+
+        Yields the dict representations of the encounters of the ancestor, in order
+        """
+
+        if not ancestor.get("fork_point", False):
+            yield from super().iter_ancestor(ancestor=ancestor)
+            return
+
+        file_name = self.save_path + "/" + ancestor["save"] + self.save_extension \
+            + self.fork_point_extension
+
+        yield from itertools.islice(
+            self.read_save_file(file_name=file_name, journal_size=0)["EnounterList"],
+            ancestor.get("encounters")
+        )
+
+    def resolve_fork(self, save_dict: dict) -> dict:
+        """
+        save_dict (dict): contents of a save file
+
+        Puts the shared encounters of a fork in front of its own,
+        after checking they are still the ones it was forked from.
+        Contents of a save file that is no fork are returned as they are.
+
+        Returns the contents of the save (dict)
+        """
+
+        fork = save_dict.get("ForkOf")
+
+        if fork is None:
+            return save_dict
+
+        shared_list = self.load_save_file(save_file=fork["save"])["EnounterList"]
+        del shared_list[fork["encounters"]:]
+
+        assert (
+            len(shared_list) == fork["encounters"]
+            and self.digest_encounters(shared_list) == fork["digest"]
+        ), f"fork no longer matches {fork['save']}"
+
+        shared_list.extend(save_dict["EnounterList"])
+
+        return {"EnounterList": shared_list}
+
+    def strip_fork(self, save_info, fork: dict) -> tuple:
+        """
+        save_info (str or iterable of str): save info of the whole fork
+        fork (dict): fork descriptor of the fork
+
+        Leaves the shared encounters out of the save info while streaming it,
+        comparing each with the one of the save it was forked from
+        and digesting them one at a time, see iter_digested.
+        When the fork changed any of them itself, it is no fork anymore,
+        so all of the save info is kept, the encounters compared so far
+        read again from the save, which has the same ones.
+        Save info that already leaves them out is kept as it is.
+
+        Returns the save info to write (str or iterable of str)
+        and whether it is still a fork (bool)
+        """
+
+        if isinstance(save_info, str):
+            if '"ForkOf"' in save_info:
+                return save_info, True
+            save_info = (save_info,)
+
+        encounters = StreamingJSON.iter_encounters(
+            text_chunk.encode("utf-8") for text_chunk in save_info
+        )
+        digested_encounters = self.iter_digested(encounter_dicts=encounters)
+        shared_encounters = self.iter_encounters(save_file=fork["save"])
+
+        shared_count = 0
+        shared_digest = self.digest_encounters([])
+        changed_list = []
+        save_members = None
+
+        while shared_count < fork["encounters"]:
+            try:
+                encounter_as_dict, encounter_digest = next(digested_encounters)
+            except StopIteration as stop:
+                save_members = stop.value
+                break
+            if encounter_as_dict != next(shared_encounters, None):
+                changed_list.append(encounter_as_dict)
+                break
+            shared_count += 1
+            shared_digest = encounter_digest
+
+        shared_encounters.close()
+
+        still_fork = (
+            shared_count == fork["encounters"]
+            and shared_digest == fork["digest"]
+        )
+
+        if still_fork:
+            kept_encounters = iter(())
+        else:
+            kept_encounters = itertools.chain(
+                itertools.islice(
+                    self.iter_encounters(save_file=fork["save"]),
+                    shared_count
+                ),
+                changed_list
+            )
+
+        def remaining_reading():
+            nonlocal save_members
+            if save_members is None:
+                save_members = yield from encounters
+
+        def chunk_writing():
+            separator = '{\n  "EnounterList": [\n    '
+            for encounter_as_dict in itertools.chain(kept_encounters, remaining_reading()):
+                yield separator + json.dumps(
+                    encounter_as_dict,
+                    indent=2,
+                    sort_keys=True
+                ).replace("\n", "\n    ")
+                separator = ",\n    "
+            if separator == ",\n    ":
+                yield "\n  ]"
+            else:
+                yield '{\n  "EnounterList": []'
+            if still_fork:
+                save_members["ForkOf"] = fork
+            # the other members come after the encounter list, as with sort_keys
+            for key in sorted(save_members):
+                yield ",\n  " + json.dumps(key) + ": " + json.dumps(
+                    save_members[key],
+                    indent=2,
+                    sort_keys=True
+                ).replace("\n", "\n  ")
+            yield "\n}"
+
+        return chunk_writing(), still_fork
+
+    @staticmethod
+    def iter_digested(encounter_dicts):
+        """
+        encounter_dicts (iterable of dict): dict representations of encounters
+
+        Hashes the canonical JSON of the encounters one at a time,
+        so the digest of every prefix costs no more than the one of all of them,
+        see digest_encounters.
+
+        Yields each encounter with the digest of the encounters up to it (tuple)
+        Returns what the encounters return, once exhausted
+        """
+
+        encounter_dicts = iter(encounter_dicts)
+        hasher = hashlib.blake2b(b"[", digest_size=16)
+        separator = b""
+
+        while True:
+            try:
+                encounter_as_dict = next(encounter_dicts)
+            except StopIteration as stop:
+                return stop.value
+            hasher.update(separator + json.dumps(
+                encounter_as_dict,
+                sort_keys=True,
+                separators=(",", ":")
+            ).encode("utf-8"))
+            separator = b","
+            prefix_hasher = hasher.copy()
+            prefix_hasher.update(b"]")
+            yield encounter_as_dict, prefix_hasher.hexdigest()
+
+    @classmethod
+    def digest_save_chunks(cls, save_info, fork_digests: dict):
+        """
+        save_info (str or iterable of str): save info, whole or in chunks
+        fork_digests (dict):
+            filled in with the digest of the first encounters of the save
+            by each number of encounters it holds as key
+
+        Yields the save info chunk by chunk as it is, digesting the encounters
+        along the way, see summarize_save_chunks and iter_digested.
+        Numbers beyond the encounters of the save are left as they are.
+        """
+
+        assert isinstance(save_info, str) or hasattr(save_info, "__iter__")
+        assert isinstance(fork_digests, dict)
+
+        if isinstance(save_info, str):
+            save_info = (save_info,)
+
+        if 0 in fork_digests:
+            fork_digests[0] = cls.digest_encounters([])
+
+        read_chunks = []
+
+        def chunk_reading():
+            for text_chunk in save_info:
+                read_chunks.append(text_chunk)
+                yield text_chunk.encode("utf-8")
+
+        digested_encounters = cls.iter_digested(
+            encounter_dicts=StreamingJSON.iter_encounters(chunk_reading())
+        )
+
+        for encounter_count, (_, encounter_digest) in enumerate(digested_encounters, 1):
+            if encounter_count in fork_digests:
+                fork_digests[encounter_count] = encounter_digest
+            yield from read_chunks
+            read_chunks.clear()
+
+        yield from read_chunks
+
+    def _forks_copying_(self, forks: dict, save_records: list = None, fork_digests: dict = None):
+        """
+        This function should only be used by saveToFile.
+        Use at your own risk.
+
+        forks (dict): fork descriptors of the forks of the save about to change
+        save_records (list of str): JSON records of the change, if known
+        fork_digests (dict):
+            digests of the first encounters of the new save info,
+            by number of encounters, see digest_save_chunks
+
+        Gives forks of the save a full copy of the shared encounters
+        the change touches, before the change replaces the save.
+        With save records, those are the forks sharing encounters
+        from the first changed index on. Without, those are the forks
+        whose shared encounters have another digest in the new save info.
+
+        Returns the base names of the copied forks (list)
+        """
+
+        if save_records is not None:
+            changed_index = min(
+                (json.loads(save_record)["index"] for save_record in save_records),
+                default=None
+            )
+            copied_forks = [
+                fork_file for fork_file, fork in forks.items()
+                if changed_index is not None and fork["encounters"] > changed_index
+            ]
+        else:
+            copied_forks = [
+                fork_file for fork_file, fork in forks.items()
+                if fork_digests.get(fork["encounters"]) != fork["digest"]
+            ]
+
+        for fork_file in copied_forks:
+            self.copy_fork(fork_file=fork_file)
+
+        return copied_forks
+
+    def copy_fork(self, fork_file: str):
+        """
+        fork_file (str): base name of a fork file on disk
+
+        Writes the fork and its backup in full, so neither depends on the
+        save it was forked from anymore, and then keeps its fork point,
+        see _fork_point_keeping_.
+        Their contents stay the same, so the fork is not rotated.
+        The fork is written with its journal, which the newest delta
+        in the history was not made against, so that delta is moved
+        onto the fork with its journal, see _delta_rebasing_.
+        """
+
+        assert isinstance(fork_file, str)
+
+        file_name = self.save_path + "/" + fork_file + self.save_extension
+        history_file = file_name + self.history_extension
+
+        rebased_delta = self._delta_rebasing_(
+            save_file=file_name,
+            replaced_journal_size=None
+        )
+
+        for rewritten_file in (file_name, file_name + self.backup_extension):
+            if os.path.exists(rewritten_file):
+                self._full_rewriting_(file_name=rewritten_file)
+
+        if rebased_delta is not None:
+            backup_deltas = self.read_history(history_file=history_file)
+            backup_deltas[-1] = json.dumps(rebased_delta, sort_keys=True)
+            self.write_history(history_file=history_file, backup_deltas=backup_deltas)
+
+        self._journal_removal_(save_file=file_name)
+
+        self._fork_point_keeping_(
+            file_name=file_name,
+            fork=self.read_fork(save_file=fork_file)
+        )
+
+        if self.durability == "fsync-file-and-dir":
+            self.sync_directory(directory_name=self.save_path)
+
+    def _full_rewriting_(self, file_name: str):
+        """
+        This function should only be used by copy_fork and saveToFile.
+        Use at your own risk.
+
+        file_name (str): path name of a save file
+
+        Replaces the save file with one holding all of its contents,
+        including the shared encounters of a fork and the journal.
+        """
+
+        save_dict = self.read_save_file(file_name=file_name)
+        new_file = file_name + self.new_extension
+
+        if os.path.exists(new_file):
+            os.remove(new_file)
+
+        self.write_new_save_file(
+            file_name=new_file,
+            save_info=json.dumps(save_dict, indent=2, sort_keys=True),
+            save_summary=self.summarize_save_dict(save_dict)
+        )
+
+        if self.durability != "none":
+            self.sync_file(file_name=new_file)
+
+        os.replace(new_file, file_name)
+
+    @staticmethod
+    def make_backup_delta(newer_dict: dict, older_dict: dict) -> dict:
+        """
+        newer_dict (dict): contents of the newer version of a save
+        older_dict (dict): contents of the older version of the save
+
+        The delta holds the length of the part both versions share
+        and the encounters of the older version after that part,
+        so it is only as large as the change between the versions.
+        The number of encounters of the newer version is kept as well,
+        to check the delta is applied to the version it was made against.
+
+        Returns the delta that turns the newer version into the older (dict)
+        """
+
+        newer_list = newer_dict["EnounterList"]
+        older_list = older_dict["EnounterList"]
+
+        shared_count = 0
+        for newer_encounter, older_encounter in zip(newer_list, older_list):
+            if newer_encounter != older_encounter:
+                break
+            shared_count += 1
+
+        return {
+            "encounters": len(newer_list),
+            "index": shared_count,
+            "older_encounters": older_list[shared_count:]
+        }
+
+    @staticmethod
+    def apply_backup_delta(save_dict: dict, backup_delta: dict) -> dict:
+        """
+        save_dict (dict): contents of the version the delta was made against
+        backup_delta (dict): delta as made by make_backup_delta
+
+        Returns the contents of the older version of the save (dict)
+        """
+
+        encounter_list = save_dict["EnounterList"]
+
+        assert len(encounter_list) == backup_delta["encounters"], \
+            "backup history does not match the save file"
+
+        del encounter_list[backup_delta["index"]:]
+        encounter_list.extend(backup_delta["older_encounters"])
+
+        return save_dict
+
+    def _delta_making_(
+        self,
+        save_file: str,
+        save_records: list,
+        replaced_journal_size: int
+    ) -> dict:
+        """
+        This function should only be used by saveToFile.
+        Use at your own risk.
+
+        save_file (str): file name of the save file, with the new one next to it
+        save_records (list of str): JSON records of the changes, if any
+        replaced_journal_size (int): bytes of the journal of the replaced version
+
+        Works out the delta from the new save file to the version it replaces,
+        which includes its journal.
+        The newest delta in the history holds the number of encounters
+        the save file was written with, so with the journal and the save
+        records that number is followed up to the new save file.
+        Save records that only append need no save file to be read at all.
+        Otherwise both versions are read and compared.
+
+        Returns the delta as made by make_backup_delta (dict)
+        """
+
+        new_file = save_file + self.new_extension
+        journal_file = save_file + self.journal_extension
+
+        backup_deltas = self.read_history(
+            history_file=save_file + self.history_extension
+        )
+
+        if save_records and backup_deltas:
+            replaced_count = json.loads(backup_deltas[-1])["encounters"]
+            if os.path.exists(journal_file):
+                for save_record in self.read_journal(
+                    journal_file=journal_file,
+                    journal_size=replaced_journal_size
+                ):
+                    replaced_count = min(replaced_count, save_record["index"]) \
+                        + (save_record["encounter"] is not None)
+
+            encounter_count = replaced_count
+            shared_count = replaced_count
+            for save_record in save_records:
+                save_record = json.loads(save_record)
+                encounter_count = min(encounter_count, save_record["index"])
+                shared_count = min(shared_count, encounter_count)
+                encounter_count += save_record["encounter"] is not None
+
+            if shared_count == replaced_count:
+                return {
+                    "encounters": encounter_count,
+                    "index": shared_count,
+                    "older_encounters": []
+                }
+
+        return self.make_backup_delta(
+            newer_dict=self.read_save_file(file_name=new_file),
+            older_dict=self.read_save_file(
+                file_name=save_file,
+                journal_size=replaced_journal_size
+            )
+        )
+
+    def _delta_rebasing_(
+        self,
+        save_file: str,
+        replaced_journal_size: int
+    ) -> dict:
+        """
+        This function should only be used by saveToFile and copy_fork.
+        Use at your own risk.
+
+        save_file (str): file name of the save file, about to be replaced
+        replaced_journal_size (int):
+            bytes of the journal of the replaced version, all when None
+
+        The newest delta in the history was made against the save file
+        as written, but the version being replaced includes its journal,
+        which is what loadBackup applies the delta before it to.
+        So the delta is moved onto the save file with its journal,
+        following the journal records from the number of encounters
+        the delta was made against.
+        Only when the journal rewrote encounters the delta shares
+        is the save file read, for the encounters it no longer shares.
+
+        Returns the delta against the replaced version,
+        or None when the newest delta already is (dict)
+        """
+
+        journal_file = save_file + self.journal_extension
+
+        backup_deltas = self.read_history(
+            history_file=save_file + self.history_extension
+        )
+
+        if not backup_deltas or not os.path.exists(journal_file):
+            return None
+
+        backup_delta = json.loads(backup_deltas[-1])
+
+        encounter_count = backup_delta["encounters"]
+        shared_count = encounter_count
+        for save_record in self.read_journal(
+            journal_file=journal_file,
+            journal_size=replaced_journal_size
+        ):
+            encounter_count = min(encounter_count, save_record["index"])
+            shared_count = min(shared_count, encounter_count)
+            encounter_count += save_record["encounter"] is not None
+
+        if encounter_count == backup_delta["encounters"] \
+                and shared_count == encounter_count:
+            return None
+
+        older_encounters = backup_delta["older_encounters"]
+        if shared_count < backup_delta["index"]:
+            encounter_list = self.read_save_file(
+                file_name=save_file,
+                journal_size=0
+            )["EnounterList"]
+            older_encounters = \
+                encounter_list[shared_count:backup_delta["index"]] + older_encounters
+
+        return {
+            "encounters": encounter_count,
+            "index": min(shared_count, backup_delta["index"]),
+            "older_encounters": older_encounters
+        }
+
+    def _history_appending_(
+        self,
+        save_file: str,
+        backup_delta: dict,
+        rebased_delta: dict = None
+    ):
+        """
+        This function should only be used by saveToFile.
+        Use at your own risk.
+
+        save_file (str): file name of the save file
+        backup_delta (dict): delta from the new save file to the replaced one
+        rebased_delta (dict):
+            newest delta in the history moved onto the replaced version,
+            as made by _delta_rebasing_, if it had to be
+
+        Adds the delta to the history of the save file, one delta per line,
+        dropping the oldest ones past backup_generations.
+        The history is rewritten next to the old one and moved in place,
+        as it is only as large as the deltas in it.
+        """
+
+        assert isinstance(save_file, str)
+        assert isinstance(backup_delta, dict)
+
+        history_file = save_file + self.history_extension
+
+        backup_deltas = self.read_history(history_file=history_file)
+        if rebased_delta is not None:
+            backup_deltas[-1] = json.dumps(rebased_delta, sort_keys=True)
+        backup_deltas.append(json.dumps(backup_delta, sort_keys=True))
+        del backup_deltas[:-self.backup_generations]
+
+        self.write_history(history_file=history_file, backup_deltas=backup_deltas)
+
+    def write_history(self, history_file: str, backup_deltas: list):
+        """
+        history_file (str): path name of a history file
+        backup_deltas (list of str): JSON deltas of the history, oldest first
+
+        Writes the deltas one per line next to the history
+        and moves them in place, syncing them according to the durability level.
+        """
+
+        assert isinstance(history_file, str)
+        assert isinstance(backup_deltas, list)
+
+        new_file = history_file + self.new_extension
+
+        if os.path.exists(new_file):
+            os.remove(new_file)
+
+        self.write_new_text_file(
+            file_name=new_file,
+            file_text=(backup_delta_line + "\n" for backup_delta_line in backup_deltas)
+        )
+
+        if self.durability != "none":
+            self.sync_file(file_name=new_file)
+
+        os.replace(new_file, history_file)
+
+    @staticmethod
+    def read_history(history_file: str) -> list:
+        """
+        history_file (str): path name of a history file
+
+        Returns the JSON deltas in the history, oldest first,
+        or an empty list without a history (list of str)
+        """
+
+        assert isinstance(history_file, str)
+
+        if not os.path.exists(history_file):
+            return []
+
+        with open(history_file, "r") as file:
+            return file.read().splitlines()
+
+    def check_backups(self, save_file: str) -> int:
+        """
+        save_file (str): base name of a save file on disk
+
+        Counts the versions in the history of the save file,
+        or the backup file when there is no history.
+
+        Returns the number of earlier versions of the save kept (int)
+        """
+
+        assert isinstance(save_file, str)
+
+        file_name = self.save_path + "/" + save_file + self.save_extension
+
+        backup_count = len(
+            self.read_history(history_file=file_name + self.history_extension)
+        )
+
+        if not backup_count and os.path.exists(file_name + self.backup_extension):
+            backup_count = 1
+
+        return backup_count
+
+    def load_backup(self, save_file: str, generation: int) -> dict:
+        """
+        save_file (str): base name of a save file on disk
+        generation (int): which earlier version, 1 being the most recent
+
+        Restores an earlier version in memory, by applying the deltas
+        in the history to the save file as it was written, so without
+        the journal kept since, from the most recent delta backwards.
+        Without a history, the first generation is the backup file.
+
+        Returns the contents of the earlier version of the save (dict)
+        """
+
+        assert isinstance(save_file, str)
+        assert isinstance(generation, int)
+        assert 1 <= generation <= self.check_backups(save_file=save_file), \
+            f"no backup generation {generation} of {save_file}"
+
+        file_name = self.save_path + "/" + save_file + self.save_extension
+
+        backup_deltas = self.read_history(
+            history_file=file_name + self.history_extension
+        )
+
+        if not backup_deltas:
+            return self.read_save_file(
+                file_name=file_name + self.backup_extension,
+                journal_size=0
+            )
+
+        save_dict = self.read_save_file(file_name=file_name, journal_size=0)
+
+        for backup_delta in reversed(backup_deltas[-generation:]):
+            self.apply_backup_delta(
+                save_dict=save_dict,
+                backup_delta=json.loads(backup_delta)
+            )
+
+        return save_dict
+
+    @staticmethod
+    def read_journal(journal_file: str, journal_size: int = None):
+        """
+        journal_file (str): path name of the journal file
+        journal_size (int): bytes of the journal to read, all when left out
+
+        Yields the records in the journal as dicts, in order.
+        A torn record at the end of the journal is ignored.
+        """
+
+        assert isinstance(journal_file, str)
+
+        with open(journal_file, "rb") as file:
+            if journal_size is None:
+                journal_lines = file
+            else:
+                journal_lines = file.read(journal_size).splitlines(keepends=True)
+            for line in journal_lines:
+                try:
+                    save_record = json.loads(line)
+                except ValueError:
+                    return
+                yield save_record
+
+    @classmethod
+    def replay_journal(
+        cls,
+        save_dict: dict,
+        journal_file: str,
+        journal_size: int = None
+    ) -> dict:
+        """
+        save_dict (dict): contents of the save file the journal belongs to
+        journal_file (str): path name of the journal file
+        journal_size (int): bytes of the journal to replay, all when left out
+
+        Each journal record holds an index and an encounter (or null).
+        Replaying a record cuts the encounter list back to the index
+        and appends the encounter, so replaying records twice is harmless.
+        A torn record at the end of the journal is ignored.
+
+        Returns the save contents with the journal applied (dict)
+        """
+
+        assert isinstance(save_dict, dict)
+
+        for save_record in cls.read_journal(
+            journal_file=journal_file,
+            journal_size=journal_size
+        ):
+            cls.apply_save_record(save_dict=save_dict, save_record=save_record)
+
+        return save_dict
+
+    def iter_encounters(self, save_file: str):
+        """
+        save_file (str): base name of a save file on disk
+
+        JSON save files, compressed or not, are read and parsed a chunk at a time,
+        so the whole save is never in memory.
+        Encounters the journal changes are held back until the save file is read,
+        binary save files and forks are loaded whole.
+
+        Yields the dict representations of the encounters in the save, in order,
+        including any changes in its journal
+        """
+
+        assert isinstance(save_file, str)
+
+        if self.read_fork(save_file=save_file) is not None:
+            yield from super().iter_encounters(save_file=save_file)
+            return
+
+        save_file = self.save_path + "/" + save_file + self.save_extension
+        journal_file = save_file + self.journal_extension
+
+        if os.path.exists(journal_file):
+            save_records = list(self.read_journal(journal_file=journal_file))
+        else:
+            save_records = []
+
+        # the journal changes nothing in front of its lowest index
+        journal_index = min(
+            (save_record["index"] for save_record in save_records),
+            default=None
+        )
+        journal_dict = {"EnounterList": []}
+
+        with open(save_file, "rb") as file:
+            save_chunks = self._chunk_reading_(file)
+            first_chunk = next(save_chunks, b"")
+
+            if BinaryCodec.is_binary(first_chunk):
+                encounter_dicts = BinaryCodec.decode(
+                    first_chunk + b"".join(save_chunks)
+                )["EnounterList"]
+            else:
+                encounter_dicts = StreamingJSON.iter_encounters(
+                    itertools.chain((first_chunk,), save_chunks)
+                )
+
+            for position, encounter_as_dict in enumerate(encounter_dicts):
+                if journal_index is None or position < journal_index:
+                    yield encounter_as_dict
+                else:
+                    journal_dict["EnounterList"].append(encounter_as_dict)
+
+        for save_record in save_records:
+            self.apply_save_record(
+                save_dict=journal_dict,
+                save_record=dict(save_record, index=save_record["index"] - journal_index)
+            )
+
+        yield from journal_dict["EnounterList"]
+
+    def _chunk_reading_(self, file):
+        """
+        This function should only be used by iter_encounters.
+        Use at your own risk.
+
+        file (file object): save file opened for binary reading
+
+        Reads the save file a chunk at a time, decompressing it if needed.
+        A header, if any, is left out and its checksum checked at the end.
+
+        Yields the save data in chunks (bytes)
+        """
+
+        save_data = file.read(self.header_size)
+        save_header = self.parse_save_header(save_data)
+
+        checksum = None
+        if save_header is not None:
+            checksum = 0
+            save_data = file.read(SaveCompression.chunk_size)
+
+        compression = SaveCompression.detect(save_data)
+        if compression == "none":
+            decompressor = None
+        else:
+            decompressor = SaveCompression.make_decompressor(compression)
+
+        while save_data:
+            if checksum is not None:
+                checksum = zlib.crc32(save_data, checksum)
+            if decompressor is not None:
+                save_data = decompressor.decompress(save_data)
+            if save_data:
+                yield save_data
+            save_data = file.read(SaveCompression.chunk_size)
+
+        assert checksum is None or checksum == save_header["checksum"], \
+            "save file does not match its header checksum"
+        assert decompressor is None or decompressor.eof, \
+            "compressed save data is incomplete"
+
+    def load_save_file_as_text(self, save_file: str) -> str:
+        """
+        Get the text info in a save file on disk,
+        including any changes in its journal.
+        Binary save files are converted to the usual JSON text.
+        The header of a save file, if any, is checked and left out.
+        Compressed save files are decompressed.
+        Forks include the encounters they share.
+        """
+        assert isinstance(save_file, str)
+
+        save_file = self.save_path + "/" + save_file + self.save_extension
+        journal_file = save_file + self.journal_extension
+
+        with open(save_file, "rb") as file:
+            save_data = self.strip_save_header(file.read())
+
+        compression = SaveCompression.detect(save_data)
+        if compression != "none":
+            save_data = b"".join(
+                SaveCompression.iter_decompressed(
+                    save_data=save_data,
+                    compression=compression
+                )
+            )
+
+        if BinaryCodec.is_binary(save_data):
+            save_dict = BinaryCodec.decode(save_data)
+        else:
+            save_text = str(save_data, "utf-8")
+            # only parsed to look for a fork when the text mentions one
+            if not os.path.exists(journal_file) and '"ForkOf"' not in save_text:
+                return save_text
+            save_dict = json.loads(save_text)
+
+        save_dict = self.resolve_fork(save_dict)
+
+        # a journal left behind is replayed, whether journaling or not
+        if os.path.exists(journal_file):
+            self.replay_journal(save_dict=save_dict, journal_file=journal_file)
+
+        return json.dumps(save_dict, indent=2, sort_keys=True)
+
+    @classmethod
+    def parse_save_data(cls, save_data) -> dict:
+        """
+        save_data (bytes-like): contents of a save file
+
+        Decodes the save straight from the buffer,
+        with a header, if any, checked and left out.
+        JSON saves are parsed a chunk at a time, decompressed if needed,
+        compressed binary saves are decompressed whole.
+
+        Returns the contents of the save (dict)
+        """
+
+        save_data = cls.strip_save_header(save_data)
+
+        compression = SaveCompression.detect(save_data)
+        if compression != "none":
+            save_chunks = SaveCompression.iter_decompressed(
+                save_data=save_data,
+                compression=compression
+            )
+            first_chunk = next(save_chunks, b"")
+            if BinaryCodec.is_binary(first_chunk):
+                return BinaryCodec.decode(first_chunk + b"".join(save_chunks))
+            return StreamingJSON.parse_chunks(
+                itertools.chain((first_chunk,), save_chunks)
+            )
+
+        if BinaryCodec.is_binary(save_data):
+            return BinaryCodec.decode(save_data)
+
+        # parsed a chunk at a time straight from the buffer,
+        # so the save text is never decoded in full next to it
+        save_data = memoryview(save_data)
+        return StreamingJSON.parse_chunks(
+            bytes(save_data[offset:offset + SaveCompression.chunk_size])
+            for offset in range(0, len(save_data), SaveCompression.chunk_size)
+        )
+
+    def load_save_file(self, save_file: str) -> dict:
+        """
+        Get the contents of a save file on disk,
+        including any changes in its journal.
+        """
+        assert isinstance(save_file, str)
+
+        return self.read_save_file(
+            file_name=self.save_path + "/" + save_file + self.save_extension
+        )
+
+    def read_save_file(self, file_name: str, journal_size: int = None) -> dict:
+        """
+        file_name (str): path name of a save file
+        journal_size (int):
+            bytes of the journal of the save file to replay, if any,
+            all of it when left out and none of it at 0
+
+        The save file is mapped into memory and parsed from the mapping,
+        so no copy of the whole file is read in next to the parsed save.
+        The mapping is released once parsing is done.
+
+        Returns the contents of the save file (dict)
+        """
+
+        assert isinstance(file_name, str)
+        assert journal_size is None or isinstance(journal_size, int)
+
+        save_file = file_name
+        journal_file = save_file + self.journal_extension
+
+        with open(save_file, "rb") as file:
+            # empty files cannot be mapped
+            if os.fstat(file.fileno()).st_size:
+                save_data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                save_data = b""
+
+        try:
+            save_dict = self.parse_save_data(save_data)
+        finally:
+            if isinstance(save_data, mmap.mmap):
+                try:
+                    save_data.close()
+                except BufferError:
+                    # a failed parse may still hold views into the mapping,
+                    # it is released along with those instead
+                    pass
+
+        # journal records count from the start of the shared encounters
+        save_dict = self.resolve_fork(save_dict)
+
+        if journal_size != 0 and os.path.exists(journal_file):
+            self.replay_journal(
+                save_dict=save_dict,
+                journal_file=journal_file,
+                journal_size=journal_size
+            )
 
-        return save_text
+        return save_dict
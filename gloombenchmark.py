@@ -0,0 +1,929 @@
+from gloombackend import Backend, BackendMemory, Storage
+from gloomdatabase import BackendSQLite
+from gloomformat import BinaryCodec
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from gloommodel import (
+    encounter_registry,
+    CityEvent,
+    EditHistory,
+    Donation,
+    GridLocation,
+    ItemDesign,
+    Quest,
+    RoadEvent,
+    Scenario,
+    Treasure,
+    UnlockGraph,
+    diff_encounters
+)
+from gloomview import UserInterfaceMain, UserInterfaceSave
+
+
+def sample_campaign(encounter_count: int) -> list:
+    """
+    encounter_count (int): number of encounters in the campaign
+
+    Returns a list of Encounters resembling a long running campaign
+    """
+
+    assert isinstance(encounter_count, int)
+
+    encounter_list = []
+
+    for i in range(encounter_count):
+        kind = i % 6
+        if kind == 0:
+            encounter_list.append(
+                Scenario(
+                    identifier=i % 95 + 1,
+                    name="Black Barrow",
+                    gridLocation=GridLocation(chr(65 + i % 15), i % 18 + 1),
+                    succes=i % 4 != 0,
+                    unlockables=[]
+                )
+            )
+            encounter_list[-1].unlockables.append(
+                ItemDesign(identifier=i % 150 + 1, name="Sharp Arrow")
+            )
+        elif kind == 1:
+            encounter_list.append(CityEvent(identifier=i % 80, choice="A"))
+        elif kind == 2:
+            encounter_list.append(RoadEvent(identifier=i % 70, choice="B"))
+        elif kind == 3:
+            encounter_list.append(Donation(identifier=i // 6 + 1))
+        elif kind == 4:
+            encounter_list.append(Treasure(identifier=i % 90 + 1))
+        else:
+            encounter_list.append(
+                Quest(identifier=i % 30 + 510, name="Kill Enemies")
+            )
+
+    return encounter_list
+
+
+def timed(function: callable, repeat: int = 3) -> float:
+    """
+    function (callable): function to time, called without arguments
+    repeat (int): number of timed calls
+
+    Returns the fastest run time of function in seconds (float)
+    """
+
+    best = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+
+    return best
+
+
+def benchmark_save_data(encounter_counts: tuple = (10000, 100000)):
+    """
+    encounter_counts (tuple of int): campaign sizes to benchmark
+
+    Compares UserInterfaceSave.get_save_data with the former
+    toJSON -> json.loads -> json.dumps round trip per encounter.
+    """
+
+    print("get_save_data: round trip vs single pass")
+
+    for encounter_count in encounter_counts:
+        save_interface = UserInterfaceSave(
+            save_file_name="benchmark",
+            encounter_list=sample_campaign(encounter_count)
+        )
+
+        def round_trip():
+            encounters_as_dicts = [
+                json.loads(
+                    json.dumps(
+                        encounter,
+                        default=lambda o: {
+                            "type": type(o).__name__,
+                            "data": {
+                                field: getattr(o, field)
+                                for field in o.json_fields
+                            }
+                        },
+                        indent=2,
+                        sort_keys=True
+                    )
+                )
+                for encounter in save_interface.encounter_list
+            ]
+            return json.dumps(
+                {"EnounterList": encounters_as_dicts},
+                indent=2,
+                sort_keys=True
+            )
+
+        def single_pass():
+            return "".join(save_interface.get_save_data()[1])
+
+        assert round_trip() == single_pass()
+
+        round_trip_time = timed(round_trip)
+        single_pass_time = timed(single_pass)
+
+        print(
+            f"{encounter_count:>7} encounters: "
+            f"{round_trip_time:.3f}s -> {single_pass_time:.3f}s "
+            f"({round_trip_time / single_pass_time:.1f}x)"
+        )
+
+
+def benchmark_save_format(encounter_counts: tuple = (10000, 100000)):
+    """
+    encounter_counts (tuple of int): campaign sizes to benchmark
+
+    Compares size and decoding time of JSON and binary save files.
+    """
+
+    print("save format: json vs binary")
+
+    for encounter_count in encounter_counts:
+        save_interface = UserInterfaceSave(
+            save_file_name="benchmark",
+            encounter_list=sample_campaign(encounter_count)
+        )
+        save_text = "".join(save_interface.get_save_data()[1])
+        save_data = BinaryCodec.encode(json.loads(save_text))
+
+        assert BinaryCodec.decode(save_data) == json.loads(save_text)
+
+        json_size = len(save_text.encode("utf-8"))
+        json_time = timed(lambda: json.loads(save_text))
+        binary_time = timed(lambda: BinaryCodec.decode(save_data))
+
+        print(
+            f"{encounter_count:>7} encounters: "
+            f"{json_size / 1024:.0f} KiB -> {len(save_data) / 1024:.0f} KiB "
+            f"({json_size / len(save_data):.1f}x smaller), "
+            f"decode {json_time:.3f}s -> {binary_time:.3f}s"
+        )
+
+
+def benchmark_load_save(encounter_counts: tuple = (10000, 100000)):
+    """
+    encounter_counts (tuple of int): campaign sizes to benchmark
+
+    Compares the time until the save menu can be shown
+    when building every Encounter on load with building them lazily.
+    """
+
+    print("load save: eager vs lazy")
+
+    for encounter_count in encounter_counts:
+        save_text = "".join(UserInterfaceSave(
+            save_file_name="benchmark",
+            encounter_list=sample_campaign(encounter_count)
+        ).get_save_data()[1])
+        main_interface = UserInterfaceMain(list_saves=["benchmark"])
+
+        def eager():
+            return [
+                encounter_registry.get_type(encounter_as_dict["type"])(
+                    fullDict=encounter_as_dict
+                )
+                for encounter_as_dict in json.loads(save_text)["EnounterList"]
+            ]
+
+        def lazy():
+            main_interface.prepare_save_interface(
+                save_file="benchmark",
+                save_text=save_text
+            )
+
+        eager_time = timed(eager)
+        lazy_time = timed(lazy)
+
+        print(
+            f"{encounter_count:>7} encounters: "
+            f"{eager_time:.3f}s -> {lazy_time:.3f}s "
+            f"({eager_time / lazy_time:.1f}x)"
+        )
+
+
+def benchmark_memory(encounter_count: int = 100000):
+    """
+    encounter_count (int): campaign size to benchmark
+
+    Reports the memory taken by a fully loaded campaign, using tracemalloc.
+    """
+
+    print("memory of loaded encounters")
+
+    encounters_as_dicts = [
+        encounter.toDict() for encounter in sample_campaign(encounter_count)
+    ]
+
+    tracemalloc.start()
+    start_size = tracemalloc.get_traced_memory()[0]
+
+    encounter_list = [
+        encounter_registry.get_type(encounter_as_dict["type"])(
+            fullDict=encounter_as_dict
+        )
+        for encounter_as_dict in encounters_as_dicts
+    ]
+
+    loaded_size = tracemalloc.get_traced_memory()[0] - start_size
+    tracemalloc.stop()
+
+    print(
+        f"{len(encounter_list):>7} encounters: "
+        f"{loaded_size / 2 ** 20:.1f} MiB "
+        f"({loaded_size / len(encounter_list):.0f} bytes per encounter)"
+    )
+
+
+def benchmark_save_summary(encounter_counts: tuple = (10000, 100000)):
+    """
+    encounter_counts (tuple of int): campaign sizes to benchmark
+
+    Compares summarizing a save by loading all of it
+    with reading only its header.
+    """
+
+    print("save summary: full load vs header")
+
+    backend = Backend(header=True)
+
+    for encounter_count in encounter_counts:
+        save_interface = UserInterfaceSave(
+            save_file_name="benchmark",
+            encounter_list=sample_campaign(encounter_count)
+        )
+        save_file, save_info, save_options = save_interface.get_save_data()
+        backend.save_to_file(
+            save_file=save_file,
+            save_info=save_info,
+            **save_options
+        )
+
+        def full_load():
+            return backend.summarize_save_text(
+                backend.load_save_file_as_text(save_file=save_file)
+            )
+
+        def header():
+            return backend.read_save_header(save_file=save_file)
+
+        assert full_load()["types"] == header()["types"]
+
+        full_load_time = timed(full_load)
+        header_time = timed(header)
+
+        print(
+            f"{encounter_count:>7} encounters: "
+            f"{full_load_time:.3f}s -> {header_time * 1000:.3f}ms "
+            f"({full_load_time / header_time:.0f}x)"
+        )
+
+        file_name = backend.save_path + "/" + save_file + backend.save_extension
+        for extension in ("", backend.backup_extension):
+            if os.path.exists(file_name + extension):
+                os.remove(file_name + extension)
+
+
+def benchmark_load_memory(encounter_count: int = 100000):
+    """
+    encounter_count (int): campaign size to benchmark
+
+    Compares the peak memory of loading a save as text and parsing it
+    with parsing it from a mapped save file, using tracemalloc.
+    """
+
+    print("load memory: text vs mapped")
+
+    save_file, save_info, save_options = UserInterfaceSave(
+        save_file_name="benchmark",
+        encounter_list=sample_campaign(encounter_count)
+    ).get_save_data()
+    save_info = "".join(save_info)
+
+    for save_format in Backend.save_formats:
+        backend = Backend(save_format=save_format)
+        backend.save_to_file(save_file=save_file, save_info=save_info)
+
+        peaks = []
+        for load in (
+            lambda: json.loads(backend.load_save_file_as_text(save_file=save_file)),
+            lambda: backend.load_save_file(save_file=save_file)
+        ):
+            tracemalloc.start()
+            load()
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        print(
+            f"{encounter_count:>7} encounters, {save_format:>6}: "
+            f"{peaks[0] / 2 ** 20:.1f} MiB -> {peaks[1] / 2 ** 20:.1f} MiB peak"
+        )
+
+        os.remove(backend.save_path + "/" + save_file + backend.save_extension)
+
+
+def benchmark_save_memory(encounter_counts: tuple = (10000, 100000)):
+    """
+    encounter_counts (tuple of int): campaign sizes to benchmark
+
+    Compares the peak memory of saving a campaign as one string
+    with streaming it in chunks, using tracemalloc.
+    """
+
+    print("save memory: whole text vs streamed")
+
+    backend = Backend()
+
+    for encounter_count in encounter_counts:
+        save_interface = UserInterfaceSave(
+            save_file_name="benchmark",
+            encounter_list=sample_campaign(encounter_count)
+        )
+        file_name = backend.save_path + "/benchmark" + backend.save_extension
+
+        peaks = []
+        for get_save_info in (
+            lambda: "".join(save_interface.get_save_data()[1]),
+            lambda: save_interface.get_save_data()[1]
+        ):
+            tracemalloc.start()
+            backend.save_to_file(save_file="benchmark", save_info=get_save_info())
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            os.remove(file_name)
+
+        print(
+            f"{encounter_count:>7} encounters: "
+            f"{peaks[0] / 2 ** 20:.1f} MiB -> {peaks[1] / 2 ** 20:.2f} MiB peak"
+        )
+
+
+def benchmark_durability(encounter_count: int = 1000, save_count: int = 50):
+    """
+    encounter_count (int): campaign size to benchmark
+    save_count (int): number of saves to time at every durability level
+
+    Reports the median latency of a full save at every durability level.
+    """
+
+    print("save latency per durability level")
+
+    save_info = "".join(UserInterfaceSave(
+        save_file_name="benchmark",
+        encounter_list=sample_campaign(encounter_count)
+    ).get_save_data()[1])
+
+    for durability in Backend.durability_levels:
+        backend = Backend(durability=durability)
+        file_name = backend.save_path + "/benchmark" + backend.save_extension
+
+        latencies = []
+        for _ in range(save_count):
+            start = time.perf_counter()
+            backend.save_to_file(save_file="benchmark", save_info=save_info)
+            latencies.append(time.perf_counter() - start)
+
+        print(
+            f"{encounter_count:>7} encounters, {durability:>18}: "
+            f"{statistics.median(latencies) * 1000:.2f}ms per save"
+        )
+
+        for extension in ("", backend.backup_extension):
+            os.remove(file_name + extension)
+
+
+def benchmark_compression(encounter_count: int = 100000):
+    """
+    encounter_count (int): campaign size to benchmark
+
+    Reports size, save time, load time and peak traced memory of loading
+    for every compression at its fastest, default and smallest level.
+    """
+
+    print("compression: size, save, load and load memory")
+
+    save_interface = UserInterfaceSave(
+        save_file_name="benchmark",
+        encounter_list=sample_campaign(encounter_count)
+    )
+
+    for compression in Backend.compressions:
+        for compression_level in ((None,) if compression == "none" else (1, None, 9)):
+            backend = Backend(
+                compression=compression,
+                compression_level=compression_level
+            )
+            file_name = backend.save_path + "/benchmark" + backend.save_extension
+
+            def save():
+                backend.save_to_file(
+                    save_file="benchmark",
+                    save_info=save_interface.get_save_data()[1]
+                )
+
+            save_time = timed(save, repeat=1)
+            load_time = timed(lambda: backend.load_save_file(save_file="benchmark"))
+
+            tracemalloc.start()
+            backend.load_save_file(save_file="benchmark")
+            load_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            print(
+                f"{encounter_count:>7} encounters, {compression:>4} "
+                f"level {'default' if compression_level is None else compression_level:>7}: "
+                f"{os.path.getsize(file_name) / 1024:.0f} KiB, "
+                f"save {save_time:.3f}s, load {load_time:.3f}s, "
+                f"{load_peak / 2 ** 20:.1f} MiB peak"
+            )
+
+            os.remove(file_name)
+
+
+def benchmark_sqlite(encounter_count: int = 100000):
+    """
+    encounter_count (int): campaign size to benchmark
+
+    Compares save files with the SQLite database for adding an encounter
+    to a long campaign and for looking up encounters in it.
+    """
+
+    print("save file vs sqlite: add an encounter, find a scenario")
+
+    save_interface = UserInterfaceSave(
+        save_file_name="benchmark",
+        encounter_list=sample_campaign(encounter_count)
+    )
+    save_file, save_info, save_options = save_interface.get_save_data()
+    save_info = "".join(save_info)
+    save_records = [save_interface.get_save_record(index=encounter_count - 1)]
+
+    backend = Backend()
+    database = BackendSQLite()
+
+    for storage in (backend, database):
+        storage.save_to_file(save_file=save_file, save_info=save_info)
+
+    file_add_time = timed(
+        lambda: backend.save_to_file(save_file=save_file, save_info=save_info)
+    )
+    database_add_time = timed(
+        lambda: database.save_to_file(
+            save_file=save_file,
+            save_info=save_info,
+            save_records=save_records
+        )
+    )
+
+    def file_find():
+        return [
+            encounter_as_dict
+            for encounter_as_dict in backend.load_save_file(save_file=save_file)["EnounterList"]
+            if encounter_as_dict["type"] == "Scenario"
+            and encounter_as_dict["data"]["identifier"] == 37
+        ]
+
+    def database_find():
+        return [
+            encounter_as_dict for _, encounter_as_dict in database.query(
+                save_file=save_file,
+                encounter_type="Scenario",
+                identifier=37
+            )
+        ]
+
+    assert file_find() == database_find()
+
+    file_find_time = timed(file_find)
+    database_find_time = timed(database_find)
+
+    print(
+        f"{encounter_count:>7} encounters: "
+        f"add {file_add_time:.3f}s -> {database_add_time * 1000:.2f}ms, "
+        f"find {file_find_time:.3f}s -> {database_find_time * 1000:.2f}ms"
+    )
+
+    file_name = backend.save_path + "/" + save_file + backend.save_extension
+    for extension in ("", backend.backup_extension):
+        os.remove(file_name + extension)
+    os.remove(database.database_name)
+
+
+def benchmark_storage(encounter_count: int = 10000, added_count: int = 100):
+    """
+    encounter_count (int): campaign size to start from
+    added_count (int): number of encounters to log in the session
+
+    Times a logging session against every kind of storage,
+    the in memory backend showing the cost without disk I/O.
+    """
+
+    print("logging session per storage")
+
+    storages = {
+        "memory": BackendMemory(),
+        "file": Backend(),
+        "file, journal": Backend(journal=True),
+        "sqlite": BackendSQLite()
+    }
+
+    for storage_name, storage in storages.items():
+        save_interface = UserInterfaceSave(
+            save_file_name="benchmark",
+            encounter_list=sample_campaign(encounter_count)
+        )
+        save_file, save_info, save_options = save_interface.get_save_data()
+        storage.save_to_file(save_file=save_file, save_info=save_info, **save_options)
+
+        def session():
+            # what add_encounter_to_save does once the user answered
+            for encounter in sample_campaign(added_count):
+                save_file, save_info, save_options = save_interface.append_encounter(
+                    new_encounter=encounter
+                )
+                storage.save_to_file(
+                    save_file=save_file,
+                    save_info=save_info,
+                    **save_options
+                )
+
+        session_time = timed(session, repeat=1)
+
+        print(
+            f"{encounter_count:>7} encounters, {storage_name:>13}: "
+            f"{session_time / added_count * 1000:.2f}ms per logged encounter"
+        )
+
+    for storage in storages.values():
+        if isinstance(storage, Backend):
+            for save_file in os.listdir(storage.save_path):
+                if save_file.startswith("benchmark"):
+                    os.remove(storage.save_path + "/" + save_file)
+    os.remove(storages["sqlite"].database_name)
+
+
+def benchmark_history(encounter_count: int = 10000, generation_count: int = 20):
+    """
+    encounter_count (int): campaign size to benchmark
+    generation_count (int): number of backup generations to keep
+
+    Logs one encounter per save and reports the disk size of all
+    generations as deltas next to keeping them as full copies,
+    along with the save time without history and with history,
+    with and without save records,
+    and the time to restore the oldest generation.
+    """
+
+    print("backup history: size, save and restore")
+
+    for backup_generations, with_records in (
+        (1, True),
+        (generation_count, True),
+        (generation_count, False)
+    ):
+        backend = Backend(backup_generations=backup_generations)
+        file_name = backend.save_path + "/benchmark" + backend.save_extension
+
+        save_interface = UserInterfaceSave(
+            save_file_name="benchmark",
+            encounter_list=sample_campaign(encounter_count)
+        )
+        added_list = sample_campaign(generation_count + 1)
+
+        save_times = []
+        for encounter in added_list:
+            save_file, save_info, save_options = save_interface.append_encounter(
+                new_encounter=encounter
+            )
+            if not with_records:
+                del save_options["save_records"]
+            start = time.perf_counter()
+            backend.save_to_file(save_file=save_file, save_info=save_info, **save_options)
+            save_times.append(time.perf_counter() - start)
+
+        records_name = "with records" if with_records else "without records"
+        print(
+            f"{encounter_count:>7} encounters, {backup_generations:>2} generations, "
+            f"{records_name:>15}: "
+            f"{statistics.median(save_times[2:]) * 1000:.1f}ms per save"
+        )
+
+        if backup_generations == 1:
+            for extension in ("", backend.backup_extension):
+                os.remove(file_name + extension)
+
+    restore_time = timed(lambda: backend.load_backup(
+        save_file="benchmark",
+        generation=generation_count
+    ))
+
+    history_size = os.path.getsize(file_name + backend.history_extension)
+    copies_size = os.path.getsize(file_name) * generation_count
+
+    print(
+        f"{encounter_count:>7} encounters, {generation_count} generations: "
+        f"{history_size / 1024:.1f}KiB of deltas, "
+        f"{copies_size / 1024:.1f}KiB as full copies, "
+        f"{restore_time * 1000:.1f}ms to restore the oldest"
+    )
+
+    for extension in ("", backend.backup_extension, backend.history_extension):
+        os.remove(file_name + extension)
+
+
+def benchmark_undo(encounter_count: int = 100000, state_count: int = 500):
+    """
+    encounter_count (int): campaign size to benchmark
+    state_count (int): number of undo states to keep
+
+    Reports the memory taken by the undo states of a campaign,
+    kept as versions sharing their encounters and as list copies,
+    along with the time to set up the edit history of a campaign.
+    """
+
+    print("memory of undo states")
+
+    encounters_as_dicts = [
+        encounter.toDict() for encounter in sample_campaign(encounter_count)
+    ]
+    added_dicts = [
+        encounter.toDict() for encounter in sample_campaign(state_count)
+    ]
+
+    setup_time = timed(lambda: EditHistory(encounters_as_dicts))
+
+    tracemalloc.start()
+    start_size = tracemalloc.get_traced_memory()[0]
+
+    edit_history = EditHistory(encounters_as_dicts)
+    first_size = tracemalloc.get_traced_memory()[0] - start_size
+    for encounter_as_dict in added_dicts:
+        edit_history.append(encounter_as_dict)
+
+    versions_size = tracemalloc.get_traced_memory()[0] - start_size - first_size
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    start_size = tracemalloc.get_traced_memory()[0]
+
+    list_copies = [list(encounters_as_dicts)]
+    for encounter_as_dict in added_dicts:
+        list_copies.append(list_copies[-1] + [encounter_as_dict])
+
+    copies_size = tracemalloc.get_traced_memory()[0] - start_size
+    tracemalloc.stop()
+
+    print(
+        f"{encounter_count:>7} encounters: edit history set up in "
+        f"{setup_time * 1000:.1f}ms, taking {first_size / 2 ** 20:.2f} MiB"
+    )
+    print(
+        f"{encounter_count:>7} encounters, {state_count} states: "
+        f"{versions_size / 2 ** 20:.2f} MiB as versions, "
+        f"{copies_size / 2 ** 20:.1f} MiB as list copies"
+    )
+
+
+def benchmark_fork(encounter_count: int = 100000):
+    """
+    encounter_count (int): campaign size to fork
+
+    Reports the time and disk size of forking a campaign,
+    next to copying it, and the time to load the fork and the campaign.
+    """
+
+    print("forking: fork, size and load")
+
+    backend = Backend()
+    save_interface = UserInterfaceSave(
+        save_file_name="benchmark",
+        encounter_list=sample_campaign(encounter_count)
+    )
+    save_file, save_info, save_options = save_interface.get_save_data()
+    backend.save_to_file(save_file=save_file, save_info=save_info, **save_options)
+
+    start = time.perf_counter()
+    backend.fork_save(save_file="benchmark", fork_file="benchmark_fork")
+    fork_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    Storage.fork_save(backend, save_file="benchmark", fork_file="benchmark_copy")
+    copy_time = time.perf_counter() - start
+
+    file_sizes = {
+        save_file: os.path.getsize(backend.save_path + "/" + save_file + backend.save_extension)
+        for save_file in ("benchmark", "benchmark_fork", "benchmark_copy")
+    }
+
+    load_time = timed(lambda: backend.load_save_file(save_file="benchmark"))
+    fork_load_time = timed(lambda: backend.load_save_file(save_file="benchmark_fork"))
+
+    print(
+        f"{encounter_count:>7} encounters: fork in {fork_time:.2f}s taking "
+        f"{file_sizes['benchmark_fork'] / 1024:.1f}KiB, copy in {copy_time:.2f}s "
+        f"taking {file_sizes['benchmark_copy'] / 1024:.1f}KiB"
+    )
+    print(
+        f"{encounter_count:>7} encounters: load in {load_time:.2f}s, "
+        f"fork load in {fork_load_time:.2f}s"
+    )
+
+    for save_file in os.listdir(backend.save_path):
+        if save_file.startswith("benchmark"):
+            os.remove(backend.save_path + "/" + save_file)
+
+
+def benchmark_diff(encounter_count: int = 100000, changed_count: int = 100):
+    """
+    encounter_count (int): campaign size to compare
+    changed_count (int): number of encounters changed in the other campaign
+
+    Reports the time and peak memory of comparing two saved campaigns
+    streamed from disk, next to loading both and comparing the lists,
+    using tracemalloc.
+    """
+
+    print("save diff: loaded vs streamed")
+
+    backend = Backend()
+    encounter_list = [
+        encounter.toDict() for encounter in sample_campaign(encounter_count)
+    ]
+    other_list = [dict(encounter_as_dict) for encounter_as_dict in encounter_list]
+    for i in range(0, encounter_count, encounter_count // changed_count):
+        other_list[i] = CityEvent(identifier=i, choice="B").toDict()
+
+    for save_file, save_list in (
+        ("benchmark", encounter_list),
+        ("benchmark_other", other_list)
+    ):
+        backend.save_to_file(
+            save_file=save_file,
+            save_info=json.dumps({"EnounterList": save_list}, indent=2, sort_keys=True)
+        )
+
+    del encounter_list, other_list
+
+    for diff_name, diff in (
+        (
+            "loaded",
+            lambda: diff_encounters(
+                backend.load_save_file(save_file="benchmark")["EnounterList"],
+                backend.load_save_file(save_file="benchmark_other")["EnounterList"]
+            )
+        ),
+        (
+            "streamed",
+            lambda: backend.diff_saves(save_file="benchmark", other_file="benchmark_other")
+        )
+    ):
+        diff_time = timed(diff)
+        tracemalloc.start()
+        differences = diff()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(
+            f"{encounter_count:>7} encounters, {diff_name:>8}: {len(differences)} "
+            f"differences in {diff_time:.2f}s, {peak / 2 ** 20:.1f} MiB peak"
+        )
+
+    for save_file in os.listdir(backend.save_path):
+        if save_file.startswith("benchmark"):
+            os.remove(backend.save_path + "/" + save_file)
+
+
+def benchmark_merge(encounter_counts: tuple = (10000, 100000), changed_count: int = 100):
+    """
+    encounter_counts (tuple of int): campaign sizes to merge
+    changed_count (int): number of encounters changed and added by either save
+
+    Reports the time of merging two saved campaigns from their common ancestor,
+    to show it grows about linearly with the campaign size.
+    """
+
+    print("save merge: time by campaign size")
+
+    backend = Backend()
+
+    for encounter_count in encounter_counts:
+        encounter_list = [
+            encounter.toDict() for encounter in sample_campaign(encounter_count)
+        ]
+        added_list = [
+            encounter.toDict() for encounter in sample_campaign(changed_count)
+        ]
+        other_list = list(encounter_list)
+        for i in range(0, encounter_count, encounter_count // changed_count):
+            other_list[i] = CityEvent(identifier=i, choice="B").toDict()
+
+        for save_file, save_list in (
+            ("benchmark", encounter_list),
+            ("benchmark_ours", encounter_list + added_list),
+            ("benchmark_theirs", other_list + added_list[::-1])
+        ):
+            backend.save_to_file(
+                save_file=save_file,
+                save_info=json.dumps({"EnounterList": save_list}, indent=2, sort_keys=True)
+            )
+
+        merges = []
+        merge_time = timed(
+            lambda: merges.append(backend.merge_saves(
+                save_file="benchmark_ours",
+                other_file="benchmark_theirs",
+                ancestor={"save": "benchmark"}
+            ))
+        )
+        save_dict, conflicts = merges[-1]
+
+        print(
+            f"{encounter_count:>7} encounters: merged to {len(save_dict['EnounterList'])} "
+            f"encounters with {len(conflicts)} conflicts in {merge_time:.2f}s, "
+            f"{merge_time / encounter_count * 1e6:.1f}us per encounter"
+        )
+
+    for save_file in os.listdir(backend.save_path):
+        if save_file.startswith("benchmark"):
+            os.remove(backend.save_path + "/" + save_file)
+
+
+def benchmark_unlocks(encounter_count: int = 100000, lookup_count: int = 1000):
+    """
+    encounter_count (int): campaign size to benchmark
+    lookup_count (int): number of lookups of the available item designs
+
+    Compares finding the unlocked encounters not completed yet
+    by walking every encounter and its unlockables
+    with looking them up in an unlock graph kept up to date.
+    """
+
+    print("available encounters: walk vs unlock graph")
+
+    encounter_dicts = [
+        encounter.toDict() for encounter in sample_campaign(encounter_count)
+    ]
+
+    def walk_available(type_name: str) -> set:
+        unlocked = set()
+        completed = set()
+        for encounter_as_dict in encounter_dicts:
+            if UnlockGraph.is_completion(encounter_as_dict=encounter_as_dict):
+                completed.add((encounter_as_dict["type"], encounter_as_dict["data"]["identifier"]))
+            unlocked.update(UnlockGraph.iter_unlockables(encounter_as_dict=encounter_as_dict))
+        return {
+            identifier for unlocked_type, identifier in unlocked - completed
+            if unlocked_type == type_name
+        }
+
+    start = time.perf_counter()
+    unlock_graph = UnlockGraph(encounter_dicts)
+    build_time = time.perf_counter() - start
+
+    add_time = timed(
+        lambda: (unlock_graph.add(encounter_dicts[0]), unlock_graph.remove()),
+        repeat=lookup_count
+    )
+    walk_time = timed(lambda: walk_available("ItemDesign"), repeat=1)
+    lookup_time = timed(lambda: set(unlock_graph.get_available("ItemDesign")), repeat=lookup_count)
+
+    assert walk_available("ItemDesign") == set(unlock_graph.get_available("ItemDesign"))
+
+    print(
+        f"{encounter_count:>7} encounters: graph built in {build_time:.2f}s, "
+        f"{add_time * 1e6:.1f}us per added and removed encounter"
+    )
+    print(
+        f"{encounter_count:>7} encounters: walk in {walk_time * 1e3:.1f}ms, "
+        f"lookup in {lookup_time * 1e6:.1f}us"
+    )
+
+
+if __name__ == "__main__":
+    benchmark_save_data()
+    benchmark_save_format()
+    benchmark_load_save()
+    benchmark_memory()
+    benchmark_save_summary()
+    benchmark_load_memory()
+    benchmark_save_memory()
+    benchmark_durability()
+    benchmark_compression()
+    benchmark_sqlite()
+    benchmark_storage()
+    benchmark_history()
+    benchmark_undo()
+    benchmark_fork()
+    benchmark_diff()
+    benchmark_merge()
+    benchmark_unlocks()
@@ -1,5 +1,9 @@
-from gloombackend import Backend
+from gloombackend import Backend, Storage
 from gloomview import UserInterfaceMain
+import atexit
+import functools
+import json
+import threading
 
 
 def error_exit_gloomlog():
@@ -12,20 +16,200 @@ def error_exit_gloomlog():
     exit()
 
 
+class SaveWriter:
+    """
+    Writes saves through a backend on a background thread
+
+    Saves to the same file that pile up while another save is written
+    are merged into one write of the latest save info,
+    with their save records joined in order.
+    Errors are kept until the owner asks for them.
+    """
+
+    def __init__(self, backend: Storage):
+        """
+        backend (Storage): backend to write the saves with
+        """
+
+        self.backend = backend
+
+        # guards everything below and signals changes to it
+        self.condition = threading.Condition()
+        # save_to_file arguments by save file, in order of arrival
+        self.pending_saves = {}
+        self.writing = False
+        self.closed = False
+        # (save file, exception) tuples of failed saves
+        self.save_errors = []
+
+        self.thread = threading.Thread(
+            target=self._save_looping_,
+            name="GloomLog save writer",
+            daemon=True
+        )
+        self.thread.start()
+
+        # exit() anywhere still waits for the pending saves
+        atexit.register(self.close)
+
+    def submit(self, save_file: str, save_info, **save_options):
+        """
+        save_file (str): base name of the save file to write
+        save_info (str or iterable of str): save info to write in the file
+        save_options: other arguments of Backend.save_to_file
+
+        Queues a save, merging it with a pending save to the same file.
+        """
+
+        assert isinstance(save_file, str)
+
+        save_arguments = dict(save_options, save_file=save_file, save_info=save_info)
+
+        with self.condition:
+            assert not self.closed
+
+            pending_save = self.pending_saves.pop(save_file, None)
+            if pending_save is not None:
+                save_arguments = self.merge_saves(
+                    pending_save=pending_save,
+                    save_arguments=save_arguments
+                )
+
+            self.pending_saves[save_file] = save_arguments
+            self.condition.notify_all()
+
+    @staticmethod
+    def merge_saves(pending_save: dict, save_arguments: dict) -> dict:
+        """
+        pending_save (dict): save_to_file arguments of a pending save
+        save_arguments (dict): save_to_file arguments of a newer save
+
+        The newer save info holds everything, so the older one is dropped.
+        Save records are only kept if both saves could be journaled.
+
+        Returns the save_to_file arguments of the merged save (dict)
+        """
+
+        save_arguments = dict(save_arguments)
+
+        if (
+            pending_save.get("save_records") is None
+            or save_arguments.get("save_records") is None
+        ):
+            save_arguments.pop("save_records", None)
+        else:
+            save_arguments["save_records"] = (
+                pending_save["save_records"] + save_arguments["save_records"]
+            )
+
+        return save_arguments
+
+    def flush(self):
+        """
+        Waits until every pending save is written
+        """
+
+        with self.condition:
+            while self.pending_saves or self.writing:
+                self.condition.wait()
+
+    def get_errors(self) -> list:
+        """
+        Returns and forgets the errors of failed saves,
+        as (save file, exception) tuples (list)
+        """
+
+        with self.condition:
+            save_errors = self.save_errors
+            self.save_errors = []
+
+        return save_errors
+
+    def close(self):
+        """
+        Writes every pending save and stops the background thread.
+        Closing twice is harmless.
+        """
+
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+        self.thread.join()
+        atexit.unregister(self.close)
+
+    def _save_looping_(self):
+        """
+        This function should only be used by the background thread.
+        Use at your own risk.
+
+        Writes pending saves one at a time, until closed and done.
+        """
+
+        while True:
+            with self.condition:
+                while not self.pending_saves and not self.closed:
+                    self.condition.wait()
+                if not self.pending_saves:
+                    return
+                save_file = next(iter(self.pending_saves))
+                save_arguments = self.pending_saves.pop(save_file)
+                self.writing = True
+
+            # BaseException, so even a save calling exit() is reported
+            # and never stops the thread with saves still pending
+            try:
+                self.backend.save_to_file(**save_arguments)
+            except BaseException as save_error:
+                with self.condition:
+                    self.save_errors.append((save_file, save_error))
+            finally:
+                with self.condition:
+                    self.writing = False
+                    self.condition.notify_all()
+
+
 class Controller:
 
-    def __init__(self):
-        self.backend = None
+    # write saves on a background thread, so logging never waits for the disk
+    save_asynchronously = False
+
+    def __init__(self, backend: Storage = None, save_asynchronously: bool = None):
+        """
+        backend (Storage):
+            where to keep the saves, save files in the save directory
+            when left as None
+        save_asynchronously (bool):
+            write saves on a background thread,
+            leave as None to use the class default
+        """
+
+        assert backend is None or isinstance(backend, Storage)
+
+        self.backend = backend
         self.interface = None
+        self.save_writer = None
+
+        if save_asynchronously is not None:
+            assert isinstance(save_asynchronously, bool)
+            self.save_asynchronously = save_asynchronously
 
     def run(self):
         """
         Call this command to boot up GloomLog
         """
 
-        self.backend = Backend()
+        if self.backend is None:
+            self.backend = Backend()
         saves_copy = self.backend.check_saves()
         self.interface = UserInterfaceMain(list_saves=saves_copy)
+        self.interface.save_catalog = self.backend.get_catalog()
+        self.interface.fork_save = self.fork_save
+        self.interface.diff_saves = self.diff_saves
+        self.interface.merge_saves = self.merge_saves
+
+        if self.save_asynchronously:
+            self.save_writer = SaveWriter(backend=self.backend)
 
         self.present_user_interface_main()
 
@@ -39,20 +223,173 @@ class Controller:
         hold = True
 
         while hold:
+            if self.save_writer is not None:
+                if self.interface.save_interface is None:
+                    # back in the main menu, after closing a save or to load one,
+                    # every save is written and listed
+                    self.save_writer.flush()
+                    self.update_save_list()
+                self.report_save_errors()
+
             hold = self.interface.present_interface()
             if type(hold) == tuple:
-                self.backend.save_to_file(save_file=hold[0], save_info=hold[1])
-                # slight overkill, but works well enough for a simple app as this
-                self.interface.list_saves = self.backend.check_saves()
+                # an optional third entry holds extra save options,
+                # such as the records to journal
+                save_options = hold[2] if len(hold) > 2 else {}
+                if self.save_writer is not None:
+                    self.save_writer.submit(
+                        save_file=hold[0],
+                        save_info=hold[1],
+                        **save_options
+                    )
+                else:
+                    self.backend.save_to_file(
+                        save_file=hold[0],
+                        save_info=hold[1],
+                        **save_options
+                    )
+                    # slight overkill, but works well enough for a simple app as this
+                    self.update_save_list()
             if type(hold) == str:
-                save_text = self.backend.load_save_file_as_text(save_file=hold)
+                save_dict = self.backend.load_save_file(save_file=hold)
                 self.interface.prepare_save_interface(
                     save_file=hold,
-                    save_text=save_text
+                    save_dict=save_dict
                 )
+            self.connect_backups()
+
+        if self.save_writer is not None:
+            self.save_writer.close()
+            self.report_save_errors()
 
         self.exit_gloomlog()
 
+    def update_save_list(self):
+        """
+        Passes the saves on disk and their summaries to the interface
+        """
+
+        self.interface.list_saves = self.backend.check_saves()
+        self.interface.save_catalog = self.backend.get_catalog()
+
+    def fork_save(self, save_file: str, fork_file: str):
+        """
+        save_file (str): name of the save to fork
+        fork_file (str): name of the new save
+
+        Forks a save once it is written and lists the fork
+        """
+
+        if self.save_writer is not None:
+            self.save_writer.flush()
+
+        self.backend.fork_save(save_file=save_file, fork_file=fork_file)
+        self.update_save_list()
+
+    def diff_saves(self, save_file: str, other_file: str) -> list:
+        """
+        save_file (str): name of the save to compare
+        other_file (str): name of the save to compare with
+
+        Returns the differences between the saves, once they are written (list)
+        """
+
+        if self.save_writer is not None:
+            self.save_writer.flush()
+
+        return self.backend.diff_saves(save_file=save_file, other_file=other_file)
+
+    def merge_saves(self, save_file: str, other_file: str, ancestor: dict = None) -> list:
+        """
+        save_file (str): name of our save
+        other_file (str): name of the save to merge into ours
+        ancestor (dict):
+            common ancestor of the saves, such as a backup generation,
+            the fork point the backend finds when left as None
+
+        Merges the other save into ours, once both are written,
+        and saves the result as ours
+
+        Returns the conflicts of the merge,
+        None if the saves have no common ancestor (list)
+        """
+
+        if self.save_writer is not None:
+            self.save_writer.flush()
+
+        if ancestor is None:
+            ancestor = self.backend.find_ancestor(save_file=save_file, other_file=other_file)
+        if ancestor is None:
+            return None
+
+        save_dict, conflicts = self.backend.merge_saves(
+            save_file=save_file,
+            other_file=other_file,
+            ancestor=ancestor
+        )
+
+        self.backend.save_to_file(
+            save_file=save_file,
+            save_info=json.dumps(save_dict, indent=2, sort_keys=True),
+            save_summary=self.backend.summarize_save_dict(save_dict)
+        )
+        self.update_save_list()
+
+        return conflicts
+
+    def connect_backups(self):
+        """
+        Lets a newly opened save interface inspect the backups of its save
+        """
+
+        save_interface = self.interface.save_interface
+
+        if save_interface is None or save_interface.load_backup is not None:
+            return
+
+        save_file = save_interface.save_file_name
+        save_interface.check_backups = functools.partial(
+            self.check_backups,
+            save_file=save_file
+        )
+        save_interface.load_backup = functools.partial(
+            self.load_backup,
+            save_file=save_file
+        )
+
+    def check_backups(self, save_file: str) -> int:
+        """
+        save_file (str): name of the save
+
+        Returns the number of backups of the save, once it is written (int)
+        """
+
+        if self.save_writer is not None:
+            self.save_writer.flush()
+
+        return self.backend.check_backups(save_file=save_file)
+
+    def load_backup(self, save_file: str, generation: int) -> dict:
+        """
+        save_file (str): name of the save
+        generation (int): which backup, 1 being the most recent
+
+        Returns the contents of the backup, once the save is written (dict)
+        """
+
+        if self.save_writer is not None:
+            self.save_writer.flush()
+
+        return self.backend.load_backup(save_file=save_file, generation=generation)
+
+    def report_save_errors(self):
+        """
+        Tells the user about saves that failed in the background
+        """
+
+        for save_file, save_error in self.save_writer.get_errors():
+            print(f"Saving {save_file} failed: {save_error}")
+
     @staticmethod
     def exit_gloomlog():
         """
@@ -0,0 +1,404 @@
+from contextlib import closing
+from gloombackend import Backend, Storage
+from gloomformat import StreamingJSON
+import json
+import os
+import sqlite3
+import time
+
+
+class BackendSQLite(Storage):
+    """
+    Keeps campaigns in a local SQLite database instead of save files
+
+    Offers the same methods as Backend to the Controller.
+    Every encounter is a row, indexed by type, identifier and grid location,
+    so a campaign can be queried without loading all of it.
+    Save records are applied as single row changes in one transaction.
+    """
+
+    save_path = Backend.save_path
+    database_file = "campaigns.sqlite3"
+
+    # mapped on the synchronous setting of SQLite
+    durability = "none"
+    durability_levels = Backend.durability_levels
+    synchronous_settings = {
+        "none": "OFF",
+        "fsync-file": "NORMAL",
+        "fsync-file-and-dir": "FULL"
+    }
+
+    # identifier has no declared type, so int and str identifiers stay apart
+    schema = (
+        """
+        CREATE TABLE IF NOT EXISTS campaigns (
+            campaign TEXT PRIMARY KEY,
+            mtime INTEGER NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS encounters (
+            campaign TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            type TEXT NOT NULL,
+            identifier,
+            grid_character TEXT,
+            grid_identifier INTEGER,
+            data TEXT NOT NULL,
+            PRIMARY KEY (campaign, position)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS encounters_by_type
+        ON encounters (campaign, type, identifier)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS encounters_by_identifier
+        ON encounters (campaign, identifier)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS encounters_by_grid_location
+        ON encounters (campaign, grid_character, grid_identifier)
+        """
+    )
+
+    def __init__(self, save_path: str = None, durability: str = None):
+        """
+        save_path (str):
+            directory of the database
+        durability ("none", "fsync-file" or "fsync-file-and-dir"):
+            what to sync to disk before a save counts as written
+
+        Leave a parameter as None to use the class default.
+        """
+
+        super().__init__()
+
+        if save_path is not None:
+            assert isinstance(save_path, str)
+            self.save_path = save_path
+
+        if durability is not None:
+            assert durability in self.durability_levels
+            self.durability = durability
+
+        self.database_name = self.save_path + "/" + self.database_file
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Opens the database, creating it and its tables if needed.
+        Every call gets its own connection,
+        so saves can be written from another thread.
+
+        Returns the connection (sqlite3.Connection)
+        """
+
+        if not os.path.exists(self.save_path):
+            os.mkdir(self.save_path)
+
+        connection = sqlite3.connect(self.database_name)
+        connection.execute(
+            "PRAGMA synchronous = " + self.synchronous_settings[self.durability]
+        )
+
+        with connection:
+            for statement in self.schema:
+                connection.execute(statement)
+
+        return connection
+
+    def check_saves(self) -> list:
+        """
+        Check for current campaigns in the database
+        """
+
+        if not os.path.exists(self.database_name):
+            return []
+
+        with closing(self.connect()) as connection:
+            return [
+                campaign for (campaign,) in connection.execute(
+                    "SELECT campaign FROM campaigns ORDER BY campaign"
+                )
+            ]
+
+    def get_catalog(self) -> dict:
+        """
+        Get the summary of every campaign in the database by campaign name.
+        Summaries hold the mtime, number of encounters, number per type
+        and last encounter of a campaign.
+        """
+
+        if not os.path.exists(self.database_name):
+            return {}
+
+        catalog = {}
+
+        with closing(self.connect()) as connection:
+            for campaign, mtime in connection.execute(
+                "SELECT campaign, mtime FROM campaigns"
+            ):
+                catalog[campaign] = dict(
+                    self.summarize_campaign(connection=connection, campaign=campaign),
+                    mtime=mtime,
+                    format="sqlite"
+                )
+
+        return catalog
+
+    @staticmethod
+    def summarize_campaign(connection: sqlite3.Connection, campaign: str) -> dict:
+        """
+        connection (sqlite3.Connection): open database
+        campaign (str): name of the campaign
+
+        Returns the number of encounters in the campaign, the number per type
+        and the type and identifier of the last one (dict)
+        """
+
+        encounter_types = dict(
+            connection.execute(
+                "SELECT type, count(*) FROM encounters WHERE campaign = ? GROUP BY type",
+                (campaign,)
+            )
+        )
+
+        last_row = connection.execute(
+            "SELECT type, identifier FROM encounters WHERE campaign = ? "
+            "ORDER BY position DESC LIMIT 1",
+            (campaign,)
+        ).fetchone()
+
+        if last_row is None:
+            last_encounter = None
+        else:
+            last_encounter = {"type": last_row[0], "identifier": last_row[1]}
+
+        return {
+            "encounters": sum(encounter_types.values()),
+            "types": encounter_types,
+            "last_encounter": last_encounter
+        }
+
+    @staticmethod
+    def encounter_row(campaign: str, position: int, encounter_as_dict: dict) -> tuple:
+        """
+        campaign (str): name of the campaign
+        position (int): position of the encounter in the campaign
+        encounter_as_dict (dict): dict representation of the encounter
+
+        Returns the values of the encounters table for the encounter (tuple)
+        """
+
+        encounter_data = encounter_as_dict["data"]
+        grid_location = encounter_data.get("gridLocation")
+
+        if isinstance(grid_location, dict):
+            grid_character = grid_location["data"]["character"]
+            grid_identifier = grid_location["data"]["identifier"]
+        else:
+            grid_character = None
+            grid_identifier = None
+
+        return (
+            campaign,
+            position,
+            encounter_as_dict["type"],
+            encounter_data.get("identifier"),
+            grid_character,
+            grid_identifier,
+            json.dumps(encounter_as_dict, sort_keys=True)
+        )
+
+    def save_to_file(
+        self,
+        save_file: str,
+        save_info,
+        save_records: list = None,
+        save_summary: dict = None
+    ):
+        """
+        save_file (str): name of the campaign to save
+        save_info (str or iterable of str):
+            save info of the whole campaign, whole or in chunks
+        save_records (list of str):
+            JSON records of the changes since the last save
+        save_summary (dict):
+            accepted for compatibility with Backend, the database keeps its own
+
+        With save records for a campaign already in the database,
+        only the changed rows are written and save_info is never encoded.
+        Otherwise all rows of the campaign are replaced.
+        Either way, the change is a single transaction.
+        """
+
+        assert isinstance(save_file, str)
+        assert isinstance(save_info, str) or hasattr(save_info, "__iter__")
+
+        with closing(self.connect()) as connection, connection:
+            known_campaign = connection.execute(
+                "SELECT 1 FROM campaigns WHERE campaign = ?",
+                (save_file,)
+            ).fetchone() is not None
+
+            if known_campaign and save_records is not None:
+                for save_record in save_records:
+                    self.apply_record(
+                        connection=connection,
+                        campaign=save_file,
+                        save_record=json.loads(save_record)
+                    )
+            else:
+                if isinstance(save_info, str):
+                    save_info = (save_info,)
+                save_dict = StreamingJSON.parse_chunks(
+                    text_chunk.encode("utf-8") for text_chunk in save_info
+                )
+                connection.execute(
+                    "DELETE FROM encounters WHERE campaign = ?",
+                    (save_file,)
+                )
+                connection.executemany(
+                    "INSERT INTO encounters VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        self.encounter_row(
+                            campaign=save_file,
+                            position=position,
+                            encounter_as_dict=encounter_as_dict
+                        )
+                        for position, encounter_as_dict
+                        in enumerate(save_dict["EnounterList"])
+                    )
+                )
+
+            connection.execute(
+                "INSERT OR REPLACE INTO campaigns VALUES (?, ?)",
+                (save_file, time.time_ns())
+            )
+
+    def apply_record(
+        self,
+        connection: sqlite3.Connection,
+        campaign: str,
+        save_record: dict
+    ):
+        """
+        connection (sqlite3.Connection): open database, within a transaction
+        campaign (str): name of the campaign
+        save_record (dict): index and encounter (or None) of a change
+
+        Cuts the campaign back to the index and inserts the encounter there,
+        the same way Storage.apply_save_record changes a parsed save.
+        """
+
+        connection.execute(
+            "DELETE FROM encounters WHERE campaign = ? AND position >= ?",
+            (campaign, save_record["index"])
+        )
+
+        if save_record["encounter"] is not None:
+            connection.execute(
+                "INSERT INTO encounters VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self.encounter_row(
+                    campaign=campaign,
+                    position=save_record["index"],
+                    encounter_as_dict=save_record["encounter"]
+                )
+            )
+
+    def load_save_file(self, save_file: str) -> dict:
+        """
+        Get the contents of a campaign in the database
+        """
+        assert isinstance(save_file, str)
+
+        with closing(self.connect()) as connection:
+            assert connection.execute(
+                "SELECT 1 FROM campaigns WHERE campaign = ?",
+                (save_file,)
+            ).fetchone() is not None, f"no campaign named {save_file}"
+
+            return {
+                "EnounterList": [
+                    json.loads(data) for (data,) in connection.execute(
+                        "SELECT data FROM encounters WHERE campaign = ? ORDER BY position",
+                        (save_file,)
+                    )
+                ]
+            }
+
+    def iter_encounters(self, save_file: str):
+        """
+        save_file (str): name of the campaign
+
+        Reads the rows of the campaign as they are needed,
+        instead of loading all of it.
+
+        Yields the dict representations of the encounters in the campaign, in order
+        """
+        assert isinstance(save_file, str)
+
+        with closing(self.connect()) as connection:
+            assert connection.execute(
+                "SELECT 1 FROM campaigns WHERE campaign = ?",
+                (save_file,)
+            ).fetchone() is not None, f"no campaign named {save_file}"
+
+            for (data,) in connection.execute(
+                "SELECT data FROM encounters WHERE campaign = ? ORDER BY position",
+                (save_file,)
+            ):
+                yield json.loads(data)
+
+    def query(
+        self,
+        save_file: str,
+        encounter_type: str = None,
+        identifier=None,
+        grid_location: tuple = None
+    ) -> list:
+        """
+        save_file (str): name of the campaign to query
+        encounter_type (str): type name of the encounters to find
+        identifier (int or str): identifier of the encounters to find
+        grid_location (tuple of str and int):
+            character and identifier of the grid location of the encounters
+
+        Finds encounters by any combination of the above,
+        through the indexes instead of loading the campaign.
+
+        Returns the positions and dicts of the matching encounters,
+        in campaign order (list of tuples)
+        """
+
+        assert isinstance(save_file, str)
+
+        conditions = ["campaign = ?"]
+        parameters = [save_file]
+
+        if encounter_type is not None:
+            conditions.append("type = ?")
+            parameters.append(encounter_type)
+
+        if identifier is not None:
+            conditions.append("identifier = ?")
+            parameters.append(identifier)
+
+        if grid_location is not None:
+            conditions.append("grid_character = ? AND grid_identifier = ?")
+            parameters.extend(grid_location)
+
+        with closing(self.connect()) as connection:
+            return [
+                (position, json.loads(data)) for position, data in connection.execute(
+                    "SELECT position, data FROM encounters WHERE "
+                    + " AND ".join(conditions)
+                    + " ORDER BY position",
+                    parameters
+                )
+            ]
+
+
+if __name__ == "__main__":
+    print("script contains only object definitions, no functional code on its own")
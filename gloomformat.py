@@ -0,0 +1,552 @@
+import codecs
+import json
+import lzma
+import re
+import struct
+import zlib
+
+
+class BinaryCodec:
+    """
+    Compact binary encoding of GloomLog save documents
+
+    Values are written as a one byte tag followed by their content.
+    Known field names and type names are written as small integers,
+    strings and containers are length prefixed
+    and GridLocations are packed into two bytes.
+
+    The tables below may only be extended at the end,
+    otherwise older binary saves can no longer be read.
+    """
+
+    magic = b"GLMB\x01"
+
+    keys = (
+        "EnounterList",
+        "type",
+        "data",
+        "identifier",
+        "unlockables",
+        "name",
+        "choice",
+        "succes",
+        "gridLocation",
+        "character",
+        "index",
+        "encounter"
+    )
+
+    type_names = (
+        "CityEvent",
+        "RoadEvent",
+        "Scenario",
+        "Donation",
+        "Treasure",
+        "Quest",
+        "AncientTechnology",
+        "Character",
+        "GlobalAchievement",
+        "PartyAchievement",
+        "ItemDesign",
+        "GridLocation"
+    )
+
+    tag_null = 0
+    tag_false = 1
+    tag_true = 2
+    tag_int = 3
+    tag_str = 4
+    tag_list = 5
+    tag_dict = 6
+    tag_object = 7
+    tag_grid = 8
+    tag_float = 9
+    tag_empty_str = 10
+
+    key_ids = {key: i + 1 for i, key in enumerate(keys)}
+    type_ids = {type_name: i + 1 for i, type_name in enumerate(type_names)}
+
+    @classmethod
+    def is_binary(cls, save_data) -> bool:
+        """
+        save_data (bytes-like):
+            contents of a save file
+
+        Returns whether the save data is in the binary format (bool)
+        """
+
+        return bytes(save_data[:len(cls.magic)]) == cls.magic
+
+    @classmethod
+    def encode(cls, save_dict: dict) -> bytes:
+        """
+        save_dict (dict):
+            a JSON serializable save document
+
+        Returns the binary representation of the save document (bytes)
+        """
+
+        assert isinstance(save_dict, dict)
+
+        chunks = [cls.magic]
+        cls._encode_value_(save_dict, chunks)
+
+        return b"".join(chunks)
+
+    @classmethod
+    def decode(cls, save_data) -> dict:
+        """
+        save_data (bytes-like):
+            binary representation of a save document, magic included
+
+        Decodes straight from the buffer, without copying it first.
+
+        Returns the save document (dict)
+        """
+
+        buffer = memoryview(save_data)
+
+        assert cls.is_binary(buffer)
+
+        save_dict, offset = cls._decode_value_(buffer, len(cls.magic))
+
+        assert offset == len(buffer)
+        assert isinstance(save_dict, dict)
+
+        return save_dict
+
+    @staticmethod
+    def _encode_varint_(number: int, chunks: list):
+        """
+        Appends a non negative int in LEB128 notation
+        """
+
+        while number > 127:
+            chunks.append(bytes(((number & 127) | 128,)))
+            number >>= 7
+        chunks.append(bytes((number,)))
+
+    @staticmethod
+    def _decode_varint_(buffer: memoryview, offset: int) -> tuple:
+        """
+        Returns a non negative int in LEB128 notation
+        and the offset after it (tuple)
+        """
+
+        number = 0
+        shift = 0
+
+        while True:
+            byte = buffer[offset]
+            offset += 1
+            number |= (byte & 127) << shift
+            if byte < 128:
+                return number, offset
+            shift += 7
+
+    @classmethod
+    def _encode_str_(cls, text: str, chunks: list):
+        """
+        Appends a length prefixed UTF-8 string
+        """
+
+        encoded = text.encode("utf-8")
+        cls._encode_varint_(len(encoded), chunks)
+        chunks.append(encoded)
+
+    @classmethod
+    def _decode_str_(cls, buffer: memoryview, offset: int) -> tuple:
+        """
+        Returns a length prefixed UTF-8 string and the offset after it (tuple)
+        """
+
+        length, offset = cls._decode_varint_(buffer, offset)
+
+        return str(buffer[offset:offset + length], "utf-8"), offset + length
+
+    @classmethod
+    def _encode_value_(cls, value, chunks: list):
+        """
+        Appends a tagged JSON serializable value
+        """
+
+        if value is None:
+            chunks.append(bytes((cls.tag_null,)))
+        elif value is False:
+            chunks.append(bytes((cls.tag_false,)))
+        elif value is True:
+            chunks.append(bytes((cls.tag_true,)))
+        elif isinstance(value, int):
+            chunks.append(bytes((cls.tag_int,)))
+            # zigzag, so small negative numbers stay small
+            cls._encode_varint_(value * 2 if value >= 0 else -value * 2 - 1, chunks)
+        elif isinstance(value, float):
+            chunks.append(bytes((cls.tag_float,)))
+            chunks.append(struct.pack("<d", value))
+        elif value == "":
+            chunks.append(bytes((cls.tag_empty_str,)))
+        elif isinstance(value, str):
+            chunks.append(bytes((cls.tag_str,)))
+            cls._encode_str_(value, chunks)
+        elif isinstance(value, list):
+            chunks.append(bytes((cls.tag_list,)))
+            cls._encode_varint_(len(value), chunks)
+            for item in value:
+                cls._encode_value_(item, chunks)
+        elif isinstance(value, dict):
+            grid_index = cls._grid_index_(value)
+            if grid_index is not None:
+                chunks.append(struct.pack("<BH", cls.tag_grid, grid_index))
+            elif (
+                len(value) == 2
+                and isinstance(value.get("type"), str)
+                and isinstance(value.get("data"), dict)
+            ):
+                chunks.append(bytes((cls.tag_object,)))
+                type_id = cls.type_ids.get(value["type"], 0)
+                cls._encode_varint_(type_id, chunks)
+                if not type_id:
+                    cls._encode_str_(value["type"], chunks)
+                cls._encode_dict_(value["data"], chunks)
+            else:
+                chunks.append(bytes((cls.tag_dict,)))
+                cls._encode_dict_(value, chunks)
+        else:
+            raise TypeError(f"Cannot encode {type(value).__name__}")
+
+    @classmethod
+    def _encode_dict_(cls, value: dict, chunks: list):
+        """
+        Appends the length and the key value pairs of a dict
+        """
+
+        cls._encode_varint_(len(value), chunks)
+
+        for key, item in value.items():
+            key_id = cls.key_ids.get(key, 0)
+            cls._encode_varint_(key_id, chunks)
+            if not key_id:
+                cls._encode_str_(key, chunks)
+            cls._encode_value_(item, chunks)
+
+    @classmethod
+    def _decode_value_(cls, buffer: memoryview, offset: int) -> tuple:
+        """
+        Returns a tagged value and the offset after it (tuple)
+        """
+
+        tag = buffer[offset]
+        offset += 1
+
+        if tag == cls.tag_object:
+            type_id, offset = cls._decode_varint_(buffer, offset)
+            if type_id:
+                type_name = cls.type_names[type_id - 1]
+            else:
+                type_name, offset = cls._decode_str_(buffer, offset)
+            data, offset = cls._decode_dict_(buffer, offset)
+            return {"type": type_name, "data": data}, offset
+        if tag == cls.tag_int:
+            number, offset = cls._decode_varint_(buffer, offset)
+            return (number >> 1) ^ -(number & 1), offset
+        if tag == cls.tag_str:
+            return cls._decode_str_(buffer, offset)
+        if tag == cls.tag_empty_str:
+            return "", offset
+        if tag == cls.tag_list:
+            length, offset = cls._decode_varint_(buffer, offset)
+            items = []
+            for _ in range(length):
+                item, offset = cls._decode_value_(buffer, offset)
+                items.append(item)
+            return items, offset
+        if tag == cls.tag_dict:
+            return cls._decode_dict_(buffer, offset)
+        if tag == cls.tag_grid:
+            (grid_index,) = struct.unpack_from("<H", buffer, offset)
+            return {
+                "type": "GridLocation",
+                "data": {
+                    "character": chr(65 + grid_index // 18),
+                    "identifier": grid_index % 18 + 1
+                }
+            }, offset + 2
+        if tag == cls.tag_false:
+            return False, offset
+        if tag == cls.tag_true:
+            return True, offset
+        if tag == cls.tag_null:
+            return None, offset
+        if tag == cls.tag_float:
+            return struct.unpack_from("<d", buffer, offset)[0], offset + 8
+
+        raise ValueError(f"Unknown tag {tag} at byte {offset - 1}")
+
+    @classmethod
+    def _decode_dict_(cls, buffer: memoryview, offset: int) -> tuple:
+        """
+        Returns a dict without tag and the offset after it (tuple)
+        """
+
+        length, offset = cls._decode_varint_(buffer, offset)
+        value = {}
+
+        for _ in range(length):
+            key_id, offset = cls._decode_varint_(buffer, offset)
+            if key_id:
+                key = cls.keys[key_id - 1]
+            else:
+                key, offset = cls._decode_str_(buffer, offset)
+            value[key], offset = cls._decode_value_(buffer, offset)
+
+        return value, offset
+
+    @staticmethod
+    def _grid_index_(value: dict):
+        """
+        Returns the position of a GridLocation dict in the 15 x 18 grid,
+        or None if the dict is no valid GridLocation
+        """
+
+        if value.get("type") != "GridLocation" or len(value) != 2:
+            return None
+
+        data = value.get("data")
+        if not isinstance(data, dict) or len(data) != 2:
+            return None
+
+        character = data.get("character")
+        identifier = data.get("identifier")
+        if (
+            not isinstance(character, str)
+            or len(character) != 1
+            or not "A" <= character <= "O"
+            or type(identifier) != int
+            or not 0 < identifier < 19
+        ):
+            return None
+
+        return (ord(character) - 65) * 18 + identifier - 1
+
+
+class SaveCompression:
+    """
+    Streaming compression of GloomLog save files
+
+    zlib saves are written in the gzip container and lzma saves as xz,
+    so either is recognized by its magic and can be opened by common tools.
+    """
+
+    compressions = ("none", "zlib", "lzma")
+
+    magics = {
+        "zlib": b"\x1f\x8b",
+        "lzma": b"\xfd7zXZ\x00"
+    }
+
+    # compressed bytes handed to a decompressor at a time
+    chunk_size = 65536
+
+    @classmethod
+    def detect(cls, save_data) -> str:
+        """
+        save_data (bytes-like): start of the contents of a save file
+
+        Returns the compression of the save data, "none" if not compressed (str)
+        """
+
+        for compression, magic in cls.magics.items():
+            if bytes(save_data[:len(magic)]) == magic:
+                return compression
+
+        return "none"
+
+    @classmethod
+    def make_compressor(cls, compression: str, level: int = None):
+        """
+        compression ("zlib" or "lzma"): compression to use
+        level (int): compression level from 0 to 9, None for the default
+
+        Returns an object with compress and flush methods
+        """
+
+        assert compression in cls.compressions[1:]
+        assert level is None or 0 <= level <= 9
+
+        if compression == "zlib":
+            return zlib.compressobj(
+                -1 if level is None else level,
+                zlib.DEFLATED,
+                31
+            )
+
+        return lzma.LZMACompressor(
+            preset=lzma.PRESET_DEFAULT if level is None else level
+        )
+
+    @staticmethod
+    def make_decompressor(compression: str):
+        """
+        compression ("zlib" or "lzma"): compression to undo
+
+        Returns an object with a decompress method
+        """
+
+        if compression == "zlib":
+            return zlib.decompressobj(31)
+
+        return lzma.LZMADecompressor()
+
+    @classmethod
+    def iter_decompressed(cls, save_data, compression: str):
+        """
+        save_data (bytes-like): compressed save data
+        compression ("zlib" or "lzma"): compression of the save data
+
+        Yields the decompressed save data in chunks
+        """
+
+        decompressor = cls.make_decompressor(compression)
+        save_data = memoryview(save_data)
+
+        for offset in range(0, len(save_data), cls.chunk_size):
+            chunk_data = decompressor.decompress(
+                save_data[offset:offset + cls.chunk_size]
+            )
+            if chunk_data:
+                yield chunk_data
+
+        assert decompressor.eof, "compressed save data is incomplete"
+
+    @classmethod
+    def decompress_prefix(cls, save_data, compression: str, length: int) -> bytes:
+        """
+        save_data (bytes-like): start of compressed save data
+        compression ("zlib" or "lzma"): compression of the save data
+        length (int): number of decompressed bytes wanted
+
+        Returns no more than the first length decompressed bytes (bytes)
+        """
+
+        return cls.make_decompressor(compression).decompress(
+            bytes(save_data[:cls.chunk_size]),
+            length
+        )
+
+
+class StreamingJSON:
+    """
+    Parses a save document from text chunks, one encounter at a time,
+    so the whole text never has to be in memory
+    """
+
+    list_start = re.compile(r'\s*\{\s*"EnounterList"\s*:\s*\[')
+    list_end = re.compile(r'\s*\}\s*')
+    members_start = re.compile(r'\s*,')
+
+    @classmethod
+    def parse_chunks(cls, save_chunks) -> dict:
+        """
+        save_chunks (iterable of bytes): UTF-8 encoded save text in chunks
+
+        Documents not starting with the encounter list are parsed whole,
+        members after it, such as the fork entry of a fork,
+        are parsed along with the rest of the text.
+
+        Returns the save document (dict)
+        """
+
+        encounter_list = []
+        encounters = cls.iter_encounters(save_chunks)
+
+        try:
+            while True:
+                encounter_list.append(next(encounters))
+        except StopIteration as stop:
+            save_dict = stop.value
+
+        save_dict["EnounterList"] = encounter_list
+
+        return save_dict
+
+    @classmethod
+    def iter_encounters(cls, save_chunks):
+        """
+        save_chunks (iterable of bytes): UTF-8 encoded save text in chunks
+
+        Yields the dict representations of the encounters in the save document,
+        in order, without keeping the ones already yielded.
+        Documents not starting with the encounter list are parsed whole first.
+
+        Returns the other members of the save document, once exhausted (dict)
+        """
+
+        text_decoder = codecs.getincrementaldecoder("utf-8")()
+        text_chunks = (text_decoder.decode(chunk) for chunk in save_chunks)
+
+        buffer = ""
+        for text_chunk in text_chunks:
+            buffer += text_chunk
+            if len(buffer) >= 32:
+                break
+
+        start = cls.list_start.match(buffer)
+        if start is None:
+            save_dict = json.loads(buffer + "".join(text_chunks) + text_decoder.decode(b"", True))
+            yield from save_dict.pop("EnounterList")
+            return save_dict
+
+        # json.loads shares equal keys within a document,
+        # parsing encounters one by one needs a key cache for that
+        keys = {}
+        decoder = json.JSONDecoder(
+            object_pairs_hook=lambda pairs: {
+                keys.setdefault(key, key): value for key, value in pairs
+            }
+        )
+
+        position = start.end()
+        separated = True
+
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n":
+                position += 1
+
+            if position < len(buffer):
+                if buffer[position] == "]":
+                    rest = buffer[position + 1:] + "".join(text_chunks) \
+                        + text_decoder.decode(b"", True)
+                    if cls.list_end.fullmatch(rest):
+                        return {}
+                    members = cls.members_start.match(rest)
+                    assert members is not None, "save text is no save document"
+                    return json.loads("{" + rest[members.end():])
+                if buffer[position] == "," and not separated:
+                    position += 1
+                    separated = True
+                    continue
+                if separated:
+                    try:
+                        encounter_as_dict, position = decoder.raw_decode(
+                            buffer,
+                            position
+                        )
+                    except ValueError:
+                        # most likely cut off at the end of the buffer
+                        pass
+                    else:
+                        yield encounter_as_dict
+                        separated = False
+                        continue
+
+            # drop what has been parsed and read on
+            buffer = buffer[position:]
+            position = 0
+            text_chunk = next(text_chunks, None)
+            if text_chunk is None:
+                raise ValueError("save text is no valid save document")
+            buffer += text_chunk
+
+
+if __name__ == "__main__":
+    print("script contains only object definitions, no functional code on its own")
@@ -1,15 +1,340 @@
+from collections import OrderedDict, deque
+import hashlib
 import json
 
 
+# fields holding the outcome of an encounter, compared by diff_encounters
+outcome_fields = ("succes", "choice")
+
+
+def digest_dict(fullDict: dict) -> str:
+    """
+    fullDict (dict):
+        dict representation of an object, as made by HandlerJSON.toDict
+
+    Hashes the canonical JSON of the dict, so every field counts,
+    nested objects included, and key order does not.
+
+    Returns the structural digest as hexadecimal string (str)
+    """
+
+    canonical_json = json.dumps(fullDict, sort_keys=True, separators=(",", ":"))
+
+    return hashlib.blake2b(canonical_json.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def diff_encounters(encounterDicts, otherEncounterDicts) -> list:
+    """
+    encounterDicts (iterable of dict):
+        dict representations of the encounters of a save, in order
+    otherEncounterDicts (iterable of dict):
+        dict representations of the encounters of the save to compare with
+
+    Encounters with the same structural digest, nested unlockables included,
+    are the same. The others are matched by type and identifier,
+    in order of appearance when an encounter was logged more than once,
+    and have changed.
+    Both are read once, only the digests and outcomes of the first encounters
+    and of the unmatched other encounters are kept meanwhile.
+
+    Returns the differences as dicts with the change
+    ("added", "removed" or "changed"), type and identifier,
+    for changes also the changed outcome fields as (old, new) tuples
+    by field name and whether the unlockables changed,
+    first in order of the other encounters, removals last (list)
+    """
+
+    def summarize(position: int, encounterDict: dict) -> tuple:
+        dataDict = encounterDict["data"]
+        return (
+            position,
+            (encounterDict["type"], dataDict["identifier"]),
+            digest_dict({"unlockables": dataDict["unlockables"]}),
+            {field: dataDict[field] for field in outcome_fields if field in dataDict}
+        )
+
+    # summaries of the first encounters not matched yet, by digest
+    knownEncounters = {}
+    for position, encounterDict in enumerate(encounterDicts):
+        knownEncounters.setdefault(digest_dict(encounterDict), deque()).append(
+            summarize(position, encounterDict)
+        )
+
+    otherSummaries = []
+    for position, encounterDict in enumerate(otherEncounterDicts):
+        matches = knownEncounters.get(digest_dict(encounterDict))
+        if matches:
+            matches.popleft()
+        else:
+            otherSummaries.append(summarize(position, encounterDict))
+
+    # what is left of the first encounters, by type and identifier
+    leftEncounters = {}
+    for summary in sorted(
+        summary for matches in knownEncounters.values() for summary in matches
+    ):
+        leftEncounters.setdefault(summary[1], deque()).append(summary)
+
+    differences = []
+
+    for _, encounterKey, unlockablesDigest, outcomes in otherSummaries:
+        difference = {"type": encounterKey[0], "identifier": encounterKey[1]}
+
+        matches = leftEncounters.get(encounterKey)
+        if not matches:
+            differences.append(dict(difference, change="added"))
+            continue
+
+        _, _, oldUnlockablesDigest, oldOutcomes = matches.popleft()
+        differences.append(dict(
+            difference,
+            change="changed",
+            outcomes={
+                field: (oldOutcomes.get(field), outcomes.get(field))
+                for field in outcome_fields
+                if oldOutcomes.get(field) != outcomes.get(field)
+            },
+            unlockables=oldUnlockablesDigest != unlockablesDigest
+        ))
+
+    for summary in sorted(
+        summary for matches in leftEncounters.values() for summary in matches
+    ):
+        differences.append(
+            {"type": summary[1][0], "identifier": summary[1][1], "change": "removed"}
+        )
+
+    return differences
+
+
+def merge_encounters(ancestorEncounterDicts, encounterDicts, otherEncounterDicts) -> tuple:
+    """
+    ancestorEncounterDicts (iterable of dict):
+        dict representations of the encounters both saves started from
+    encounterDicts (iterable of dict):
+        dict representations of the encounters of our save
+    otherEncounterDicts (iterable of dict):
+        dict representations of the encounters of the other save
+
+    Both saves are compared with their common ancestor by structural digests,
+    encounters that are not the same are matched by type and identifier,
+    as in diff_encounters.
+    Whatever the other save changed or removed since the ancestor
+    is changed or removed in ours, encounters it added are added after ours,
+    unless ours added the same, such as a global achievement
+    both parties reached in the same world.
+    Where both saves differ in another way, ours is kept and it is a conflict,
+    such as the same scenario logged with a different succes.
+    The ancestor and the other save are read once,
+    only their digests and what the other save changed are kept meanwhile.
+
+    Returns the merged encounters (list) and the conflicts (list),
+    as dicts with the type and identifier of an encounter,
+    our and their version of it (None if removed)
+    and the outcome fields that differ as (ours, theirs) tuples by field name
+    """
+
+    # positions of the ancestor encounters by digest
+    ancestorPositions = {}
+    ancestorKeys = []
+    for position, encounterDict in enumerate(ancestorEncounterDicts):
+        ancestorPositions.setdefault(digest_dict(encounterDict), []).append(position)
+        ancestorKeys.append((encounterDict["type"], encounterDict["data"]["identifier"]))
+
+    encounterList = list(encounterDicts)
+
+    ourKept, ourChanged, ourAdded, _ = _ancestor_matching_(
+        ancestorPositions=ancestorPositions,
+        ancestorKeys=ancestorKeys,
+        encounterDicts=encounterList
+    )
+    _, theirChanged, theirAdded, theirRemoved = _ancestor_matching_(
+        ancestorPositions=ancestorPositions,
+        ancestorKeys=ancestorKeys,
+        encounterDicts=otherEncounterDicts
+    )
+
+    # their versions of our encounters by index, None to remove one
+    replacements = {}
+    conflicts = []
+
+    for position, (_, theirDict, theirDigest) in theirChanged.items():
+        if position in ourKept:
+            replacements[ourKept[position]] = theirDict
+        elif position not in ourChanged:
+            conflicts.append(_conflict_making_(None, theirDict))
+        elif ourChanged[position][2] != theirDigest:
+            conflicts.append(_conflict_making_(ourChanged[position][1], theirDict))
+
+    for position in theirRemoved:
+        if position in ourKept:
+            replacements[ourKept[position]] = None
+        elif position in ourChanged:
+            conflicts.append(_conflict_making_(ourChanged[position][1], None))
+
+    # our additions not matched with theirs yet, by digest and by type and identifier
+    ourAddedDigests = {}
+    ourAddedKeys = {}
+    for index, ourDict, ourDigest in ourAdded:
+        ourAddedDigests.setdefault(ourDigest, deque()).append(index)
+        ourAddedKeys.setdefault(
+            (ourDict["type"], ourDict["data"]["identifier"]),
+            deque()
+        ).append(index)
+
+    matchedIndexes = set()
+    theirUnmatched = []
+    for _, theirDict, theirDigest in theirAdded:
+        indexes = ourAddedDigests.get(theirDigest)
+        if indexes:
+            matchedIndexes.add(indexes.popleft())
+        else:
+            theirUnmatched.append(theirDict)
+
+    addedList = []
+    for theirDict in theirUnmatched:
+        indexes = ourAddedKeys.get((theirDict["type"], theirDict["data"]["identifier"]))
+        while indexes and indexes[0] in matchedIndexes:
+            indexes.popleft()
+        if indexes:
+            index = indexes.popleft()
+            matchedIndexes.add(index)
+            conflicts.append(_conflict_making_(encounterList[index], theirDict))
+        else:
+            addedList.append(theirDict)
+
+    mergedList = [
+        replacements.get(index, encounterDict)
+        for index, encounterDict in enumerate(encounterList)
+    ]
+    mergedList = [encounterDict for encounterDict in mergedList if encounterDict is not None]
+    mergedList.extend(addedList)
+
+    return mergedList, conflicts
+
+
+def _ancestor_matching_(
+    ancestorPositions: dict,
+    ancestorKeys: list,
+    encounterDicts
+) -> tuple:
+    """
+    This function should only be used by merge_encounters.
+    Use at your own risk.
+
+    ancestorPositions (dict):
+        positions of the ancestor encounters by digest
+    ancestorKeys (list of tuple):
+        type and identifier of every ancestor encounter
+    encounterDicts (iterable of dict):
+        dict representations of the encounters of a save, read once
+
+    Returns the indexes of the encounters kept from the ancestor
+    by ancestor position (dict), the index, dict and digest of changed encounters
+    by ancestor position (dict), the index, dict and digest of added encounters
+    (list) and the ancestor positions of removed encounters (list)
+    """
+
+    usedPositions = {}
+    keptIndexes = {}
+    unmatchedEncounters = []
+
+    for index, encounterDict in enumerate(encounterDicts):
+        encounterDigest = digest_dict(encounterDict)
+        positions = ancestorPositions.get(encounterDigest, ())
+        used = usedPositions.get(encounterDigest, 0)
+        if used < len(positions):
+            keptIndexes[positions[used]] = index
+            usedPositions[encounterDigest] = used + 1
+        else:
+            unmatchedEncounters.append((index, encounterDict, encounterDigest))
+
+    # ancestor encounters left, by type and identifier
+    leftPositions = {}
+    for position, encounterKey in enumerate(ancestorKeys):
+        if position not in keptIndexes:
+            leftPositions.setdefault(encounterKey, deque()).append(position)
+
+    changedEncounters = {}
+    addedEncounters = []
+    for unmatchedEncounter in unmatchedEncounters:
+        encounterDict = unmatchedEncounter[1]
+        positions = leftPositions.get((encounterDict["type"], encounterDict["data"]["identifier"]))
+        if positions:
+            changedEncounters[positions.popleft()] = unmatchedEncounter
+        else:
+            addedEncounters.append(unmatchedEncounter)
+
+    removedPositions = [
+        position for positions in leftPositions.values() for position in positions
+    ]
+
+    return keptIndexes, changedEncounters, addedEncounters, removedPositions
+
+
+def _conflict_making_(ourDict: dict, theirDict: dict) -> dict:
+    """
+    This function should only be used by merge_encounters.
+    Use at your own risk.
+
+    ourDict (dict): our version of an encounter, None if removed
+    theirDict (dict): their version of the encounter, None if removed
+
+    Returns the conflict between the versions (dict)
+    """
+
+    encounterDict = theirDict if ourDict is None else ourDict
+    outcomes = {}
+
+    if ourDict is not None and theirDict is not None:
+        outcomes = {
+            field: (ourDict["data"].get(field), theirDict["data"].get(field))
+            for field in outcome_fields
+            if ourDict["data"].get(field) != theirDict["data"].get(field)
+        }
+
+    return {
+        "type": encounterDict["type"],
+        "identifier": encounterDict["data"]["identifier"],
+        "ours": ourDict,
+        "theirs": theirDict,
+        "outcomes": outcomes
+    }
+
+
 class HandlerJSON:
     """
     An abstract class to standardize JSON handling among objects
+
+    Child classes declare their fields in __slots__.
+    Those fields are what gets serialized,
+    except for fields starting with an underscore.
     """
 
+    __slots__ = ()
+
     # It would be better to inherit from json.JSONEncoder or dict instead of object...
     # but json.JSONEncoder inheritance gives errors in the unittest framework...
     # and dict inheritance is limited in functionality
 
+    # names of the serialized fields, set per class by __init_subclass__
+    json_fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Collects the declared fields of the class and its parents
+        """
+
+        super().__init_subclass__(**kwargs)
+
+        json_fields = []
+        for parent_class in reversed(cls.__mro__):
+            for field in parent_class.__dict__.get("__slots__", ()):
+                if not field.startswith("_") and field not in json_fields:
+                    json_fields.append(field)
+
+        cls.json_fields = tuple(json_fields)
+
     def __init__(self):
         """
         There can only be none
@@ -18,7 +343,26 @@ class HandlerJSON:
         # enforce only abstract use of this class
         assert type(self) != HandlerJSON
 
-    def fromJSON(self, fullJSON: str) -> dict:
+    @classmethod
+    def fromDict(cls, fullDict: dict) -> dict:
+        """
+        fullDict (dict):
+            dict representation of an object, as made by toDict
+
+        Checks whether the dict is generally correct to form an object
+        Strips the object header
+
+        Returns a dict with the object parameters in the dict
+        """
+
+        assert type(fullDict) == dict
+        assert fullDict["type"] == cls.__name__
+        assert "data" in fullDict
+
+        return fullDict["data"]
+
+    @classmethod
+    def fromJSON(cls, fullJSON: str) -> dict:
         """
         fullJSON (str):
             JSON representation of an object
@@ -31,30 +375,97 @@ class HandlerJSON:
 
         assert type(fullJSON) == str
 
-        fullDict = json.loads(fullJSON)
+        return cls.fromDict(json.loads(fullJSON))
 
-        assert fullDict["type"] == type(self).__name__
-        assert "data" in fullDict
+    @staticmethod
+    def parseJSON(fullJSON: str) -> dict:
+        """
+        fullJSON (str):
+            JSON representation of an object
 
-        return fullDict["data"]
+        Returns the dict representation of the object,
+        to be passed on as fullDict to its constructor
+        """
+
+        assert type(fullJSON) == str
+
+        return json.loads(fullJSON)
+
+    def toDict(self) -> dict:
+        """
+        Returns a dict representation of the information in the object,
+        with nested objects converted as well, ready to be JSON serialized
+        """
+
+        dataDict = {
+            field: self.valueToDict(getattr(self, field))
+            for field in self.json_fields
+        }
+
+        # child classes without __slots__ of their own still get a __dict__
+        for key, value in getattr(self, "__dict__", {}).items():
+            dataDict[key] = self.valueToDict(value)
+
+        return {"type": type(self).__name__, "data": dataDict}
+
+    @staticmethod
+    def valueToDict(value):
+        """
+        value (anything JSON serializable or HandlerJSON):
+            the value to convert
+
+        Returns the value with every HandlerJSON in it converted to a dict
+        """
+
+        if isinstance(value, HandlerJSON):
+            return value.toDict()
+        if isinstance(value, list):
+            return [HandlerJSON.valueToDict(item) for item in value]
+        if isinstance(value, dict):
+            return {key: HandlerJSON.valueToDict(item) for key, item in value.items()}
+
+        return value
+
+    def digest(self) -> str:
+        """
+        Returns a digest of all information in the object,
+        unlike __hash__ and __eq__, which may only look at part of it (str)
+        """
+
+        return digest_dict(self.toDict())
 
     def toJSON(self) -> str:
         """
         Returns the JSON string representation of the information in the object
         """
 
-        # It would be better to inherit and override json.JSONEncoder.default() for this,
-        # but that seems to give errors in the unittest framework
-
-        return json.dumps(self, default=lambda o: {"type": type(o).__name__, "data": o.__dict__}, indent=2, sort_keys=True)
+        return json.dumps(self.toDict(), indent=2, sort_keys=True)
 
 
 class GridLocation(HandlerJSON):
     """
     A location by the grid on the map of Gloomhaven
+
+    There is only one, immutable, instance per location on the map.
+    Creating a GridLocation returns that shared instance,
+    so GridLocations compare by identity and can be used as dict keys.
     """
 
-    def __init__(self, character: str = None, identifier: int = None, fullJSON: str = None):
+    __slots__ = ("character", "identifier")
+
+    characters = tuple(chr(i) for i in range(65, 80))
+    identifiers = tuple(range(1, 19))
+
+    # the shared instances by (character, identifier), filled below the class
+    grid_locations = {}
+
+    def __new__(
+        cls,
+        character: str = None,
+        identifier: int = None,
+        fullJSON: str = None,
+        fullDict: dict = None
+    ):
         """
         character (single character string: A - O):
             the character denoting the horizontal / row value of the GridLocation
@@ -63,36 +474,58 @@ class GridLocation(HandlerJSON):
 
         fullJSON (str):
             JSON representation of the GridLocation
+        fullDict (dict):
+            dict representation of the GridLocation
+
+        Provide either a JSON, a dict or all other parameters as input.
+        The JSON or dict will override any other input if set.
 
-        Provide either a JSON or all other parameters as input.
-        The JSON will override any other input if set.
+        Returns the shared GridLocation (GridLocation)
         """
 
         if fullJSON is not None:
-            fullDict = self.fromJSON(fullJSON)
-            character = fullDict["character"]
-            identifier = fullDict["identifier"]
+            fullDict = cls.parseJSON(fullJSON)
+
+        if fullDict is not None:
+            dataDict = cls.fromDict(fullDict)
+            character = dataDict["character"]
+            identifier = dataDict["identifier"]
 
         assert type(character) == str
-        assert len(character) == 1
+        assert type(identifier) == int
+        assert (character, identifier) in cls.grid_locations
 
-        assert 64 < ord(character) and ord(character) < 80
+        return cls.grid_locations[(character, identifier)]
 
-        assert type(identifier) == int
-        assert 0 < identifier and identifier < 19
+    def __init__(self, *args, **kwargs):
+        """
+        Nothing left to do, __new__ returns an initialized shared instance
+        """
 
-        self.character = character
-        self.identifier = identifier
+    @classmethod
+    def _create_(cls, character: str, identifier: int):
+        """
+        This function should only be used to fill grid_locations.
+        Use at your own risk.
 
-    def __eq__(self, other) -> bool:
+        Returns a new GridLocation (GridLocation)
         """
-        other (GridLocation):
-            the grid location to compare to
-        Return whether the two grid location point to a similar GridLocation on the map of Gloomhaven
-        (bool)
+
+        grid_location = object.__new__(cls)
+        object.__setattr__(grid_location, "character", character)
+        object.__setattr__(grid_location, "identifier", identifier)
+
+        return grid_location
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError("GridLocation is immutable")
+
+    def __reduce__(self) -> tuple:
+        """
+        Copies and pickles resolve to the shared instance as well
         """
 
-        return type(other) == type(self) and self.character == other.character and self.identifier == other.identifier
+        return (type(self), (self.character, self.identifier))
 
     def __str__(self) -> str:
         """
@@ -102,46 +535,167 @@ class GridLocation(HandlerJSON):
         return "(" + self.character + "-" + str(self.identifier) + ")"
 
 
+GridLocation.grid_locations = {
+    (character, identifier): GridLocation._create_(character, identifier)
+    for character in GridLocation.characters
+    for identifier in GridLocation.identifiers
+}
+
+
+class EncounterRegistry:
+    """
+    A lookup of Encounter classes by type name and by friendly name
+    Encounter classes register themselves when they are defined,
+    so encounter types from other modules work without further changes
+    """
+
+    def __init__(self):
+        self.type_names = {}
+        self.friendly_names = {}
+        self.type_tuples = {}
+
+    def register(self, encounter_class: type):
+        """
+        encounter_class (child class of Encounter):
+            the class to register
+
+        Makes the class available by its type name and,
+        if it defines one itself, by its friendly name.
+        Redefining a class from the same module replaces the old one.
+        """
+
+        assert issubclass(encounter_class, Encounter)
+
+        for names, name, defined in (
+            (self.type_names, encounter_class.__name__, True),
+            (
+                self.friendly_names,
+                encounter_class.friendly_name,
+                "friendly_name" in encounter_class.__dict__
+            )
+        ):
+            if not defined:
+                continue
+            if name in names:
+                registered_class = names[name]
+                assert registered_class.__module__ == encounter_class.__module__
+                assert registered_class.__qualname__ == encounter_class.__qualname__
+            names[name] = encounter_class
+
+        self.type_tuples = {}
+
+    def get_type(self, type_name: str) -> type:
+        """
+        type_name (str):
+            the class name of an Encounter, as in its JSON "type"
+
+        Returns the registered Encounter class (type)
+        """
+
+        return self.type_names[type_name]
+
+    def get_friendly(self, friendly_name: str) -> type:
+        """
+        friendly_name (str):
+            the friendly name of an Encounter
+
+        Returns the registered Encounter class (type)
+        """
+
+        return self.friendly_names[friendly_name]
+
+    def get_types(self, flag: str) -> tuple:
+        """
+        flag (str):
+            class attribute of Encounter that selects the types, e.g. "loggable"
+
+        Returns the registered Encounter classes
+        with the flag set, sorted by type name (tuple)
+        """
+
+        if flag not in self.type_tuples:
+            self.type_tuples[flag] = tuple(
+                self.type_names[type_name]
+                for type_name in sorted(self.type_names)
+                if getattr(self.type_names[type_name], flag)
+            )
+
+        return self.type_tuples[flag]
+
+
+# filled by Encounter.__init_subclass__
+encounter_registry = EncounterRegistry()
+
+
 class Encounter(HandlerJSON):
     """
     An encouter from the game Gloomhaven
     Abstract class to capture as much as possible of what is in Gloomhaven
     """
 
+    # _hash caches __hash__, the identifier should not change after hashing
+    __slots__ = ("identifier", "unlockables", "_hash")
+
     # should be overwritten by child classes
     friendly_name = "encounter"
 
-    def __init__(self, identifier=None, unlockables: list = [], fullJSON: str = None):
+    # whether the encounter can be logged itself or be unlocked by one
+    # should be overwritten by child classes that can
+    loggable = False
+    unlockable = False
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Registers every child class in the encounter registry
+        """
+
+        super().__init_subclass__(**kwargs)
+
+        encounter_registry.register(cls)
+
+    def __init__(
+        self,
+        identifier=None,
+        unlockables: list = [],
+        fullJSON: str = None,
+        fullDict: dict = None
+    ):
         """
         identifier (something unique):
             the identifier of the Encounter
-        unlockables (list of Encounter):
+        unlockables (list of Encounter or their dicts):
             list of Encounter objects this Encounter unlocked
         fullJSON (str):
             JSON representation of the Encounter
+        fullDict (dict):
+            dict representation of the Encounter
 
-        Provide either a JSON or all other parameters as input.
-        The JSON will override any other input if set.
+        Provide either a JSON, a dict or all other parameters as input.
+        The JSON or dict will override any other input if set.
         """
 
         # enforce only abstract use of this class
         assert type(self) != Encounter
 
         if fullJSON is not None:
-            fullDict = self.fromJSON(fullJSON)
-            identifier = fullDict["identifier"]
-            unlockables = fullDict["unlockables"]
+            fullDict = self.parseJSON(fullJSON)
+
+        if fullDict is not None:
+            dataDict = self.fromDict(fullDict)
+            identifier = dataDict["identifier"]
+            unlockables = dataDict["unlockables"]
 
         assert type(unlockables) == list
 
         self.identifier = identifier
         self.unlockables = []
 
-        for unlockable_dict in unlockables:
-            unlockable_json = json.dumps(unlockable_dict)
-            unlockable_class = globals()[unlockable_dict["type"]]
-            unlockable_object = unlockable_class(fullJSON=unlockable_json)
-            self.unlockables.append(unlockable_object)
+        for unlockable in unlockables:
+            if isinstance(unlockable, Encounter):
+                self.unlockables.append(unlockable)
+            else:
+                unlockable_class = encounter_registry.get_type(unlockable["type"])
+                self.unlockables.append(unlockable_class(fullDict=unlockable))
 
     def __eq__(self, other) -> bool:
         """
@@ -152,6 +706,17 @@ class Encounter(HandlerJSON):
 
         return type(other) == type(self) and self.identifier == other.identifier
 
+    def __hash__(self) -> int:
+        """
+        Return a hash matching __eq__, cached on the encounter (int)
+        """
+
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((type(self).__name__, self.identifier))
+            return self._hash
+
     def __str__(self) -> str:
         """
         Returns general info about the encouter (str)
@@ -168,10 +733,18 @@ class EncounterByName(Encounter):
     Abstract class to capture mostly available characters and achievements
     """
 
+    __slots__ = ()
+
     # should be overwritten by child classes
     friendly_name = "numbered by number"
 
-    def __init__(self, identifier: str = None, unlockables: list = [], fullJSON: str = None):
+    def __init__(
+        self,
+        identifier: str = None,
+        unlockables: list = [],
+        fullJSON: str = None,
+        fullDict: dict = None
+    ):
         """
         identifier (int):
             the identifier of the Encounter
@@ -179,9 +752,11 @@ class EncounterByName(Encounter):
             list of Encounter objects this Encounter unlocked
         fullJSON (str):
             JSON representation of the Encounter
+        fullDict (dict):
+            dict representation of the Encounter
 
-        Provide either a JSON or all other parameters as input.
-        The JSON will override any other input if set.
+        Provide either a JSON, a dict or all other parameters as input.
+        The JSON or dict will override any other input if set.
         """
 
         # enforce only abstract use of this class
@@ -190,7 +765,8 @@ class EncounterByName(Encounter):
         super().__init__(
             identifier=identifier,
             unlockables=unlockables,
-            fullJSON=fullJSON
+            fullJSON=fullJSON,
+            fullDict=fullDict
         )
 
         assert type(self.identifier) == str
@@ -201,7 +777,10 @@ class Character(EncounterByName):
     An ancient technology from the game Gloomhaven
     """
 
+    __slots__ = ()
+
     friendly_name = "character"
+    unlockable = True
 
 
 class PartyAchievement(EncounterByName):
@@ -209,7 +788,10 @@ class PartyAchievement(EncounterByName):
     A party achievement from the game Gloomhaven
     """
 
+    __slots__ = ()
+
     friendly_name = "party achievement"
+    unlockable = True
 
 
 class GlobalAchievement(EncounterByName):
@@ -217,7 +799,10 @@ class GlobalAchievement(EncounterByName):
     A lobal achievement from the game Gloomhaven
     """
 
+    __slots__ = ()
+
     friendly_name = "global achievement"
+    unlockable = True
 
 
 class EncounterByNumber(Encounter):
@@ -226,10 +811,18 @@ class EncounterByNumber(Encounter):
     Abstract class to capture mostly scenarios and events
     """
 
+    __slots__ = ()
+
     # should be overwritten by child classes
     friendly_name = "encounter by number"
 
-    def __init__(self, identifier: int = None, unlockables: list = [], fullJSON: str = None):
+    def __init__(
+        self,
+        identifier: int = None,
+        unlockables: list = [],
+        fullJSON: str = None,
+        fullDict: dict = None
+    ):
         """
         identifier (int):
             the identifier of the Encounter
@@ -237,9 +830,11 @@ class EncounterByNumber(Encounter):
             list of Encounter objects this Encounter unlocked
         fullJSON (str):
             JSON representation of the Encounter
+        fullDict (dict):
+            dict representation of the Encounter
 
-        Provide either a JSON or all other parameters as input.
-        The JSON will override any other input if set.
+        Provide either a JSON, a dict or all other parameters as input.
+        The JSON or dict will override any other input if set.
         """
 
         # enforce only abstract use of this class
@@ -248,7 +843,8 @@ class EncounterByNumber(Encounter):
         super().__init__(
             identifier=identifier,
             unlockables=unlockables,
-            fullJSON=fullJSON
+            fullJSON=fullJSON,
+            fullDict=fullDict
         )
 
         assert type(self.identifier) == int
@@ -268,7 +864,10 @@ class Treasure(EncounterByNumber):
     An abstract class for treasure from the game Gloomhaven
     """
 
+    __slots__ = ()
+
     friendly_name = "treasure"
+    loggable = True
 
 
 class IncrementalEncounterByNumber(EncounterByNumber):
@@ -278,6 +877,8 @@ class IncrementalEncounterByNumber(EncounterByNumber):
     the previous encounter of the same type increased by one
     """
 
+    __slots__ = ()
+
     # should be overwritten by child classes
     friendly_name = "Incremental encounter"
 
@@ -287,7 +888,10 @@ class Donation(IncrementalEncounterByNumber):
     A sanctuary donation from the game Gloomhaven
     """
 
+    __slots__ = ()
+
     friendly_name = "donation"
+    loggable = True
 
 
 class AncientTechnology(IncrementalEncounterByNumber):
@@ -295,7 +899,10 @@ class AncientTechnology(IncrementalEncounterByNumber):
     An ancient technology from the game Gloomhaven
     """
 
+    __slots__ = ()
+
     friendly_name = "ancient technology"
+    unlockable = True
 
 
 class Event(EncounterByNumber):
@@ -303,6 +910,8 @@ class Event(EncounterByNumber):
     An abstract class for events from the game Gloomhaven
     """
 
+    __slots__ = ("choice",)
+
     # should be overwritten by child classes
     friendly_name = "event"
 
@@ -311,7 +920,8 @@ class Event(EncounterByNumber):
         identifier: int = None,
         choice: str = None,
         unlockables: list = [],
-        fullJSON: int = None
+        fullJSON: str = None,
+        fullDict: dict = None
     ):
         """
         identifier (int):
@@ -320,15 +930,25 @@ class Event(EncounterByNumber):
             "A" or "B" for outcome choice, "" if only unlocked
         unlockables (list of Encounter):
             list of Encounter objects this Encounter unlocked
+        fullJSON (str):
+            JSON representation of the event
+        fullDict (dict):
+            dict representation of the event
+
+        Provide either a JSON, a dict or all other parameters as input.
+        The JSON or dict will override any other input if set.
         """
 
         assert type(self) != Event
 
         if fullJSON is not None:
-            fullDict = self.fromJSON(fullJSON)
-            identifier = fullDict["identifier"]
-            choice = fullDict["choice"]
-            unlockables = fullDict["unlockables"]
+            fullDict = self.parseJSON(fullJSON)
+
+        if fullDict is not None:
+            dataDict = self.fromDict(fullDict)
+            identifier = dataDict["identifier"]
+            choice = dataDict["choice"]
+            unlockables = dataDict["unlockables"]
 
         assert choice == "A" or choice == "B" or choice == ""
 
@@ -356,7 +976,11 @@ class RoadEvent(Event):
     A class for road events from the game Gloomhaven
     """
 
+    __slots__ = ()
+
     friendly_name = "road event"
+    loggable = True
+    unlockable = True
 
 
 class CityEvent(Event):
@@ -364,7 +988,11 @@ class CityEvent(Event):
     A class for city events from the game Gloomhaven
     """
 
+    __slots__ = ()
+
     friendly_name = "city event"
+    loggable = True
+    unlockable = True
 
 
 class NamedEncounterByNumber(EncounterByNumber):
@@ -372,6 +1000,8 @@ class NamedEncounterByNumber(EncounterByNumber):
     An abstract class for encounters with a name from the game Gloomhaven
     """
 
+    __slots__ = ("name",)
+
     # should be overwritten by child classes
     friendly_name = "named encounter"
 
@@ -380,7 +1010,8 @@ class NamedEncounterByNumber(EncounterByNumber):
         identifier: int = None,
         name: str = None,
         unlockables: list = [],
-        fullJSON: str = None
+        fullJSON: str = None,
+        fullDict: dict = None
     ):
         """
         identifier (int):
@@ -389,16 +1020,23 @@ class NamedEncounterByNumber(EncounterByNumber):
             the name of the named encounter
         unlockables (list of Encounter):
             list of Encounter objects this Encounter unlocked
+        fullJSON (str):
+            JSON representation of the named encounter
+        fullDict (dict):
+            dict representation of the named encounter
 
-        Provide either a JSON or all other parameters as input.
-        The JSON will override any other input if set.
+        Provide either a JSON, a dict or all other parameters as input.
+        The JSON or dict will override any other input if set.
         """
 
         if fullJSON is not None:
-            fullDict = self.fromJSON(fullJSON)
-            identifier = fullDict["identifier"]
-            name = fullDict["name"]
-            unlockables = fullDict["unlockables"]
+            fullDict = self.parseJSON(fullJSON)
+
+        if fullDict is not None:
+            dataDict = self.fromDict(fullDict)
+            identifier = dataDict["identifier"]
+            name = dataDict["name"]
+            unlockables = dataDict["unlockables"]
 
         assert type(name) == str
 
@@ -421,7 +1059,10 @@ class Quest(NamedEncounterByNumber):
     A personal quest from the game Gloomhaven
     """
 
+    __slots__ = ()
+
     friendly_name = "quest"
+    loggable = True
 
 
 class ItemDesign(NamedEncounterByNumber):
@@ -429,7 +1070,10 @@ class ItemDesign(NamedEncounterByNumber):
     An item design from the game Gloomhaven
     """
 
+    __slots__ = ()
+
     friendly_name = "item design"
+    unlockable = True
 
 
 class Scenario(NamedEncounterByNumber):
@@ -437,7 +1081,11 @@ class Scenario(NamedEncounterByNumber):
     A scenario from the game Gloomhaven
     """
 
+    __slots__ = ("gridLocation", "succes")
+
     friendly_name = "scenario"
+    loggable = True
+    unlockable = True
 
     def __init__(
         self,
@@ -446,7 +1094,8 @@ class Scenario(NamedEncounterByNumber):
         gridLocation: GridLocation = None,
         succes=None,
         unlockables: list = [],
-        fullJSON: str = None
+        fullJSON: str = None,
+        fullDict: dict = None
     ):
         """
         identifier (int):
@@ -461,20 +1110,23 @@ class Scenario(NamedEncounterByNumber):
             list of Encounter objects this Encounter unlocked
         fullJSON (str):
             JSON representation of the Scenario
+        fullDict (dict):
+            dict representation of the Scenario
 
-        Provide either a JSON or all other parameters as input.
-        The JSON will override any other input if set.
+        Provide either a JSON, a dict or all other parameters as input.
+        The JSON or dict will override any other input if set.
         """
 
         if fullJSON is not None:
-            fullDict = self.fromJSON(fullJSON)
-            identifier = fullDict["identifier"]
-            name = fullDict["name"]
-            gridLocation = GridLocation(
-                fullJSON=json.dumps(fullDict["gridLocation"])
-            )
-            succes = fullDict["succes"]
-            unlockables = fullDict["unlockables"]
+            fullDict = self.parseJSON(fullJSON)
+
+        if fullDict is not None:
+            dataDict = self.fromDict(fullDict)
+            identifier = dataDict["identifier"]
+            name = dataDict["name"]
+            gridLocation = GridLocation(fullDict=dataDict["gridLocation"])
+            succes = dataDict["succes"]
+            unlockables = dataDict["unlockables"]
 
         assert type(gridLocation) == GridLocation
         assert type(succes) == bool or succes == ""
@@ -502,5 +1154,924 @@ class Scenario(NamedEncounterByNumber):
         return f"{super_str} {location_str}{str_end}"
 
 
+class LazyEncounterList:
+    """
+    A list of Encounters that are only built from their dicts when used
+
+    Types are checked when an Encounter is built, so a list of dicts
+    is taken over without walking it.
+    Entries are kept as dict representations, either in a list of its own
+    or in a version of an EditHistory the list follows, see follow.
+    At most resident_limit of them are kept built as Encounter at a time,
+    the least recently used ones are dropped, their dicts are still there.
+    """
+
+    resident_limit = 1024
+
+    def __init__(self, encounters: list = None, resident_limit: int = None):
+        """
+        encounters (list of Encounter or their dicts):
+            the initial entries of the list, taken over as is,
+            with Encounters turned into dicts and kept built
+        resident_limit (int):
+            maximum number of entries kept as Encounter
+        """
+
+        if encounters is None:
+            encounters = []
+
+        assert isinstance(encounters, list)
+
+        if resident_limit is not None:
+            assert isinstance(resident_limit, int)
+            assert resident_limit > 0
+            self.resident_limit = resident_limit
+
+        self.entries = encounters
+        # Encounters built from the entries by index, least recently used first
+        self.resident = OrderedDict()
+        for index, entry in enumerate(self.entries):
+            if isinstance(entry, Encounter):
+                self.entries[index] = entry.toDict()
+                self.resident[index] = entry
+        self._evict_()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, index):
+        """
+        index (int or slice):
+            position(s) of the Encounter(s) to get
+
+        Builds the Encounter from its dict if it is not resident,
+        raising a TypeError if its type is not loggable
+
+        Returns the Encounter, or a list of Encounters for a slice
+        """
+
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.entries)))]
+
+        if index < 0:
+            index += len(self.entries)
+        if not 0 <= index < len(self.entries):
+            raise IndexError("encounter index out of range")
+
+        encounter = self.resident.get(index)
+
+        if encounter is not None:
+            self.resident.move_to_end(index)
+            return encounter
+
+        entry = self.entries[index]
+        encounter_class = encounter_registry.get_type(entry["type"])
+        if not encounter_class.loggable:
+            raise TypeError(f"{entry['type']} encounters cannot be logged")
+        encounter = encounter_class(fullDict=entry)
+
+        self.resident[index] = encounter
+        self._evict_()
+
+        return encounter
+
+    def __iter__(self):
+        for index in range(len(self.entries)):
+            yield self[index]
+
+    def __reversed__(self):
+        for index in reversed(range(len(self.entries))):
+            yield self[index]
+
+    def append(self, encounter):
+        """
+        encounter (Encounter or its dict):
+            the Encounter to add at the end of the list,
+            a dict is only built once it is used
+        """
+
+        # a list following an edit history changes along with the history
+        assert isinstance(self.entries, list)
+
+        if isinstance(encounter, dict):
+            self.entries.append(encounter)
+            return
+
+        assert isinstance(encounter, Encounter)
+
+        self.entries.append(encounter.toDict())
+        self.resident[len(self.entries) - 1] = encounter
+        self._evict_()
+
+    def truncate(self, length: int):
+        """
+        length (int):
+            number of Encounters to keep from the start of the list
+        """
+
+        assert isinstance(self.entries, list)
+        assert isinstance(length, int)
+        assert 0 <= length
+
+        self._resident_dropping_(start=length)
+
+        del self.entries[length:]
+
+    def follow(self, encounter_dicts, change_index: int):
+        """
+        encounter_dicts (sequence of dict):
+            dict representations of the Encounters from now on,
+            such as the current version of an EditHistory
+        change_index (int):
+            index of the first dict that differs from the entries so far
+
+        Takes the dicts as the entries of the list, as they are,
+        so the Encounters are only held once, by whoever changes them.
+        The Encounters built for the entries before change_index are kept.
+        """
+
+        assert isinstance(change_index, int)
+
+        self._resident_dropping_(start=change_index)
+
+        self.entries = encounter_dicts
+
+    def get_dicts(self):
+        """
+        Returns the dict representations of the Encounters,
+        as the list or version the list holds, not to be changed
+        (list or PersistentVector)
+        """
+
+        return self.entries
+
+    def get_dict(self, index: int) -> dict:
+        """
+        index (int):
+            position of the Encounter
+
+        Returns the dict representation of the Encounter,
+        without building the Encounter (dict)
+        """
+
+        return self.entries[index]
+
+    def get_key(self, index: int) -> tuple:
+        """
+        index (int):
+            position of the Encounter
+
+        Returns the type name and identifier of the Encounter,
+        without building the Encounter (tuple)
+        """
+
+        entry = self.entries[index]
+
+        return entry["type"], entry["data"]["identifier"]
+
+    def get_digest(self, index: int) -> str:
+        """
+        index (int):
+            position of the Encounter
+
+        Returns the structural digest of the Encounter,
+        without building the Encounter (str)
+        """
+
+        return digest_dict(self.get_dict(index))
+
+    def iter_dicts(self, stop: int = None):
+        """
+        stop (int):
+            number of Encounters to yield, all of them when left out
+
+        Yields the dict representation of every Encounter in the list,
+        without building them
+        """
+
+        if stop is None:
+            stop = len(self.entries)
+
+        for index in range(stop):
+            yield self.entries[index]
+
+    def _resident_dropping_(self, start: int):
+        """
+        This function should only be used by truncate and follow.
+        Use at your own risk.
+
+        start (int): index from which built Encounters are dropped
+        """
+
+        for index in range(start, len(self.entries)):
+            self.resident.pop(index, None)
+
+    def _evict_(self):
+        """
+        Drops the least recently used Encounters
+        until at most resident_limit of them are left
+        """
+
+        while len(self.resident) > self.resident_limit:
+            self.resident.popitem(last=False)
+
+
+class EncounterIndex:
+    """
+    Positions of the Encounters in a list by type name and identifier
+
+    Keeps a running maximum of the int identifiers per type,
+    so the next identifier of an incremental encounter is known directly.
+    """
+
+    def __init__(self, encounter_keys=()):
+        """
+        encounter_keys (iterable of tuples):
+            type name and identifier of every Encounter in the list, in order
+        """
+
+        # type name -> identifier -> positions
+        self.positions = {}
+        # type name -> number of Encounters
+        self.counts = {}
+        # type name -> highest int identifier
+        self.max_identifiers = {}
+        self.length = 0
+
+        for type_name, identifier in encounter_keys:
+            self.add(type_name=type_name, identifier=identifier)
+
+    def add(self, type_name: str, identifier):
+        """
+        type_name (str):
+            type name of the Encounter added to the end of the list
+        identifier (int or str):
+            identifier of that Encounter
+        """
+
+        self.positions.setdefault(type_name, {}).setdefault(
+            identifier, []
+        ).append(self.length)
+        self.counts[type_name] = self.counts.get(type_name, 0) + 1
+        self.length += 1
+
+        if type(identifier) == int:
+            max_identifier = self.max_identifiers.get(type_name)
+            if max_identifier is None or identifier > max_identifier:
+                self.max_identifiers[type_name] = identifier
+
+    def remove(self, type_name: str, identifier):
+        """
+        type_name (str):
+            type name of the Encounter removed from the end of the list
+        identifier (int or str):
+            identifier of that Encounter
+        """
+
+        type_positions = self.positions[type_name]
+        identifier_positions = type_positions[identifier]
+
+        self.length -= 1
+        assert identifier_positions[-1] == self.length
+        identifier_positions.pop()
+
+        self.counts[type_name] -= 1
+        if not self.counts[type_name]:
+            del self.counts[type_name]
+
+        if not identifier_positions:
+            del type_positions[identifier]
+            if self.max_identifiers.get(type_name) == identifier:
+                self.max_identifiers[type_name] = max(
+                    (i for i in type_positions if type(i) == int),
+                    default=None
+                )
+                if self.max_identifiers[type_name] is None:
+                    del self.max_identifiers[type_name]
+
+    def has(self, type_name: str, identifier) -> bool:
+        """
+        Returns whether there is an Encounter
+        with the type name and identifier (bool)
+        """
+
+        return identifier in self.positions.get(type_name, {})
+
+    def get_positions(self, type_name: str, identifier) -> list:
+        """
+        Returns the positions of the Encounters
+        with the type name and identifier (list of int)
+        """
+
+        return list(self.positions.get(type_name, {}).get(identifier, ()))
+
+    def count(self, type_name: str) -> int:
+        """
+        Returns the number of Encounters with the type name (int)
+        """
+
+        return self.counts.get(type_name, 0)
+
+    def get_max_identifier(self, type_name: str):
+        """
+        Returns the highest int identifier of the type name,
+        or None if there is none
+        """
+
+        return self.max_identifiers.get(type_name)
+
+
+class UnlockGraph:
+    """
+    Which Encounters the Encounters in a list unlocked,
+    by type name and identifier
+
+    Kept up to date as Encounters are added to and removed from
+    the end of the list, like EncounterIndex, so the Encounters unlocked
+    but not completed yet are known directly,
+    instead of walking every Encounter and its unlockables.
+    An Encounter is completed once logged with every outcome it has set
+    and successful, so a failed scenario can still be played.
+    """
+
+    def __init__(self, encounter_dicts=()):
+        """
+        encounter_dicts (iterable of dict):
+            dict representation of every Encounter in the list, in order
+        """
+
+        # position -> type name and identifier completed, or None,
+        # and the type names and identifiers unlocked
+        self.entries = []
+        # type name -> identifier -> positions of the Encounters unlocking it
+        self.unlocked_by = {}
+        # type name -> identifier -> number of times completed
+        self.completions = {}
+        # type name -> identifiers unlocked and not completed, as dict keys
+        self.available = {}
+
+        for encounter_as_dict in encounter_dicts:
+            self.add(encounter_as_dict=encounter_as_dict)
+
+    @staticmethod
+    def iter_unlockables(encounter_as_dict: dict):
+        """
+        encounter_as_dict (dict):
+            dict representation of an Encounter
+
+        Yields the type name and identifier of every Encounter it unlocked,
+        those unlocked by its unlockables included
+        """
+
+        for unlockable in encounter_as_dict["data"]["unlockables"]:
+            yield unlockable["type"], unlockable["data"]["identifier"]
+            yield from UnlockGraph.iter_unlockables(unlockable)
+
+    @staticmethod
+    def is_completion(encounter_as_dict: dict) -> bool:
+        """
+        encounter_as_dict (dict):
+            dict representation of a logged Encounter
+
+        Returns whether the Encounter was completed,
+        with a choice made or a scenario succesfully played (bool)
+        """
+
+        encounter_data = encounter_as_dict["data"]
+
+        return all(
+            encounter_data[field] for field in outcome_fields if field in encounter_data
+        )
+
+    def add(self, encounter_as_dict: dict):
+        """
+        encounter_as_dict (dict):
+            dict representation of the Encounter added to the end of the list
+        """
+
+        position = len(self.entries)
+
+        if self.is_completion(encounter_as_dict=encounter_as_dict):
+            completed_key = (encounter_as_dict["type"], encounter_as_dict["data"]["identifier"])
+            type_completions = self.completions.setdefault(completed_key[0], {})
+            type_completions[completed_key[1]] = type_completions.get(completed_key[1], 0) + 1
+            self._availability_updating_(*completed_key)
+        else:
+            completed_key = None
+
+        unlocked_keys = tuple(self.iter_unlockables(encounter_as_dict=encounter_as_dict))
+        for type_name, identifier in unlocked_keys:
+            self.unlocked_by.setdefault(type_name, {}).setdefault(
+                identifier, []
+            ).append(position)
+            self._availability_updating_(type_name, identifier)
+
+        self.entries.append((completed_key, unlocked_keys))
+
+    def remove(self):
+        """
+        Forgets the Encounter at the end of the list
+        """
+
+        completed_key, unlocked_keys = self.entries.pop()
+        position = len(self.entries)
+
+        for type_name, identifier in reversed(unlocked_keys):
+            type_unlocked_by = self.unlocked_by[type_name]
+            assert type_unlocked_by[identifier][-1] == position
+            type_unlocked_by[identifier].pop()
+            if not type_unlocked_by[identifier]:
+                del type_unlocked_by[identifier]
+            self._availability_updating_(type_name, identifier)
+
+        if completed_key is not None:
+            type_completions = self.completions[completed_key[0]]
+            type_completions[completed_key[1]] -= 1
+            if not type_completions[completed_key[1]]:
+                del type_completions[completed_key[1]]
+            self._availability_updating_(*completed_key)
+
+    def _availability_updating_(self, type_name: str, identifier):
+        """
+        This function should only be used by UnlockGraph.
+        Use at your own risk.
+
+        Puts the Encounter among the available ones,
+        or takes it out, after it was unlocked or completed
+        """
+
+        type_available = self.available.setdefault(type_name, {})
+
+        if (
+            identifier in self.unlocked_by.get(type_name, {})
+            and identifier not in self.completions.get(type_name, {})
+        ):
+            type_available[identifier] = None
+        else:
+            type_available.pop(identifier, None)
+
+    def is_available(self, type_name: str, identifier) -> bool:
+        """
+        Returns whether the Encounter with the type name and identifier
+        is unlocked and not completed yet (bool)
+        """
+
+        return identifier in self.available.get(type_name, {})
+
+    def get_available(self, type_name: str):
+        """
+        Returns the identifiers of the Encounters with the type name
+        unlocked and not completed yet, in order of unlocking,
+        as a live view (dict keys)
+        """
+
+        return self.available.get(type_name, {}).keys()
+
+    def get_unlocked_by(self, type_name: str, identifier) -> list:
+        """
+        Returns the positions of the Encounters that unlocked
+        the Encounter with the type name and identifier (list of int)
+        """
+
+        return list(self.unlocked_by.get(type_name, {}).get(identifier, ()))
+
+
+class PersistentVector:
+    """
+    An immutable sequence of which every change is a new version,
+    sharing all unchanged parts with the version it was made from
+
+    Entries are kept in a trie of tuples of up to 32 entries or nodes,
+    plus a tail tuple with the last up to 32 entries.
+    Appending, removing the last entry and replacing an entry
+    copy only the tail or the nodes on the path to the entry,
+    so keeping many versions costs memory by their changes only.
+    """
+
+    bits = 5
+    branching = 1 << bits
+    mask = branching - 1
+
+    def __init__(self, entries=()):
+        """
+        entries (iterable):
+            the entries of the first version, in order
+        """
+
+        entries = list(entries)
+
+        # the tail holds the last entries, 1 to branching of them
+        tail_offset = ((len(entries) - 1) >> self.bits) << self.bits if entries else 0
+
+        nodes = [
+            tuple(entries[index:index + self.branching])
+            for index in range(0, tail_offset, self.branching)
+        ]
+        shift = self.bits
+        while len(nodes) > self.branching:
+            nodes = [
+                tuple(nodes[index:index + self.branching])
+                for index in range(0, len(nodes), self.branching)
+            ]
+            shift += self.bits
+
+        self.length = len(entries)
+        self.shift = shift
+        self.root = tuple(nodes)
+        self.tail = tuple(entries[tail_offset:])
+
+    @classmethod
+    def _version_making_(
+        cls,
+        length: int,
+        shift: int,
+        root: tuple,
+        tail: tuple
+    ):
+        """
+        This function should only be used by PersistentVector.
+        Use at your own risk.
+
+        Returns a new version from its parts, without copying them
+        (PersistentVector)
+        """
+
+        version = cls.__new__(cls)
+        version.length = length
+        version.shift = shift
+        version.root = root
+        version.tail = tail
+
+        return version
+
+    def __len__(self) -> int:
+        return self.length
+
+    def tail_offset(self) -> int:
+        """
+        Returns the index of the first entry in the tail (int)
+        """
+
+        return self.length - len(self.tail)
+
+    def __getitem__(self, index: int):
+        """
+        index (int):
+            position of the entry to get
+
+        Returns the entry
+        """
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("vector index out of range")
+
+        if index >= self.tail_offset():
+            return self.tail[index - self.tail_offset()]
+
+        node = self.root
+        for level in range(self.shift, 0, -self.bits):
+            node = node[(index >> level) & self.mask]
+
+        return node[index & self.mask]
+
+    def __iter__(self):
+        yield from self._leaves_iterating_(node=self.root, level=self.shift)
+        yield from self.tail
+
+    def _leaves_iterating_(self, node: tuple, level: int):
+        """
+        This function should only be used by PersistentVector.
+        Use at your own risk.
+
+        Yields the entries in the trie below the node, in order
+        """
+
+        if level == 0:
+            yield from node
+            return
+
+        for child in node:
+            yield from self._leaves_iterating_(node=child, level=level - self.bits)
+
+    def append(self, entry):
+        """
+        entry: the entry to add at the end
+
+        Returns the new version (PersistentVector)
+        """
+
+        if len(self.tail) < self.branching:
+            return self._version_making_(
+                length=self.length + 1,
+                shift=self.shift,
+                root=self.root,
+                tail=self.tail + (entry,)
+            )
+
+        # the full tail moves into the trie, growing it a level if needed
+        if (self.length >> self.bits) > (1 << self.shift):
+            root = (self.root, self._path_making_(level=self.shift, node=self.tail))
+            shift = self.shift + self.bits
+        else:
+            root = self._tail_pushing_(level=self.shift, node=self.root)
+            shift = self.shift
+
+        return self._version_making_(
+            length=self.length + 1,
+            shift=shift,
+            root=root,
+            tail=(entry,)
+        )
+
+    def _path_making_(self, level: int, node: tuple) -> tuple:
+        """
+        This function should only be used by PersistentVector.
+        Use at your own risk.
+
+        Returns the node wrapped in single child nodes down from level (tuple)
+        """
+
+        for _ in range(0, level, self.bits):
+            node = (node,)
+
+        return node
+
+    def _tail_pushing_(self, level: int, node: tuple) -> tuple:
+        """
+        This function should only be used by append.
+        Use at your own risk.
+
+        Returns a copy of the node with the tail added to the trie below it
+        (tuple)
+        """
+
+        child_index = ((self.length - 1) >> level) & self.mask
+
+        if level == self.bits:
+            child = self.tail
+        elif child_index < len(node):
+            child = self._tail_pushing_(level=level - self.bits, node=node[child_index])
+        else:
+            child = self._path_making_(level=level - self.bits, node=self.tail)
+
+        return node[:child_index] + (child,) + node[child_index + 1:]
+
+    def pop(self):
+        """
+        Returns the new version without the last entry (PersistentVector)
+        """
+
+        assert self.length, "pop from empty vector"
+
+        if self.length == 1:
+            return type(self)()
+
+        if len(self.tail) > 1:
+            return self._version_making_(
+                length=self.length - 1,
+                shift=self.shift,
+                root=self.root,
+                tail=self.tail[:-1]
+            )
+
+        # the last leaf of the trie becomes the tail
+        tail = self._leaf_finding_(index=self.length - 2)
+        root = self._tail_popping_(level=self.shift, node=self.root)
+        if root is None:
+            root = ()
+        shift = self.shift
+        if shift > self.bits and len(root) == 1:
+            root = root[0]
+            shift -= self.bits
+
+        return self._version_making_(
+            length=self.length - 1,
+            shift=shift,
+            root=root,
+            tail=tail
+        )
+
+    def _leaf_finding_(self, index: int) -> tuple:
+        """
+        This function should only be used by PersistentVector.
+        Use at your own risk.
+
+        Returns the leaf in the trie holding the entry at index (tuple)
+        """
+
+        node = self.root
+        for level in range(self.shift, 0, -self.bits):
+            node = node[(index >> level) & self.mask]
+
+        return node
+
+    def _tail_popping_(self, level: int, node: tuple):
+        """
+        This function should only be used by pop.
+        Use at your own risk.
+
+        Returns a copy of the node without the last leaf below it,
+        or None if nothing is left of the node
+        """
+
+        child_index = ((self.length - 2) >> level) & self.mask
+
+        if level > self.bits:
+            child = self._tail_popping_(level=level - self.bits, node=node[child_index])
+            if child is not None:
+                return node[:child_index] + (child,)
+
+        if child_index == 0:
+            return None
+
+        return node[:child_index]
+
+    def set(self, index: int, entry):
+        """
+        index (int): position of the entry to replace
+        entry: the entry to put there
+
+        Returns the new version (PersistentVector)
+        """
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("vector index out of range")
+
+        if index >= self.tail_offset():
+            tail_index = index - self.tail_offset()
+            return self._version_making_(
+                length=self.length,
+                shift=self.shift,
+                root=self.root,
+                tail=self.tail[:tail_index] + (entry,) + self.tail[tail_index + 1:]
+            )
+
+        return self._version_making_(
+            length=self.length,
+            shift=self.shift,
+            root=self._entry_setting_(level=self.shift, node=self.root, index=index, entry=entry),
+            tail=self.tail
+        )
+
+    def _entry_setting_(self, level: int, node: tuple, index: int, entry) -> tuple:
+        """
+        This function should only be used by set.
+        Use at your own risk.
+
+        Returns a copy of the node with the entry at index replaced (tuple)
+        """
+
+        child_index = (index >> level) & self.mask
+
+        if level == 0:
+            child = entry
+        else:
+            child = self._entry_setting_(
+                level=level - self.bits,
+                node=node[child_index],
+                index=index,
+                entry=entry
+            )
+
+        return node[:child_index] + (child,) + node[child_index + 1:]
+
+    def truncate(self, length: int):
+        """
+        length (int): number of entries to keep from the start
+
+        Returns the new version (PersistentVector)
+        """
+
+        assert isinstance(length, int)
+        assert 0 <= length <= self.length
+
+        version = self
+        while len(version) > length:
+            version = version.pop()
+
+        return version
+
+
+class EditHistory:
+    """
+    Versions of an encounter list, for undoing and redoing changes
+
+    Every version is a PersistentVector of encounter dicts,
+    so versions share the encounters they have in common.
+    Each version is kept with the index of its first encounter
+    that differs from the version before it,
+    so moving between versions only touches the encounters after that.
+    """
+
+    # number of versions kept, the oldest ones are dropped past it
+    version_limit = 1000
+
+    def __init__(self, encounter_dicts=(), version_limit: int = None):
+        """
+        encounter_dicts (iterable of dict):
+            dict representations of the encounters of the first version
+        version_limit (int):
+            number of versions to keep
+        """
+
+        if version_limit is not None:
+            assert isinstance(version_limit, int)
+            assert version_limit > 0
+            self.version_limit = version_limit
+
+        # (version, index of its first change) tuples, oldest first
+        self.versions = [(PersistentVector(encounter_dicts), 0)]
+        self.position = 0
+
+    def get_version(self) -> PersistentVector:
+        """
+        Returns the current version (PersistentVector)
+        """
+
+        return self.versions[self.position][0]
+
+    def record(self, version: PersistentVector, change_index: int):
+        """
+        version (PersistentVector): the version after a change
+        change_index (int): index of the first encounter that changed
+
+        Makes the version the current one, forgetting any undone versions.
+        """
+
+        assert isinstance(version, PersistentVector)
+        assert isinstance(change_index, int)
+
+        del self.versions[self.position + 1:]
+        self.versions.append((version, change_index))
+
+        if len(self.versions) > self.version_limit:
+            del self.versions[:len(self.versions) - self.version_limit]
+
+        self.position = len(self.versions) - 1
+
+    def append(self, encounter_as_dict: dict):
+        """
+        encounter_as_dict (dict): dict representation of an added encounter
+        """
+
+        version = self.get_version()
+        self.record(version=version.append(encounter_as_dict), change_index=len(version))
+
+    def replace(self, index: int, encounter_as_dict: dict):
+        """
+        index (int): position of the changed encounter
+        encounter_as_dict (dict): dict representation of the changed encounter
+        """
+
+        self.record(
+            version=self.get_version().set(index, encounter_as_dict),
+            change_index=index
+        )
+
+    def truncate(self, length: int):
+        """
+        length (int): number of encounters left after removing the last ones
+        """
+
+        self.record(version=self.get_version().truncate(length), change_index=length)
+
+    def can_undo(self) -> bool:
+        return self.position > 0
+
+    def can_redo(self) -> bool:
+        return self.position < len(self.versions) - 1
+
+    def undo(self) -> int:
+        """
+        Goes back to the previous version.
+
+        Returns the index from which the encounters changed (int)
+        """
+
+        assert self.can_undo(), "nothing to undo"
+
+        change_index = self.versions[self.position][1]
+        self.position -= 1
+
+        return change_index
+
+    def redo(self) -> int:
+        """
+        Goes forward to the next version again.
+
+        Returns the index from which the encounters changed (int)
+        """
+
+        assert self.can_redo(), "nothing to redo"
+
+        self.position += 1
+
+        return self.versions[self.position][1]
+
+
 if __name__ == "__main__":
     print("script contains only object definitions, no functional code on its own")
@@ -1,22 +1,20 @@
 from gloommodel import (
-    AncientTechnology,
-    Character,
     CityEvent,
-    Donation,
+    EditHistory,
+    Encounter,
     EncounterByName,
     EncounterByNumber,
+    EncounterIndex,
     Event,
-    GlobalAchievement,
     GridLocation,
     IncrementalEncounterByNumber,
-    ItemDesign,
+    LazyEncounterList,
     NamedEncounterByNumber,
-    PartyAchievement,
-    Quest,
-    RoadEvent,
     Scenario,
-    Treasure
+    UnlockGraph,
+    encounter_registry
 )
+import functools
 import json
 
 
@@ -39,26 +37,6 @@ class UserInterface:
     # should be overriden in child classes
     interface_header = ""
 
-    encounter_types = (
-        CityEvent,
-        Donation,
-        Quest,
-        RoadEvent,
-        Scenario,
-        Treasure
-    )
-
-    unlockable_types = (
-        AncientTechnology,
-        Character,
-        CityEvent,
-        GlobalAchievement,
-        ItemDesign,
-        PartyAchievement,
-        RoadEvent,
-        Scenario
-    )
-
     def __init__(self):
         # enfore abstract class
         assert type(self) != UserInterface
@@ -76,6 +54,22 @@ class UserInterface:
             option_print="EXIT GloomLog"
         )
 
+    @property
+    def encounter_types(self) -> tuple:
+        """
+        Encounter classes that can be logged, as registered in gloommodel
+        """
+
+        return encounter_registry.get_types("loggable")
+
+    @property
+    def unlockable_types(self) -> tuple:
+        """
+        Encounter classes that can be unlocked, as registered in gloommodel
+        """
+
+        return encounter_registry.get_types("unlockable")
+
     def update_user_option_dict(
         self,
         option_key: str,
@@ -323,7 +317,19 @@ class UserInterfaceMain(UserInterface):
             assert isinstance(save, str)
 
         self.list_saves = list_saves
+        # summaries of the saves by save name, as far as the backend knows
+        self.save_catalog = {}
         self.save_interface = None
+        # set by whoever keeps the saves,
+        # called with the save to fork and the name of the fork
+        self.fork_save = None
+        # set by whoever keeps the saves,
+        # called with two saves, returns the differences between them
+        self.diff_saves = None
+        # set by whoever keeps the saves,
+        # called with our save and the other save to merge into it,
+        # returns the conflicts or None if the saves cannot be merged
+        self.merge_saves = None
 
         self.update_user_option_dict(
             option_key="new",
@@ -337,7 +343,22 @@ class UserInterfaceMain(UserInterface):
                 option_function=self.load_campaign_save,
                 option_print="LOAD a campaign save file"
             )
-            # implement delete, copy, rename and restore here at some point
+            self.update_user_option_dict(
+                option_key="fork",
+                option_function=self.fork_campaign_save,
+                option_print="FORK a campaign save into a parallel game world"
+            )
+            self.update_user_option_dict(
+                option_key="diff",
+                option_function=self.diff_campaign_saves,
+                option_print="DIFF the encounters of two campaign saves"
+            )
+            self.update_user_option_dict(
+                option_key="merge",
+                option_function=self.merge_campaign_saves,
+                option_print="MERGE a campaign save of the same world into another"
+            )
+            # implement delete, rename and restore here at some point
 
     def present_interface(self) -> object:
         """
@@ -367,6 +388,22 @@ class UserInterfaceMain(UserInterface):
         listSaves (list of str): list of save files already present
         """
 
+        save_file = self.ask_save_name()
+
+        self.save_interface = UserInterfaceSave(
+            save_file_name=save_file,
+            encounter_list=[CityEvent(identifier=0, choice="A")]
+        )
+
+        return self.save_interface.get_save_data()
+
+    def ask_save_name(self) -> str:
+        """
+        Ask the user for the name of a new campaign save file
+
+        Returns a name not taken yet (str)
+        """
+
         if self.list_saves:
             print("The following campaign save names are already taken:")
             print(self.tuple_to_pretty_string(
@@ -379,14 +416,168 @@ class UserInterfaceMain(UserInterface):
             if save_file in self.list_saves:
                 print("Save already exists.")
             else:
-                break
+                return save_file
 
-        self.save_interface = UserInterfaceSave(
-            save_file_name=save_file,
-            encounter_list=[CityEvent(identifier=0, choice="A")]
+    def fork_campaign_save(self) -> object:
+        """
+        Start a parallel game world from the history of a saved campaign,
+        sharing its encounters so far, and load it
+        """
+
+        if self.fork_save is None:
+            print("Campaign saves cannot be forked here.")
+            return True
+
+        print("Which save would you like to fork?")
+
+        save_file = self.multiple_choice_question(
+            options=tuple(self.list_saves)
         )
+        fork_file = self.ask_save_name()
 
-        return self.save_interface.get_save_data()
+        self.fork_save(save_file=save_file, fork_file=fork_file)
+
+        return fork_file
+
+    def diff_campaign_saves(self) -> True:
+        """
+        Show what one saved campaign has that another does not,
+        and the encounters that turned out differently
+        """
+
+        if self.diff_saves is None:
+            print("Campaign saves cannot be compared here.")
+            return True
+
+        print("Which save would you like to compare?")
+        save_file = self.multiple_choice_question(
+            options=tuple(self.list_saves)
+        )
+        print("Which save would you like to compare it with?")
+        other_file = self.multiple_choice_question(
+            options=tuple(self.list_saves)
+        )
+
+        differences = self.diff_saves(save_file=save_file, other_file=other_file)
+
+        if not differences:
+            print(f"{save_file} and {other_file} hold the same encounters.")
+            return True
+
+        print(f"From {save_file} to {other_file}:")
+        for difference in differences:
+            print(self.describe_difference(difference))
+
+        return True
+
+    @staticmethod
+    def describe_difference(difference: dict) -> str:
+        """
+        difference (dict):
+            change, type and identifier of an encounter,
+            as found by gloommodel.diff_encounters
+
+        Returns a line describing the difference (str)
+        """
+
+        description = UserInterfaceMain.describe_encounter(
+            encounter_type=difference["type"],
+            identifier=difference["identifier"]
+        )
+
+        if difference["change"] == "added":
+            return "+ " + description
+        if difference["change"] == "removed":
+            return "- " + description
+
+        changes = [
+            f"{field} {old_value!r} -> {new_value!r}"
+            for field, (old_value, new_value) in difference["outcomes"].items()
+        ]
+        if difference["unlockables"]:
+            changes.append("unlockables changed")
+        if not changes:
+            changes.append("details changed")
+
+        return "~ " + description + ": " + ", ".join(changes)
+
+    def merge_campaign_saves(self) -> object:
+        """
+        Merge what another party logged in the same world into a saved campaign,
+        show the conflicts and load the merged save
+        """
+
+        if self.merge_saves is None:
+            print("Campaign saves cannot be merged here.")
+            return True
+
+        print("Which save would you like to merge into?")
+        save_file = self.multiple_choice_question(
+            options=tuple(self.list_saves)
+        )
+        print("Which save would you like to merge from?")
+        other_file = self.multiple_choice_question(
+            options=tuple(self.list_saves)
+        )
+
+        conflicts = self.merge_saves(save_file=save_file, other_file=other_file)
+
+        if conflicts is None:
+            print(f"{save_file} and {other_file} have no common ancestor to merge from.")
+            return True
+
+        if conflicts:
+            print(f"Kept the encounters of {save_file} where {other_file} differs:")
+            for conflict in conflicts:
+                print(self.describe_conflict(conflict))
+
+        return save_file
+
+    @staticmethod
+    def describe_conflict(conflict: dict) -> str:
+        """
+        conflict (dict):
+            type, identifier and both versions of an encounter,
+            as found by gloommodel.merge_encounters
+
+        Returns a line describing the conflict (str)
+        """
+
+        description = "! " + UserInterfaceMain.describe_encounter(
+            encounter_type=conflict["type"],
+            identifier=conflict["identifier"]
+        )
+
+        if conflict["ours"] is None:
+            return description + ": removed here, changed there"
+        if conflict["theirs"] is None:
+            return description + ": changed here, removed there"
+
+        changes = [
+            f"{field} {our_value!r} here, {their_value!r} there"
+            for field, (our_value, their_value) in conflict["outcomes"].items()
+        ]
+        if not changes:
+            changes.append("details differ")
+
+        return description + ": " + ", ".join(changes)
+
+    @staticmethod
+    def describe_encounter(encounter_type: str, identifier) -> str:
+        """
+        encounter_type (str): type name of an encounter
+        identifier (int or str): identifier of the encounter
+
+        Returns the friendly name and identifier of the encounter (str)
+        """
+
+        encounter_class = encounter_registry.type_names.get(encounter_type)
+        if encounter_class is None:
+            friendly_name = encounter_type
+        else:
+            friendly_name = encounter_class.friendly_name.capitalize()
+
+        return f"{friendly_name} {identifier}"
 
     def load_campaign_save(self) -> str:
         """
@@ -395,33 +586,57 @@ class UserInterfaceMain(UserInterface):
 
         print("Which save would you like to load?")
 
+        for save_file in self.list_saves:
+            if save_file in self.save_catalog:
+                print(f"{save_file}: {self.describe_save(self.save_catalog[save_file])}")
+
         save_file = self.multiple_choice_question(
             options=tuple(self.list_saves)
         )
 
         return save_file
 
-    def prepare_save_interface(self, save_file: str, save_text: str):
+    @staticmethod
+    def describe_save(save_summary: dict) -> str:
+        """
+        save_summary (dict):
+            summary of a save, with its number of encounters and last encounter
+
+        Returns a short description of the save (str)
+        """
+
+        description = f"{save_summary['encounters']} encounters"
+
+        last_encounter = save_summary["last_encounter"]
+        if last_encounter is not None:
+            description += ", last " + UserInterfaceMain.describe_encounter(
+                encounter_type=last_encounter["type"],
+                identifier=last_encounter["identifier"]
+            )
+
+        return description
+
+    def prepare_save_interface(
+        self,
+        save_file: str,
+        save_text: str = None,
+        save_dict: dict = None
+    ):
         """
-        Load save information into a save interface
+        Load save information into a save interface,
+        either as text or as the already parsed save
         """
         assert isinstance(save_file, str)
-        assert isinstance(save_text, str)
+        assert (save_text is None) != (save_dict is None)
 
+        # Encounters are only built once they are used,
+        # their types are checked then, see LazyEncounterList
         try:
-            save_dict = json.loads(save_text)
-            encounter_list = []
-            for encounter_as_dict in save_dict["EnounterList"]:
-                for encounter_type in self.encounter_types:
-                    if encounter_type.__name__ == encounter_as_dict["type"]:
-                        encounter_list.append(
-                            encounter_type(
-                                fullJSON=json.dumps(encounter_as_dict)
-                            )
-                        )
-                        break
-                else:
-                    raise TypeError
+            if save_dict is None:
+                save_dict = json.loads(save_text)
+            encounters_as_dicts = save_dict["EnounterList"]
+            assert isinstance(encounters_as_dicts, list)
+            encounter_list = LazyEncounterList(encounters_as_dicts)
         except BaseException:
             print("Invalid save file :(")
             error_exit_interfaces()
@@ -441,20 +656,45 @@ class UserInterfaceSave(UserInterface):
         super().__init__()
 
         assert isinstance(save_file_name, str)
-        assert isinstance(encounter_list, list)
-        for encounter in encounter_list:
-            assert type(encounter) in self.encounter_types
+        # a plain list is checked and wrapped,
+        # a LazyEncounterList is checked when its encounters are built
+        if isinstance(encounter_list, list):
+            for encounter in encounter_list:
+                assert isinstance(encounter, Encounter)
+                assert type(encounter).loggable
+            encounter_list = LazyEncounterList(list(encounter_list))
+        assert isinstance(encounter_list, LazyEncounterList)
 
         self.update_user_option_dict(
             option_key="list",
             option_function=self.list_encounters,
             option_print="LIST encounters so far"
         )
+        self.update_user_option_dict(
+            option_key="present",
+            option_function=self.present_available_encounters,
+            option_print="PRESENT available encounters"
+        )
         self.update_user_option_dict(
             option_key="add",
             option_function=self.add_encounter_to_save,
             option_print="ADD new encounter"
         )
+        self.update_user_option_dict(
+            option_key="undo",
+            option_function=self.undo_change,
+            option_print="UNDO last change"
+        )
+        self.update_user_option_dict(
+            option_key="redo",
+            option_function=self.redo_change,
+            option_print="REDO undone change"
+        )
+        self.update_user_option_dict(
+            option_key="backup",
+            option_function=self.inspect_backups,
+            option_print="Inspect BACKUP save files"
+        )
         self.update_user_option_dict(
             option_key="close",
             option_function=self.close_interface,
@@ -462,23 +702,67 @@ class UserInterfaceSave(UserInterface):
         )
 
         # TODO: implement here at some point:
-        # PRESENT available encounters
         # show MAP of scenarios
         # show LOG of progress (achievements, retires, sanctuary donations etc.)
         # SAVE progress
         # REMOVE encounters from save file
         # EDIT encounter properties
         # DELETE this save
-        # Inspect BACKUP save file -> Maybe advanced interface
         # Try to FIX broken save file -> Maybe advanced interface
 
         # self.save_file_name is slightly redundant for now,
         # but will be usefull with renaming saves
         self.save_file_name = save_file_name
         self.encounter_list = encounter_list
+        # the encounter index, unlock graph and edit history
+        # are built on first use, so opening a save does not walk it
+
+        # set by whoever keeps the saves, called with no arguments
+        # and with the generation of a backup respectively
+        self.check_backups = None
+        self.load_backup = None
 
         self.interface_header = f"What would you like to do with campaign save '{self.save_file_name}'?"
 
+    @functools.cached_property
+    def encounter_index(self) -> EncounterIndex:
+        """
+        Index of the encounters by type and identifier,
+        built from the types and identifiers only,
+        so no Encounter in a lazy list has to be built for it
+        """
+
+        return EncounterIndex(
+            self.encounter_list.get_key(index)
+            for index in range(len(self.encounter_list))
+        )
+
+    @functools.cached_property
+    def unlock_graph(self) -> UnlockGraph:
+        """
+        What the encounters unlocked, built from their dicts
+        and kept up to date along with the index
+        """
+
+        return UnlockGraph(self.encounter_list.iter_dicts())
+
+    @functools.cached_property
+    def edit_history(self) -> EditHistory:
+        """
+        Versions of the encounter list, which share their encounters,
+        so every change can be undone at little memory cost.
+        From then on, the encounter list follows the current version,
+        so the campaign is only held by the edit history.
+        """
+
+        edit_history = EditHistory(self.encounter_list.iter_dicts())
+        self.encounter_list.follow(
+            edit_history.get_version(),
+            change_index=len(self.encounter_list)
+        )
+
+        return edit_history
+
     def list_encounters(self):
         """
         Print all the encounters so far in the campaign
@@ -486,13 +770,101 @@ class UserInterfaceSave(UserInterface):
 
         print("Your encounters so far were:")
 
-        for encounter in self.encounter_list:
-            print(encounter)
-            for unlockable in encounter.unlockables:
-                print(f"+ {unlockable}")
+        # encounters of a loaded save are checked once they are built
+        try:
+            for encounter in self.encounter_list:
+                print(encounter)
+                for unlockable in encounter.unlockables:
+                    print(f"+ {unlockable}")
+        except (KeyError, TypeError):
+            print("Invalid save file :(")
+            error_exit_interfaces()
+
+        return True
+
+    def present_available_encounters(self):
+        """
+        Print the encounters unlocked so far in the campaign
+        that can still be played
+        """
+
+        available_encounters = [
+            (encounter_type, self.unlock_graph.get_available(encounter_type.__name__))
+            for encounter_type in self.encounter_types
+            if encounter_type.unlockable
+        ]
+
+        if not any(identifiers for _, identifiers in available_encounters):
+            print("No unlocked encounters are left to play.")
+            return True
+
+        print("Unlocked encounters left to play:")
+
+        for encounter_type, identifiers in available_encounters:
+            if identifiers:
+                print(
+                    f"{encounter_type.friendly_name.capitalize()}: "
+                    + ", ".join(str(identifier) for identifier in identifiers)
+                )
+
+        return True
+
+    def inspect_backups(self):
+        """
+        Print the encounters of an earlier version of the campaign save
+        """
+
+        if self.check_backups is None:
+            backup_count = 0
+        else:
+            backup_count = self.check_backups()
+
+        if not backup_count:
+            print("There are no backups of this campaign save yet.")
+            return True
+
+        print("Backups are numbered from the most recent one.")
+        generation = int(self.multiple_choice_question(
+            options=tuple(str(i) for i in range(1, backup_count + 1)),
+            question="Which backup would you like to inspect?",
+            range_options=f"(1-{backup_count})"
+        ))
+
+        backup_list = LazyEncounterList(
+            self.load_backup(generation=generation)["EnounterList"]
+        )
+
+        print(
+            f"Backup {generation} has {len(backup_list)} encounters, "
+            f"the campaign save has {len(self.encounter_list)} now."
+        )
+        print("The encounters in the backup were:")
+
+        try:
+            for encounter in backup_list:
+                print(encounter)
+                for unlockable in encounter.unlockables:
+                    print(f"+ {unlockable}")
+        except Exception:
+            print("Invalid backup :(")
 
         return True
 
+    def has_encounter(self, encounter_class: type, identifier) -> bool:
+        """
+        encounter_class (child class of Encounter):
+            the type of encounter to look for
+        identifier (int or str):
+            the identifier of the encounter to look for
+
+        Returns whether the campaign logged such an encounter already (bool)
+        """
+
+        return self.encounter_index.has(
+            type_name=encounter_class.__name__,
+            identifier=identifier
+        )
+
     def get_encounter_basics(self, unlockable: bool = False):
         """Query the user for basic information of an encounter
         Basic inforormation is the data (also) required for unlockables.
@@ -507,21 +879,20 @@ class UserInterfaceSave(UserInterface):
         """
 
         if unlockable:
-            type_list = self.unlockable_types
+            type_flag = "unlockable"
         else:
-            type_list = self.encounter_types
+            type_flag = "loggable"
 
         new_encounter_friendly_name = self.multiple_choice_question(
             question="What type of encounter?",
             options=tuple(encounter_type.friendly_name
-                          for encounter_type in type_list)
+                          for encounter_type in encounter_registry.get_types(type_flag))
         )
 
-        # slightly hacky way of converting strings to class types
-        for new_encounter_class in type_list:
-            if new_encounter_class.friendly_name == new_encounter_friendly_name:
-                break
-        else:
+        new_encounter_class = encounter_registry.friendly_names.get(
+            new_encounter_friendly_name
+        )
+        if not getattr(new_encounter_class, type_flag, False):
             print("Undefined class obtained")
             error_exit_interfaces()
 
@@ -531,12 +902,13 @@ class UserInterfaceSave(UserInterface):
         # TODO refactor this and related stuff to Pythonic try/catch duck typing
         if issubclass(new_encounter_class, EncounterByNumber):
             if issubclass(new_encounter_class, IncrementalEncounterByNumber):
-                for encounter in reversed(self.encounter_list):
-                    if type(encounter) == new_encounter_class:
-                        new_encounter_info.append(encounter.identifier + 1)
-                        break
-                else:
+                max_identifier = self.encounter_index.get_max_identifier(
+                    new_encounter_class.__name__
+                )
+                if max_identifier is None:
                     new_encounter_info.append(1)
+                else:
+                    new_encounter_info.append(max_identifier + 1)
             else:
                 new_encounter_info.append(
                     int(
@@ -571,15 +943,15 @@ class UserInterfaceSave(UserInterface):
                 GridLocation(
                     self.multiple_choice_question(
                         question="What is the character of that scenario's location?",
-                        # TODO: refactor to single defenition
-                        options=tuple(chr(i) for i in range(65, 80)),
+                        options=GridLocation.characters,
                         range_options="(A-O)"
                     ),
                     int(
                         self.multiple_choice_question(
                             question="What is the identifier of that scenario's location?",
-                            # TODO: refactor to single defenition
-                            options=tuple(str(i) for i in range(1, 19)),
+                            options=tuple(
+                                str(i) for i in GridLocation.identifiers
+                            ),
                             range_options="(1-18)")
                     )
                 )
@@ -624,33 +996,195 @@ class UserInterfaceSave(UserInterface):
             unlocked_encounter = self.get_encounter_basics(unlockable=True)
             new_encounter.unlockables.append(unlocked_encounter)
 
-        self.encounter_list.append(new_encounter)
+        return self.append_encounter(new_encounter=new_encounter)
 
-        return self.get_save_data()
+    def append_encounter(self, new_encounter: Encounter):
+        """
+        new_encounter (Encounter): encounter to add at the end of the campaign
+
+        Adds the encounter to the edit history, which the encounter list
+        follows, and to the index and the unlock graph alike,
+        so the save data and undo include it.
+
+        Returns the save data of the campaign,
+        with the save record of the added encounter
+        """
+
+        assert isinstance(new_encounter, Encounter)
+
+        # built from the encounter list on first use,
+        # so brought up to date before the list changes
+        encounter_as_dict = new_encounter.toDict()
+        self.encounter_index.add(
+            type_name=type(new_encounter).__name__,
+            identifier=new_encounter.identifier
+        )
+        self.unlock_graph.add(encounter_as_dict=encounter_as_dict)
+        self.edit_history.append(encounter_as_dict)
+        self.encounter_list.follow(
+            self.edit_history.get_version(),
+            change_index=len(self.encounter_list)
+        )
+
+        save_file_name, save_info, save_options = self.get_save_data()
+        save_options["save_records"] = [
+            self.get_save_record(index=len(self.encounter_list) - 1)
+        ]
+
+        return (save_file_name, save_info, save_options)
+
+    def undo_change(self):
+        """
+        Take back the last change to the campaign save
+        """
+
+        if not self.edit_history.can_undo():
+            print("There is nothing to undo.")
+            return True
+
+        return self.apply_version(change_index=self.edit_history.undo())
+
+    def redo_change(self):
+        """
+        Make the last undone change to the campaign save again
+        """
+
+        if not self.edit_history.can_redo():
+            print("There is nothing to redo.")
+            return True
+
+        return self.apply_version(change_index=self.edit_history.redo())
+
+    def apply_version(self, change_index: int):
+        """
+        change_index (int):
+            index from which the current version of the edit history
+            differs from the encounter list
+
+        Makes the encounter list follow the current version and brings
+        its index in line, touching only the encounters from change_index.
+        The save records cover the same encounters,
+        so the change is saved as incrementally as an added encounter.
+
+        Returns the save data of the campaign
+        """
+
+        assert isinstance(change_index, int)
+
+        version = self.edit_history.get_version()
+
+        for index in reversed(range(change_index, len(self.encounter_list))):
+            type_name, identifier = self.encounter_list.get_key(index)
+            self.encounter_index.remove(type_name=type_name, identifier=identifier)
+            self.unlock_graph.remove()
+        self.encounter_list.follow(version, change_index=change_index)
+
+        for index in range(change_index, len(version)):
+            encounter_as_dict = version[index]
+            self.encounter_index.add(
+                type_name=encounter_as_dict["type"],
+                identifier=encounter_as_dict["data"]["identifier"]
+            )
+            self.unlock_graph.add(encounter_as_dict=encounter_as_dict)
+
+        save_file_name, save_info, save_options = self.get_save_data()
+        # a record past the end of the list removes what was there
+        save_options["save_records"] = [
+            self.get_save_record(index=index)
+            for index in range(change_index, max(len(self.encounter_list), change_index + 1))
+        ]
+
+        return (save_file_name, save_info, save_options)
+
+    def get_save_record(self, index: int) -> str:
+        """
+        index (int):
+            position in the encounter list that changed
+
+        Convert a single change to the encounter list to a one line record,
+        so a backend can journal it instead of rewriting the whole save.
+        The record cuts the list back to index and appends the encounter
+        at that position, if there still is one.
+        """
+
+        assert isinstance(index, int)
+
+        if index < len(self.encounter_list):
+            encounter_as_dict = self.encounter_list.get_dict(index)
+        else:
+            encounter_as_dict = None
+
+        return json.dumps(
+            {"index": index, "encounter": encounter_as_dict},
+            sort_keys=True
+        )
+
+    def get_save_summary(self) -> dict:
+        """
+        Returns the number of encounters in the campaign, the number per type
+        and the type and identifier of the last one (dict)
+        """
+
+        if self.encounter_list:
+            type_name, identifier = self.encounter_list.get_key(-1)
+            last_encounter = {"type": type_name, "identifier": identifier}
+        else:
+            last_encounter = None
+
+        return {
+            "encounters": len(self.encounter_list),
+            "types": dict(self.encounter_index.counts),
+            "last_encounter": last_encounter
+        }
 
     def get_save_data(self):
         """
-        Convert a list of Encounters to saveable text.
+        Convert a list of Encounters to saveable text,
+        handed out as an iterator of text chunks that are encoded on demand.
+        Comes with extra save options, such as a summary of the save.
+        """
+
+        # the chunks stick to the encounters so far, even when they are
+        # only written after a change, which makes the list follow a new version
+        return (
+            self.save_file_name,
+            self.iter_save_chunks(encounter_dicts=self.encounter_list.get_dicts()),
+            {"save_summary": self.get_save_summary()}
+        )
+
+    def iter_save_chunks(self, encounter_dicts=None):
+        """
+        encounter_dicts (sequence of dict):
+            dict representations of the encounters to save,
+            the ones of the encounter list when left out
+
+        Yields the save text in chunks of one encounter each,
+        so the whole save never has to be in memory as one string.
+        Joined, the chunks are exactly the indented JSON of the save.
         """
 
-        encounters_as_dicts = []
+        if encounter_dicts is None:
+            encounter_dicts = self.encounter_list.get_dicts()
+
+        if not len(encounter_dicts):
+            yield json.dumps({"EnounterList": []}, indent=2)
+            return
+
+        separator = '{\n  "EnounterList": [\n    '
 
         try:
-            # there is some juggling around to and from JSON here
-            # it's not pretty,
-            # but it works well to get everything uniformly JSON serialized
-            for encounter in self.encounter_list:
-                encounter_json = encounter.toJSON()
-                encounter_as_dict = json.loads(encounter_json)
-                encounters_as_dicts.append(encounter_as_dict)
-        except BaseException:
+            for encounter_as_dict in encounter_dicts:
+                # strings in JSON cannot hold a raw newline,
+                # so only the line breaks of the layout are indented
+                yield separator + json.dumps(
+                    encounter_as_dict,
+                    indent=2,
+                    sort_keys=True
+                ).replace("\n", "\n    ")
+                separator = ",\n    "
+        # not BaseException, closing the iterator early raises GeneratorExit
+        except Exception:
             print("Invalid encounters created :(")
             error_exit_interfaces()
 
-        save_info = json.dumps(
-            {"EnounterList": encounters_as_dicts},
-            indent=2,
-            sort_keys=True
-        )
-
-        return (self.save_file_name, save_info)
+        yield "\n  ]\n}"
@@ -1,10 +1,13 @@
+import json
 import os
 import logging
 import unittest
+from unittest import mock
 import sys
 sys.path.insert(0, '../')
 sys.path.insert(0, './')
-from gloombackend import Backend  # noqa
+from gloombackend import Backend, BackendMemory, Storage  # noqa
+from gloomformat import SaveCompression  # noqa
 
 logging.basicConfig(level=logging.WARN, format='')
 
@@ -85,6 +88,19 @@ class TestGloomlogBackend(unittest.TestCase):
             contents=self.test_file_text
         )
 
+        # the backup is replaced in one step, it is never missing
+        with open(self.test_file_name + self.backend.new_extension, "x") as file:
+            file.write("")
+
+        with mock.patch("os.remove") as mock_remove:
+            self.backend._backup_creation_(save_file=self.test_file_name)
+            mock_remove.assert_not_called()
+
+        self.helper_assert_file_contents(
+            file_name=self.test_file_name + self.backend.backup_extension,
+            contents=self.test_file_text
+        )
+
         os.remove(self.test_file_name + self.backend.backup_extension)
         os.remove(self.test_file_name)
 
@@ -145,5 +161,1339 @@ class TestGloomlogBackend(unittest.TestCase):
         os.rmdir(self.backend.save_path)
 
 
+class TestGloomlogBackendJournal(unittest.TestCase):
+    """
+    Test GloomLog's Backend class when journaling
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up variables for testing
+        """
+
+        logging.info(
+            "Setting up variables for testing GloomLog's journaling Backend")
+
+        cls.backend = Backend(journal=True)
+        cls.test_file_name = "test"
+        cls.test_full_file_name = cls.backend.save_path + "/" + \
+            cls.test_file_name + cls.backend.save_extension
+
+        cls.save_dict = {"EnounterList": [{"data": 1}]}
+        cls.save_records = [
+            json.dumps({"index": 1, "encounter": {"data": 2}}),
+            json.dumps({"index": 2, "encounter": {"data": 3}}),
+            json.dumps({"index": 2, "encounter": None})
+        ]
+
+    def tearDown(self):
+        """
+        Remove the save directory and everything in it
+        """
+
+        for save_file in os.listdir(self.backend.save_path):
+            os.remove(self.backend.save_path + "/" + save_file)
+        os.rmdir(self.backend.save_path)
+
+    def test_journal_replay(self):
+        """
+        Test whether journaled save records are replayed on load
+        """
+
+        logging.info(
+            "Testing whether journaled save records are replayed on load")
+
+        self.backend.save_to_file(
+            save_file=self.test_file_name,
+            save_info=json.dumps(self.save_dict)
+        )
+
+        for save_record in self.save_records:
+            self.backend.save_to_file(
+                save_file=self.test_file_name,
+                save_info="",
+                save_records=[save_record]
+            )
+
+        self.assertFalse(os.path.exists(
+            self.test_full_file_name + self.backend.backup_extension))
+
+        save_text = self.backend.load_save_file_as_text(
+            save_file=self.test_file_name)
+
+        self.assertEqual(
+            json.loads(save_text),
+            {"EnounterList": [{"data": 1}, {"data": 2}]}
+        )
+
+    def test_journal_compaction(self):
+        """
+        Test whether an outgrown journal is compacted into the save file
+        """
+
+        logging.info(
+            "Testing whether an outgrown journal is compacted into the save file")
+
+        self.backend.save_to_file(
+            save_file=self.test_file_name,
+            save_info=json.dumps(self.save_dict)
+        )
+
+        Backend(journal=True, journal_limit=100).save_to_file(
+            save_file=self.test_file_name,
+            save_info="compacted",
+            save_records=self.save_records
+        )
+
+        self.assertFalse(os.path.exists(
+            self.test_full_file_name + self.backend.journal_extension))
+
+        with open(self.test_full_file_name, "r") as file:
+            self.assertEqual(file.read(), "compacted")
+
+
+class TestGloomlogBackendBinary(unittest.TestCase):
+    """
+    Test GloomLog's Backend class with binary save files
+    """
+
+    def test_binary_save(self):
+        """
+        Test whether binary and JSON saves can be loaded side by side
+        """
+
+        logging.info(
+            "Testing whether binary and JSON saves can be loaded side by side")
+
+        with open("TestLongCampaignSave.json", "r") as file:
+            save_text = file.read()
+
+        Backend(save_format="binary").save_to_file(
+            save_file="binary",
+            save_info=save_text
+        )
+        Backend().save_to_file(save_file="text", save_info=save_text)
+
+        backend = Backend()
+
+        self.assertEqual(sorted(backend.check_saves()), ["binary", "text"])
+
+        for save_file in ("binary", "text"):
+            self.assertEqual(
+                backend.load_save_file_as_text(save_file=save_file),
+                save_text
+            )
+
+        with open(backend.save_path + "/binary" + backend.save_extension, "rb") as file:
+            self.assertTrue(file.read().startswith(b"GLMB"))
+
+        for save_file in os.listdir(backend.save_path):
+            os.remove(backend.save_path + "/" + save_file)
+        os.rmdir(backend.save_path)
+
+
+class TestGloomlogBackendCatalog(unittest.TestCase):
+    """
+    Test GloomLog's Backend class when keeping a catalog
+    """
+
+    def setUp(self):
+        """
+        Set up variables for testing
+        """
+
+        logging.info(
+            "Setting up variables for testing GloomLog's Backend catalog")
+
+        self.backend = Backend(catalog=True, journal=True)
+
+        with open("TestMultiEncounterSave.json", "r") as file:
+            self.save_text = file.read()
+
+    def tearDown(self):
+        """
+        Remove the save directory and everything in it
+        """
+
+        for save_file in os.listdir(self.backend.save_path):
+            os.remove(self.backend.save_path + "/" + save_file)
+        os.rmdir(self.backend.save_path)
+
+    def test_catalog_update(self):
+        """
+        Test whether saving updates the catalog without rescanning the directory
+        """
+
+        logging.info(
+            "Testing whether saving updates the catalog without rescanning the directory")
+
+        self.backend.save_to_file(save_file="multi", save_info=self.save_text)
+        self.backend.save_to_file(
+            save_file="multi",
+            save_info="",
+            save_records=[json.dumps({
+                "index": 8,
+                "encounter": {"type": "Donation", "data": {"identifier": 3, "unlockables": []}}
+            })],
+            save_summary={
+                "encounters": 9,
+                "last_encounter": {"type": "Donation", "identifier": 3}
+            }
+        )
+
+        with mock.patch("os.listdir") as mock_listdir:
+            self.assertEqual(self.backend.check_saves(), ["multi"])
+            self.assertEqual(Backend(catalog=True).check_saves(), ["multi"])
+            mock_listdir.assert_not_called()
+
+        summary = self.backend.get_catalog()["multi"]
+
+        self.assertEqual(summary["encounters"], 9)
+        self.assertEqual(summary["last_encounter"]["identifier"], 3)
+        self.assertEqual(summary["format"], "json")
+
+        # a catalog that fails to be written leaves the old one in place
+        with mock.patch.object(Backend, "write_new_text_file", side_effect=OSError):
+            with self.assertRaises(OSError):
+                self.backend.write_catalog(catalog_saves={})
+        with mock.patch("os.listdir") as mock_listdir:
+            self.assertEqual(Backend(catalog=True).check_saves(), ["multi"])
+            mock_listdir.assert_not_called()
+
+    def test_catalog_rebuild(self):
+        """
+        Test whether the catalog is rebuilt after changes behind its back
+        """
+
+        logging.info(
+            "Testing whether the catalog is rebuilt after changes behind its back")
+
+        self.backend.save_to_file(save_file="multi", save_info=self.save_text)
+
+        Backend(save_format="binary").save_to_file(
+            save_file="binary",
+            save_info=self.save_text
+        )
+
+        catalog = self.backend.get_catalog()
+
+        self.assertEqual(sorted(catalog), ["binary", "multi"])
+        self.assertEqual(catalog["binary"]["format"], "binary")
+        self.assertEqual(catalog["binary"]["encounters"], 8)
+        self.assertEqual(
+            catalog["binary"]["last_encounter"],
+            {"type": "RoadEvent", "identifier": 2}
+        )
+
+
+class TestGloomlogBackendHeader(unittest.TestCase):
+    """
+    Test GloomLog's Backend class when writing save headers
+    """
+
+    def tearDown(self):
+        """
+        Remove the save directory and everything in it
+        """
+
+        for save_file in os.listdir(Backend.save_path):
+            os.remove(Backend.save_path + "/" + save_file)
+        os.rmdir(Backend.save_path)
+
+    def test_header(self):
+        """
+        Test whether the header summarizes the save and follows the journal
+        """
+
+        logging.info(
+            "Testing whether the header summarizes the save and follows the journal")
+
+        with open("TestMultiEncounterSave.json", "r") as file:
+            save_text = file.read()
+
+        for save_format in Backend.save_formats:
+            backend = Backend(header=True, journal=True, save_format=save_format)
+            backend.save_to_file(save_file=save_format, save_info=save_text)
+
+            save_header = backend.read_save_header(save_file=save_format)
+
+            self.assertEqual(save_header["format"], save_format)
+            self.assertEqual(save_header["version"], backend.save_format_version)
+            self.assertEqual(save_header["encounters"], 8)
+            self.assertEqual(save_header["types"]["CityEvent"], 2)
+            self.assertEqual(
+                save_header["last_encounter"],
+                {"type": "RoadEvent", "identifier": 2}
+            )
+            self.assertEqual(
+                backend.load_save_file_as_text(save_file=save_format),
+                save_text
+            )
+
+            backend.save_to_file(
+                save_file=save_format,
+                save_info="",
+                save_records=[json.dumps({
+                    "index": 8,
+                    "encounter": {"type": "Donation", "data": {"identifier": 3, "unlockables": []}}
+                })],
+                save_summary={
+                    "encounters": 9,
+                    "types": dict(save_header["types"], Donation=3),
+                    "last_encounter": {"type": "Donation", "identifier": 3}
+                }
+            )
+
+            save_header = backend.read_save_header(save_file=save_format)
+
+            self.assertEqual(save_header["encounters"], 9)
+            self.assertEqual(save_header["types"]["Donation"], 3)
+            self.assertEqual(
+                json.loads(
+                    backend.load_save_file_as_text(save_file=save_format)
+                )["EnounterList"][-1]["type"],
+                "Donation"
+            )
+
+        self.assertIsNone(Backend.parse_save_header(save_text.encode("utf-8")))
+
+        # a summary too large for the header is left out of it
+        long_dict = {"EnounterList": [
+            {"type": "PartyAchievement", "data": {"identifier": "x" * 2000, "unlockables": []}}
+        ]}
+        backend = Backend(header=True)
+        backend.save_to_file(save_file="long", save_info=json.dumps(long_dict, indent=2))
+
+        save_header = backend.read_save_header(save_file="long")
+
+        self.assertEqual(save_header["encounters"], 1)
+        self.assertNotIn("last_encounter", save_header)
+        self.assertEqual(backend.load_save_file(save_file="long"), long_dict)
+
+        with self.assertRaises(ValueError):
+            Backend(header=True).make_save_header(
+                save_summary={"encounters": 1, "types": {}, "last_encounter": None},
+                save_format="json",
+                checksum=10 ** 2000
+            )
+
+    def test_header_streaming(self):
+        """
+        Test whether a save streamed in chunks gets the same header
+        """
+
+        logging.info(
+            "Testing whether a save streamed in chunks gets the same header")
+
+        with open("TestMultiEncounterSave.json", "r") as file:
+            save_text = file.read()
+
+        backend = Backend(header=True)
+        backend.save_to_file(save_file="whole", save_info=save_text)
+        # summarized while the chunks are written, without joining them
+        with mock.patch.object(Backend, "summarize_save_text") as mock_summarize:
+            backend.save_to_file(
+                save_file="chunks",
+                save_info=iter(save_text.splitlines(keepends=True))
+            )
+            mock_summarize.assert_not_called()
+
+        self.assertEqual(
+            backend.read_save_header(save_file="chunks"),
+            backend.read_save_header(save_file="whole")
+        )
+        self.assertEqual(
+            backend.read_save_header(save_file="chunks")["types"],
+            Backend.summarize_save_text(save_text)["types"]
+        )
+        self.assertEqual(
+            backend.load_save_file_as_text(save_file="chunks"),
+            save_text
+        )
+
+    def test_header_checksum(self):
+        """
+        Test whether loading refuses save data that does not match its header
+        """
+
+        logging.info(
+            "Testing whether loading refuses save data that does not match its header")
+
+        backend = Backend(header=True)
+        backend.save_to_file(
+            save_file="checksum",
+            save_info='{"EnounterList": []}'
+        )
+
+        file_name = backend.save_path + "/checksum" + backend.save_extension
+        with open(file_name, "r+b") as file:
+            file.seek(backend.header_size)
+            file.write(b"[")
+
+        with self.assertRaises(AssertionError):
+            backend.load_save_file_as_text(save_file="checksum")
+
+
+class TestGloomlogBackendMapped(unittest.TestCase):
+    """
+    Test GloomLog's Backend class when loading mapped save files
+    """
+
+    def tearDown(self):
+        """
+        Remove the save directory and everything in it
+        """
+
+        for save_file in os.listdir(Backend.save_path):
+            os.remove(Backend.save_path + "/" + save_file)
+        os.rmdir(Backend.save_path)
+
+    def test_load_save_file(self):
+        """
+        Test whether load_save_file parses every kind of save file
+        """
+
+        logging.info(
+            "Testing whether load_save_file parses every kind of save file")
+
+        with open("TestLongCampaignSave.json", "r") as file:
+            save_text = file.read()
+
+        backends = {
+            "text": Backend(),
+            "binary": Backend(save_format="binary"),
+            "header": Backend(header=True, save_format="binary"),
+            "journal": Backend(journal=True)
+        }
+
+        for save_file, backend in backends.items():
+            backend.save_to_file(save_file=save_file, save_info=save_text)
+
+        save_dict = json.loads(save_text)
+        encounter_as_dict = {"type": "Donation", "data": {"identifier": 3, "unlockables": []}}
+
+        save_chunks = iter(["not", "consumed"])
+
+        backends["journal"].save_to_file(
+            save_file="journal",
+            save_info=save_chunks,
+            save_records=[json.dumps({"index": 1, "encounter": encounter_as_dict})]
+        )
+
+        for save_file in backends:
+            if save_file == "journal":
+                self.assertEqual(
+                    Backend().load_save_file(save_file=save_file)["EnounterList"],
+                    save_dict["EnounterList"][:1] + [encounter_as_dict]
+                )
+            else:
+                self.assertEqual(
+                    Backend().load_save_file(save_file=save_file),
+                    save_dict
+                )
+
+        self.assertEqual(list(save_chunks), ["not", "consumed"])
+
+        Backend().save_to_file(save_file="empty", save_info="")
+
+        with self.assertRaises(ValueError):
+            Backend().load_save_file(save_file="empty")
+
+
+class TestGloomlogBackendDurability(unittest.TestCase):
+    """
+    Test GloomLog's Backend class at every durability level
+    """
+
+    def tearDown(self):
+        """
+        Remove the save directory and everything in it
+        """
+
+        for save_file in os.listdir(Backend.save_path):
+            os.remove(Backend.save_path + "/" + save_file)
+        os.rmdir(Backend.save_path)
+
+    def helper_assert_rotation(self, backend: Backend, save_file: str):
+        """
+        Helper function for saving three times and checking the rotation
+        """
+
+        file_name = backend.save_path + "/" + save_file + backend.save_extension
+
+        for save_info in ("first", "second", "third"):
+            backend.save_to_file(save_file=save_file, save_info=save_info)
+
+        with open(file_name, "r") as file:
+            self.assertEqual(file.read(), "third")
+        with open(file_name + backend.backup_extension, "r") as file:
+            self.assertEqual(file.read(), "second")
+        self.assertFalse(os.path.exists(file_name + backend.new_extension))
+
+    def test_durability_levels(self):
+        """
+        Test whether saves rotate the same way at every durability level
+        """
+
+        logging.info(
+            "Testing whether saves rotate the same way at every durability level")
+
+        for durability in Backend.durability_levels:
+            backend = Backend(durability=durability, journal=True)
+            self.helper_assert_rotation(backend=backend, save_file=durability)
+
+        # a new file left behind by an interrupted save is replaced
+        file_name = Backend.save_path + "/none" + Backend.save_extension
+        with open(file_name + Backend.new_extension, "x") as file:
+            file.write("torn")
+
+        Backend().save_to_file(save_file="none", save_info="fourth")
+
+        with open(file_name, "r") as file:
+            self.assertEqual(file.read(), "fourth")
+
+    @mock.patch("os.link", side_effect=OSError)
+    def test_durability_without_links(self, mock_link):
+        """
+        Test whether saves still rotate on file systems without hard links
+        """
+
+        logging.info(
+            "Testing whether saves still rotate on file systems without hard links")
+
+        self.helper_assert_rotation(
+            backend=Backend(durability="fsync-file-and-dir"),
+            save_file="nolinks"
+        )
+        mock_link.assert_called()
+
+
+class TestGloomlogBackendCompression(unittest.TestCase):
+    """
+    Test GloomLog's Backend class with compressed save files
+    """
+
+    def tearDown(self):
+        """
+        Remove the save directory and everything in it
+        """
+
+        for save_file in os.listdir(Backend.save_path):
+            os.remove(Backend.save_path + "/" + save_file)
+        os.rmdir(Backend.save_path)
+
+    def test_compressed_saves(self):
+        """
+        Test whether compressed saves and backups load like plain ones
+        """
+
+        logging.info(
+            "Testing whether compressed saves and backups load like plain ones")
+
+        with open("TestLongCampaignSave.json", "r") as file:
+            save_text = file.read()
+
+        save_files = []
+
+        for compression in ("zlib", "lzma"):
+            for save_format in Backend.save_formats:
+                for header in (False, True):
+                    save_file = f"{compression}-{save_format}-{header}"
+                    backend = Backend(
+                        compression=compression,
+                        compression_level=1,
+                        save_format=save_format,
+                        header=header,
+                        catalog=True
+                    )
+                    # twice, so there is a compressed backup as well
+                    for _ in range(2):
+                        backend.save_to_file(
+                            save_file=save_file,
+                            save_info=iter(save_text.splitlines(keepends=True))
+                        )
+                    save_files.append(save_file)
+
+                    file_name = backend.save_path + "/" + save_file + backend.save_extension
+                    magic = SaveCompression.magics[compression]
+                    for backup_extension in ("", backend.backup_extension):
+                        with open(file_name + backup_extension, "rb") as file:
+                            if header:
+                                file.seek(backend.header_size)
+                            self.assertEqual(file.read(len(magic)), magic)
+
+                    self.assertEqual(
+                        Backend().load_save_file(save_file=save_file),
+                        json.loads(save_text)
+                    )
+                    self.assertEqual(
+                        Backend().load_save_file_as_text(save_file=save_file),
+                        save_text
+                    )
+
+                    summary = backend.get_catalog()[save_file]
+                    self.assertEqual(summary["compression"], compression)
+                    self.assertEqual(summary["format"], save_format)
+
+        self.assertEqual(sorted(Backend().check_saves()), sorted(save_files))
+
+        # a fresh catalog detects the compression and format by itself
+        os.remove(Backend.save_path + "/" + Backend.catalog_file)
+        catalog = Backend(catalog=True).get_catalog()
+        self.assertEqual(catalog["lzma-binary-False"]["compression"], "lzma")
+        self.assertEqual(catalog["lzma-binary-False"]["format"], "binary")
+
+
+class TestGloomlogBackendHistory(unittest.TestCase):
+    """
+    Test GloomLog's Backend class when keeping a backup history
+    """
+
+    def tearDown(self):
+        """
+        Remove the save directory and everything in it
+        """
+
+        for save_file in os.listdir(Backend.save_path):
+            os.remove(Backend.save_path + "/" + save_file)
+        os.rmdir(Backend.save_path)
+
+    def test_backup_history(self):
+        """
+        Test whether every kept generation of a save can be restored
+        """
+
+        logging.info(
+            "Testing whether every kept generation of a save can be restored")
+
+        backend = Backend(backup_generations=3, journal=True, journal_limit=0)
+
+        encounter_list = [
+            {"type": "Donation", "data": {"identifier": i, "unlockables": []}}
+            for i in range(5)
+        ]
+        # appends, a replaced encounter and a removal
+        versions = [
+            encounter_list[:2],
+            encounter_list[:3],
+            encounter_list[:4],
+            encounter_list[:2] + encounter_list[4:],
+            encounter_list[:4],
+            encounter_list[:1]
+        ]
+
+        self.assertEqual(backend.check_backups(save_file="history"), 0)
+
+        previous_version = []
+        for version in versions:
+            shared_count = min(len(version), len(previous_version))
+            while version[:shared_count] != previous_version[:shared_count]:
+                shared_count -= 1
+            save_records = [json.dumps({"index": shared_count, "encounter": None})] + [
+                json.dumps({"index": index, "encounter": version[index]})
+                for index in range(shared_count, len(version))
+            ]
+            # appending to a save needs no save file to be read
+            with mock.patch.object(Backend, "read_save_file", wraps=backend.read_save_file) as mock_read:
+                backend.save_to_file(
+                    save_file="history",
+                    save_info=json.dumps({"EnounterList": version}, indent=2, sort_keys=True),
+                    save_records=save_records
+                )
+            if version is versions[2]:
+                mock_read.assert_not_called()
+            previous_version = version
+
+        self.assertEqual(backend.check_backups(save_file="history"), 3)
+        for generation in (1, 2, 3):
+            self.assertEqual(
+                backend.load_backup(save_file="history", generation=generation),
+                {"EnounterList": versions[-1 - generation]}
+            )
+        with self.assertRaises(AssertionError):
+            backend.load_backup(save_file="history", generation=4)
+
+        # deltas only hold the encounters that differ from the newer version
+        file_name = backend.save_path + "/history" + backend.save_extension
+        backup_deltas = Backend.read_history(file_name + backend.history_extension)
+        self.assertEqual(json.loads(backup_deltas[-1])["older_encounters"], encounter_list[1:4])
+        self.assertEqual(json.loads(backup_deltas[-2])["older_encounters"], encounter_list[4:])
+        self.assertEqual(len(backup_deltas), 3)
+
+        # a journal kept since the last rewrite leaves the backups as they were
+        backend.journal_limit = 65536
+        backend.save_to_file(
+            save_file="history",
+            save_info="",
+            save_records=[json.dumps({"index": 0, "encounter": None})]
+        )
+        self.assertEqual(backend.load_save_file(save_file="history"), {"EnounterList": []})
+        self.assertEqual(
+            backend.load_backup(save_file="history", generation=1),
+            {"EnounterList": versions[-2]}
+        )
+
+        # without a history, the backup file is the only generation
+        Backend().save_to_file(save_file="plain", save_info='{"EnounterList": []}')
+        Backend().save_to_file(save_file="plain", save_info='{"EnounterList": [1]}')
+        self.assertEqual(Backend().check_backups(save_file="plain"), 1)
+        self.assertEqual(
+            Backend().load_backup(save_file="plain", generation=1),
+            {"EnounterList": []}
+        )
+
+    def test_backup_history_journal(self):
+        """
+        Test whether generations compacted from a journal can be restored
+        """
+
+        logging.info(
+            "Testing whether generations compacted from a journal can be restored")
+
+        backend = Backend(backup_generations=3, journal=True)
+
+        encounter_list = [
+            {"type": "Donation", "data": {"identifier": i, "unlockables": []}}
+            for i in range(5)
+        ]
+        # journaled, compacted, journaled over a shared encounter and compacted
+        versions = [
+            (encounter_list[:2], 65536),
+            (encounter_list[:3], 65536),
+            (encounter_list[:4], 0),
+            (encounter_list[:2] + encounter_list[4:], 65536),
+            (encounter_list[:2] + encounter_list[4:] + encounter_list[2:3], 0)
+        ]
+
+        previous_version = []
+        for version, journal_limit in versions:
+            shared_count = min(len(version), len(previous_version))
+            while version[:shared_count] != previous_version[:shared_count]:
+                shared_count -= 1
+            backend.journal_limit = journal_limit
+            backend.save_to_file(
+                save_file="compacted",
+                save_info=json.dumps({"EnounterList": version}, indent=2, sort_keys=True),
+                save_records=[json.dumps({"index": shared_count, "encounter": None})] + [
+                    json.dumps({"index": index, "encounter": version[index]})
+                    for index in range(shared_count, len(version))
+                ]
+            )
+            previous_version = version
+
+        self.assertEqual(backend.check_backups(save_file="compacted"), 2)
+        self.assertEqual(
+            backend.load_backup(save_file="compacted", generation=1),
+            {"EnounterList": versions[3][0]}
+        )
+        self.assertEqual(
+            backend.load_backup(save_file="compacted", generation=2),
+            {"EnounterList": versions[1][0]}
+        )
+
+
+class TestGloomlogBackendFork(unittest.TestCase):
+    """
+    Test GloomLog's Backend class when forking saves
+    """
+
+    def setUp(self):
+        """
+        Set up variables for testing
+        """
+
+        logging.info(
+            "Setting up variables for testing GloomLog's forking Backend")
+
+        self.encounter_list = [
+            {"type": "Donation", "data": {"identifier": i, "unlockables": []}}
+            for i in range(10)
+        ]
+
+    def tearDown(self):
+        """
+        Remove the save directory and everything in it
+        """
+
+        for save_file in os.listdir(Backend.save_path):
+            os.remove(Backend.save_path + "/" + save_file)
+        os.rmdir(Backend.save_path)
+
+    def helper_save(self, backend: Backend, save_file: str, encounter_list: list, index: int):
+        """
+        Helper function for saving a list with records from the index on
+        """
+
+        backend.save_to_file(
+            save_file=save_file,
+            save_info=json.dumps({"EnounterList": encounter_list}, indent=2, sort_keys=True),
+            save_records=[
+                json.dumps({"index": i, "encounter": encounter_list[i] if i < len(encounter_list) else None})
+                for i in range(index, max(len(encounter_list), index + 1))
+            ]
+        )
+
+    def test_fork(self):
+        """
+        Test whether a fork shares the encounters of its save until they change
+        """
+
+        logging.info(
+            "Testing whether a fork shares the encounters of its save until they change")
+
+        for journal in (False, True):
+            backend = Backend(journal=journal)
+            file_name = backend.save_path + "/fork" + backend.save_extension
+
+            backend.save_to_file(
+                save_file="base",
+                save_info=json.dumps({"EnounterList": self.encounter_list[:6]}, indent=2)
+            )
+            backend.fork_save(save_file="base", fork_file="fork")
+
+            self.assertEqual(backend.read_fork(save_file="fork")["encounters"], 6)
+            self.assertEqual(list(backend.find_forks(save_file="base")), ["fork"])
+            self.assertEqual(backend.load_save_file(save_file="fork")["EnounterList"], self.encounter_list[:6])
+            with open(file_name, "r") as file:
+                self.assertEqual(json.load(file)["EnounterList"], [])
+
+            # both go their own way after the shared encounters,
+            # the save finds its forks without looking through the directory
+            fork_list = self.encounter_list[:6] + self.encounter_list[9:]
+            with mock.patch("os.listdir") as mock_listdir:
+                self.helper_save(backend=backend, save_file="fork", encounter_list=fork_list, index=6)
+                self.helper_save(backend=backend, save_file="base", encounter_list=self.encounter_list[:8], index=6)
+                mock_listdir.assert_not_called()
+
+            self.assertEqual(backend.load_save_file(save_file="fork")["EnounterList"], fork_list)
+            self.assertEqual(
+                json.loads(backend.load_save_file_as_text(save_file="fork"))["EnounterList"],
+                fork_list
+            )
+            self.assertIsNotNone(backend.read_fork(save_file="fork"))
+
+            # changing a shared encounter copies them to the fork first
+            self.helper_save(backend=backend, save_file="base", encounter_list=self.encounter_list[:3], index=3)
+
+            self.assertIsNone(backend.read_fork(save_file="fork"))
+            self.assertEqual(backend.find_forks(save_file="base"), {})
+            self.assertEqual(backend.load_save_file(save_file="fork")["EnounterList"], fork_list)
+            # journaled or not, the saves merge from the fork point
+            self.assertEqual(
+                backend.find_ancestor(save_file="base", other_file="fork"),
+                {"save": "fork", "fork_point": True, "encounters": 6}
+            )
+            self.assertEqual(backend.load_save_file(save_file="base")["EnounterList"], self.encounter_list[:3])
+            if not journal:
+                self.assertEqual(
+                    backend.load_backup(save_file="fork", generation=1)["EnounterList"],
+                    self.encounter_list[:6]
+                )
+
+            for save_file in os.listdir(backend.save_path):
+                os.remove(backend.save_path + "/" + save_file)
+
+    def test_fork_changes(self):
+        """
+        Test whether forks of forks resolve and a changed fork stands alone
+        """
+
+        logging.info(
+            "Testing whether forks of forks resolve and a changed fork stands alone")
+
+        backend = Backend()
+
+        backend.save_to_file(
+            save_file="base",
+            save_info=json.dumps({"EnounterList": self.encounter_list[:4]}, indent=2)
+        )
+        backend.fork_save(save_file="base", fork_file="fork")
+        self.helper_save(backend=backend, save_file="fork", encounter_list=self.encounter_list[:5], index=4)
+        backend.fork_save(save_file="fork", fork_file="forkfork")
+
+        self.assertEqual(backend.load_save_file(save_file="forkfork")["EnounterList"], self.encounter_list[:5])
+
+        # without save records, the new save info tells whether a fork is touched
+        backend.save_to_file(
+            save_file="base",
+            save_info=json.dumps({"EnounterList": self.encounter_list[:4] + self.encounter_list[8:]}, indent=2)
+        )
+        self.assertIsNotNone(backend.read_fork(save_file="fork"))
+        backend.save_to_file(
+            save_file="base",
+            save_info=json.dumps({"EnounterList": self.encounter_list[1:4]}, indent=2)
+        )
+        self.assertIsNone(backend.read_fork(save_file="fork"))
+        self.assertEqual(backend.load_save_file(save_file="forkfork")["EnounterList"], self.encounter_list[:5])
+
+        # a fork changing shared encounters itself is written in full
+        self.helper_save(backend=backend, save_file="forkfork", encounter_list=self.encounter_list[:2], index=2)
+
+        self.assertIsNone(backend.read_fork(save_file="forkfork"))
+        self.assertEqual(backend.load_save_file(save_file="forkfork")["EnounterList"], self.encounter_list[:2])
+        self.assertEqual(
+            backend.find_ancestor(save_file="forkfork", other_file="fork"),
+            {"save": "forkfork", "fork_point": True, "encounters": 5}
+        )
+        self.assertEqual(
+            list(backend.iter_ancestor(backend.find_ancestor(save_file="forkfork", other_file="fork"))),
+            self.encounter_list[:5]
+        )
+
+        with self.assertRaises(AssertionError):
+            backend.fork_save(save_file="base", fork_file="fork")
+
+    def test_fork_streaming(self):
+        """
+        Test whether forks saved in chunks are streamed past their shared encounters
+        """
+
+        logging.info(
+            "Testing whether forks saved in chunks are streamed past their shared encounters")
+
+        def helper_chunks(encounter_list):
+            return iter(json.dumps(
+                {"EnounterList": encounter_list},
+                indent=2,
+                sort_keys=True
+            ).splitlines(keepends=True))
+
+        backend = Backend(catalog=True)
+        file_name = backend.save_path + "/fork" + backend.save_extension
+        fork_list = self.encounter_list[:4] + self.encounter_list[8:]
+
+        backend.save_to_file(save_file="base", save_info=helper_chunks(self.encounter_list[:4]))
+        backend.fork_save(save_file="base", fork_file="fork")
+        backend.fork_save(save_file="base", fork_file="other")
+        fork = backend.read_fork(save_file="fork")
+
+        # neither the fork nor its save is parsed as a whole
+        with mock.patch("json.loads", wraps=json.loads) as mock_loads:
+            backend.save_to_file(save_file="fork", save_info=helper_chunks(fork_list))
+            backend.save_to_file(
+                save_file="base",
+                save_info=helper_chunks(self.encounter_list[:4] + self.encounter_list[6:8])
+            )
+            for loads_call in mock_loads.call_args_list:
+                self.assertNotIn("EnounterList", loads_call.args[0])
+
+        with open(file_name, "r") as file:
+            self.assertEqual(
+                file.read(),
+                json.dumps(
+                    {"EnounterList": self.encounter_list[8:], "ForkOf": fork},
+                    indent=2,
+                    sort_keys=True
+                )
+            )
+        self.assertEqual(backend.load_save_file(save_file="fork")["EnounterList"], fork_list)
+        self.assertEqual(list(backend.find_forks(save_file="base")), ["fork", "other"])
+
+        # changing a shared encounter copies the forks once the save is written
+        backend.save_to_file(
+            save_file="base",
+            save_info=helper_chunks(self.encounter_list[1:4])
+        )
+
+        self.assertEqual(backend.find_forks(save_file="base"), {})
+        self.assertEqual(backend.load_save_file(save_file="fork")["EnounterList"], fork_list)
+        self.assertEqual(backend.load_save_file(save_file="other")["EnounterList"], self.encounter_list[:4])
+        self.assertEqual(backend.load_save_file(save_file="base")["EnounterList"], self.encounter_list[1:4])
+        self.assertEqual(
+            backend.get_catalog()["fork"]["size"],
+            os.path.getsize(file_name)
+        )
+
+        # a fork changing a shared encounter itself is written in full
+        backend.fork_save(save_file="base", fork_file="changed")
+        backend.save_to_file(
+            save_file="changed",
+            save_info=helper_chunks(self.encounter_list[1:2] + self.encounter_list[5:7])
+        )
+
+        self.assertIsNone(backend.read_fork(save_file="changed"))
+        self.assertEqual(
+            backend.load_save_file_as_text(save_file="changed"),
+            json.dumps(
+                {"EnounterList": self.encounter_list[1:2] + self.encounter_list[5:7]},
+                indent=2,
+                sort_keys=True
+            )
+        )
+
+    def test_fork_backups(self):
+        """
+        Test whether the backups of a fork load once it stands alone
+        """
+
+        logging.info(
+            "Testing whether the backups of a fork load once it stands alone")
+
+        backend = Backend()
+
+        # a fork changing shared encounters itself, and then its save changing
+        backend.save_to_file(
+            save_file="base",
+            save_info=json.dumps({"EnounterList": self.encounter_list[:7]}, indent=2)
+        )
+        backend.fork_save(save_file="base", fork_file="fork")
+        fork_list = self.encounter_list[:7] + self.encounter_list[9:]
+        self.helper_save(backend=backend, save_file="fork", encounter_list=fork_list, index=7)
+        self.helper_save(backend=backend, save_file="fork", encounter_list=self.encounter_list[:5], index=5)
+        self.helper_save(
+            backend=backend,
+            save_file="base",
+            encounter_list=self.encounter_list[:3] + self.encounter_list[8:9] + self.encounter_list[4:7],
+            index=3
+        )
+
+        self.assertEqual(backend.load_backup(save_file="fork", generation=1)["EnounterList"], fork_list)
+
+        # a fork of a fork standing alone, and then the fork it was forked from
+        backend.save_to_file(
+            save_file="start",
+            save_info=json.dumps({"EnounterList": self.encounter_list[:2]}, indent=2)
+        )
+        backend.fork_save(save_file="start", fork_file="fork2")
+        self.helper_save(backend=backend, save_file="fork2", encounter_list=self.encounter_list[:4], index=2)
+        backend.fork_save(save_file="fork2", fork_file="fork4")
+        self.helper_save(backend=backend, save_file="fork4", encounter_list=self.encounter_list[:5], index=4)
+        self.helper_save(backend=backend, save_file="fork4", encounter_list=self.encounter_list[:3], index=3)
+        self.helper_save(backend=backend, save_file="fork2", encounter_list=self.encounter_list[:1], index=1)
+
+        self.assertEqual(
+            backend.load_backup(save_file="fork4", generation=1)["EnounterList"],
+            self.encounter_list[:5]
+        )
+        self.assertEqual(
+            backend.load_backup(save_file="fork2", generation=1)["EnounterList"],
+            self.encounter_list[:4]
+        )
+
+        # a journaled fork copied in full keeps its history
+        backend = Backend(backup_generations=3, journal=True)
+        backend.save_to_file(
+            save_file="base",
+            save_info=json.dumps({"EnounterList": self.encounter_list[:6]}, indent=2)
+        )
+        backend.fork_save(save_file="base", fork_file="journaled")
+        backend.save_to_file(
+            save_file="journaled",
+            save_info=json.dumps({"EnounterList": self.encounter_list[:8]}, indent=2)
+        )
+        self.helper_save(backend=backend, save_file="journaled", encounter_list=self.encounter_list[:9], index=8)
+
+        self.assertIsNotNone(backend.read_fork(save_file="journaled"))
+
+        self.helper_save(backend=backend, save_file="base", encounter_list=self.encounter_list[:1], index=1)
+
+        self.assertIsNone(backend.read_fork(save_file="journaled"))
+        self.assertEqual(backend.load_save_file(save_file="journaled")["EnounterList"], self.encounter_list[:9])
+        self.assertEqual(
+            backend.load_backup(save_file="journaled", generation=1)["EnounterList"],
+            self.encounter_list[:6]
+        )
+
+
+class TestGloomlogBackendDiff(unittest.TestCase):
+    """
+    Test GloomLog's Backend class when streaming and comparing saves
+    """
+
+    def tearDown(self):
+        """
+        Remove the save directory and everything in it
+        """
+
+        for save_file in os.listdir(Backend.save_path):
+            os.remove(Backend.save_path + "/" + save_file)
+        os.rmdir(Backend.save_path)
+
+    def test_iter_encounters(self):
+        """
+        Test whether every kind of save streams the encounters it loads
+        """
+
+        logging.info(
+            "Testing whether every kind of save streams the encounters it loads")
+
+        with open("TestLongCampaignSave.json", "r") as file:
+            save_text = file.read()
+
+        encounter_list = json.loads(save_text)["EnounterList"]
+
+        for compression in Backend.compressions:
+            for save_format in Backend.save_formats:
+                for header in (False, True):
+                    save_file = f"{compression}-{save_format}-{header}"
+                    backend = Backend(
+                        compression=compression,
+                        save_format=save_format,
+                        header=header
+                    )
+                    backend.save_to_file(save_file=save_file, save_info=save_text)
+
+                    self.assertEqual(
+                        list(backend.iter_encounters(save_file=save_file)),
+                        encounter_list
+                    )
+
+        # a journal changes the encounters from its lowest index on
+        backend = Backend(journal=True)
+        backend.save_to_file(save_file="journal", save_info=save_text)
+        backend.save_to_file(
+            save_file="journal",
+            save_info="",
+            save_records=[
+                json.dumps({"index": 3, "encounter": None}),
+                json.dumps({"index": 3, "encounter": encounter_list[0]}),
+                json.dumps({"index": 4, "encounter": encounter_list[1]})
+            ]
+        )
+
+        self.assertEqual(
+            list(backend.iter_encounters(save_file="journal")),
+            backend.load_save_file(save_file="journal")["EnounterList"]
+        )
+        self.assertEqual(
+            list(backend.iter_encounters(save_file="journal")),
+            encounter_list[:3] + encounter_list[:2]
+        )
+
+        # forks include the encounters they share
+        backend.fork_save(save_file="journal", fork_file="fork")
+
+        self.assertEqual(
+            list(backend.iter_encounters(save_file="fork")),
+            encounter_list[:3] + encounter_list[:2]
+        )
+
+        # the header checksum is still checked, once the save file is read
+        file_name = Backend.save_path + "/none-json-True" + Backend.save_extension
+        with open(file_name, "r+b") as file:
+            file.seek(-2, os.SEEK_END)
+            file.write(b" ")
+
+        with self.assertRaises(AssertionError):
+            list(Backend().iter_encounters(save_file="none-json-True"))
+
+    def test_diff_saves(self):
+        """
+        Test whether saves are compared by their encounters
+        """
+
+        logging.info(
+            "Testing whether saves are compared by their encounters")
+
+        encounter_list = [
+            {"type": "Donation", "data": {"identifier": i, "unlockables": []}}
+            for i in range(4)
+        ]
+        other_list = encounter_list[1:3] + [
+            {"type": "Donation", "data": {"identifier": 3, "unlockables": encounter_list[:1]}},
+            {"type": "Donation", "data": {"identifier": 9, "unlockables": []}}
+        ]
+
+        for backend in (Backend(), Backend(compression="zlib"), BackendMemory()):
+            backend.save_to_file(
+                save_file="base",
+                save_info=json.dumps({"EnounterList": encounter_list}, indent=2)
+            )
+            backend.save_to_file(
+                save_file="other",
+                save_info=json.dumps({"EnounterList": other_list}, indent=2)
+            )
+
+            self.assertEqual(backend.diff_saves(save_file="base", other_file="base"), [])
+            self.assertEqual(
+                backend.diff_saves(save_file="base", other_file="other"),
+                [
+                    {
+                        "type": "Donation",
+                        "identifier": 3,
+                        "change": "changed",
+                        "outcomes": {},
+                        "unlockables": True
+                    },
+                    {"type": "Donation", "identifier": 9, "change": "added"},
+                    {"type": "Donation", "identifier": 0, "change": "removed"}
+                ]
+            )
+
+    def test_merge_saves(self):
+        """
+        Test whether saves merge from a fork point or a backup
+        """
+
+        logging.info(
+            "Testing whether saves merge from a fork point or a backup")
+
+        encounter_list = [
+            {"type": "Donation", "data": {"identifier": i, "unlockables": []}}
+            for i in range(8)
+        ]
+
+        backend = Backend()
+        backend.save_to_file(
+            save_file="base",
+            save_info=json.dumps({"EnounterList": encounter_list[:4]}, indent=2)
+        )
+        backend.fork_save(save_file="base", fork_file="fork")
+        backend.fork_save(save_file="base", fork_file="other")
+        for save_file, added_list in (
+            ("base", encounter_list[4:6]),
+            ("fork", encounter_list[6:7]),
+            ("other", encounter_list[7:])
+        ):
+            backend.save_to_file(
+                save_file=save_file,
+                save_info=json.dumps({"EnounterList": encounter_list[:4] + added_list}, indent=2)
+            )
+
+        self.assertEqual(
+            backend.find_ancestor(save_file="base", other_file="fork"),
+            {"save": "base", "generation": 0, "encounters": 4}
+        )
+        self.assertEqual(
+            backend.find_ancestor(save_file="fork", other_file="other")["save"],
+            "base"
+        )
+
+        save_dict, conflicts = backend.merge_saves(save_file="fork", other_file="base")
+
+        self.assertEqual(save_dict["EnounterList"], encounter_list[:4] + [encounter_list[6]] + encounter_list[4:6])
+        self.assertEqual(conflicts, [])
+
+        # a backup both saves start with is no fork point, it has to be given
+        backend = Backend(backup_generations=2)
+        for encounter_count in (1, 2, 3):
+            backend.save_to_file(
+                save_file="ours",
+                save_info=json.dumps({"EnounterList": encounter_list[:encounter_count]}, indent=2)
+            )
+        backend.save_to_file(
+            save_file="theirs",
+            save_info=json.dumps({"EnounterList": encounter_list[:1] + encounter_list[5:6]}, indent=2)
+        )
+
+        self.assertIsNone(backend.find_ancestor(save_file="ours", other_file="theirs"))
+
+        save_dict, conflicts = backend.merge_saves(
+            save_file="ours",
+            other_file="theirs",
+            ancestor={"save": "ours", "generation": 2}
+        )
+
+        self.assertEqual(save_dict["EnounterList"], encounter_list[:3] + encounter_list[5:6])
+
+        # the fork point is kept once the fork no longer shares the encounters
+        backend.save_to_file(
+            save_file="base",
+            save_info=json.dumps({"EnounterList": encounter_list[1:6]}, indent=2)
+        )
+
+        self.assertIsNone(backend.read_fork(save_file="fork"))
+        self.assertEqual(
+            backend.find_ancestor(save_file="base", other_file="fork"),
+            {"save": "fork", "fork_point": True, "encounters": 4}
+        )
+
+        # what the save took back after the fork stays taken back
+        backend.save_to_file(
+            save_file="base",
+            save_info=json.dumps({"EnounterList": encounter_list[1:3]}, indent=2)
+        )
+        save_dict, conflicts = backend.merge_saves(save_file="base", other_file="fork")
+
+        self.assertEqual(save_dict["EnounterList"], encounter_list[1:3] + encounter_list[6:7])
+        self.assertEqual(conflicts, [])
+
+        memory_backend = BackendMemory()
+        memory_backend.save_to_file(save_file="base", save_info=json.dumps({"EnounterList": []}))
+
+        self.assertIsNone(memory_backend.find_ancestor(save_file="base", other_file="base"))
+        with self.assertRaises(AssertionError):
+            memory_backend.merge_saves(save_file="base", other_file="base")
+
+
+class TestGloomlogBackendMemory(unittest.TestCase):
+    """
+    Test GloomLog's BackendMemory class
+    """
+
+    def test_memory_saves(self):
+        """
+        Test whether saves are kept in memory only and separately per backend
+        """
+
+        logging.info(
+            "Testing whether saves are kept in memory only and separately per backend")
+
+        with self.assertRaises(TypeError):
+            Storage()
+        with self.assertRaises(ValueError):
+            BackendMemory().load_backup(save_file="multi", generation=1)
+
+        with open("TestMultiEncounterSave.json", "r") as file:
+            save_text = file.read()
+
+        backend = BackendMemory()
+        backend.save_to_file(save_file="multi", save_info=iter([save_text]))
+
+        encounter_as_dict = {"type": "Donation", "data": {"identifier": 3, "unlockables": []}}
+        backend.save_to_file(
+            save_file="multi",
+            save_info="",
+            save_records=[json.dumps({"index": 8, "encounter": encounter_as_dict})]
+        )
+
+        save_dict = backend.load_save_file(save_file="multi")
+        save_dict["EnounterList"].clear()
+
+        self.assertEqual(backend.check_saves(), ["multi"])
+        self.assertEqual(BackendMemory().check_saves(), [])
+        self.assertEqual(
+            json.loads(backend.load_save_file_as_text(save_file="multi"))["EnounterList"],
+            json.loads(save_text)["EnounterList"] + [encounter_as_dict]
+        )
+        self.assertEqual(backend.get_catalog()["multi"]["encounters"], 9)
+        self.assertFalse(os.path.exists(Backend.save_path))
+
+    def test_save_path(self):
+        """
+        Test whether file backends with their own save path stay apart
+        """
+
+        logging.info(
+            "Testing whether file backends with their own save path stay apart")
+
+        backends = [Backend(save_path="__gloomsave_" + str(i) + "__") for i in range(2)]
+
+        for i, backend in enumerate(backends):
+            backend.save_to_file(save_file="same", save_info=str(i))
+
+        for i, backend in enumerate(backends):
+            self.assertEqual(backend.check_saves(), ["same"])
+            self.assertEqual(backend.load_save_file_as_text(save_file="same"), str(i))
+            os.remove(backend.save_path + "/same" + backend.save_extension)
+            os.rmdir(backend.save_path)
+
+    def test_fork_copy(self):
+        """
+        Test whether storage without forks copies the save instead
+        """
+
+        logging.info(
+            "Testing whether storage without forks copies the save instead")
+
+        encounter_list = [{"type": "Donation", "data": {"identifier": 1, "unlockables": []}}]
+        backend = BackendMemory()
+        backend.save_to_file(save_file="base", save_info=json.dumps({"EnounterList": encounter_list}))
+        backend.fork_save(save_file="base", fork_file="fork")
+
+        self.assertEqual(backend.load_save_file(save_file="fork"), {"EnounterList": encounter_list})
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
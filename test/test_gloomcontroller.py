@@ -3,9 +3,12 @@ import unittest
 import sys
 from unittest import mock
 import random
+import threading
+import time
 sys.path.insert(0, '../')
 sys.path.insert(0, './')
-from gloomcontroller import Controller  # noqa
+from gloombackend import BackendMemory  # noqa
+from gloomcontroller import Controller, SaveWriter  # noqa
 
 logging.basicConfig(level=logging.WARN, format='')
 
@@ -66,7 +69,7 @@ class TestGloomlogController(unittest.TestCase):
     @mock.patch("gloomcontroller.Backend.check_saves")
     @mock.patch("gloomcontroller.Backend.save_to_file")
     @mock.patch("gloomcontroller.UserInterfaceMain.prepare_save_interface")
-    @mock.patch("gloomcontroller.Backend.load_save_file_as_text")
+    @mock.patch("gloomcontroller.Backend.load_save_file")
     @mock.patch("gloomcontroller.Controller.exit_gloomlog")
     @mock.patch("gloomview.UserInterfaceMain.present_interface")
     def test_run_complex(
@@ -93,7 +96,7 @@ class TestGloomlogController(unittest.TestCase):
         mock_list.append(False)
         mock_present.side_effect = mock_list
 
-        mock_load.return_value = "zyx"
+        mock_load.return_value = {"EnounterList": []}
         mock_checksaves.return_value = ["k", "l.k", "mlk"]
 
         self.controller.run()
@@ -102,7 +105,7 @@ class TestGloomlogController(unittest.TestCase):
         mock_load.assert_called_once_with(save_file="xyz")
         mock_prepare.assert_called_once_with(
             save_file="xyz",
-            save_text="zyx"
+            save_dict={"EnounterList": []}
         )
         mock_save.assert_called_once_with(save_file="abc", save_info="def")
         self.assertEqual(
@@ -111,6 +114,188 @@ class TestGloomlogController(unittest.TestCase):
         )
         mock_exit.assert_called_once()
 
+    @mock.patch("gloomcontroller.Backend.check_saves")
+    @mock.patch("gloomcontroller.Backend.save_to_file")
+    @mock.patch("gloomcontroller.Controller.exit_gloomlog")
+    @mock.patch("gloomview.UserInterfaceMain.present_interface")
+    def test_run_asynchronously(
+        self,
+        mock_present,
+        mock_exit,
+        mock_save,
+        mock_checksaves
+    ):
+        """
+        Test whether saves are written in the background before exiting
+        """
+
+        logging.info(
+            "Testing whether saves are written in the background before exiting"
+        )
+
+        mock_present.side_effect = [("abc", "def"), True, False]
+        mock_checksaves.return_value = ["abc"]
+
+        controller = Controller(save_asynchronously=True)
+        controller.run()
+
+        mock_save.assert_called_once_with(save_file="abc", save_info="def")
+        self.assertFalse(controller.save_writer.thread.is_alive())
+        self.assertEqual(controller.interface.list_saves, ["abc"])
+        mock_exit.assert_called_once()
+
+    @mock.patch("gloomcontroller.Controller.exit_gloomlog")
+    @mock.patch("gloomview.UserInterfaceSave.present_interface")
+    @mock.patch("gloomview.UserInterfaceMain.load_campaign_save")
+    @mock.patch("gloomview.UserInterfaceMain.new_campaign_save")
+    @mock.patch("builtins.input", side_effect=["new", "load", "exit"])
+    def test_run_injected(
+        self,
+        mock_input,
+        mock_new,
+        mock_load,
+        mock_present_save,
+        mock_exit
+    ):
+        """
+        Test whether an injected backend keeps the saves of a session
+        """
+
+        logging.info(
+            "Testing whether an injected backend keeps the saves of a session"
+        )
+
+        mock_new.return_value = ("xyz", '{"EnounterList": []}')
+        mock_load.return_value = "abc"
+        mock_present_save.return_value = False
+
+        backend = BackendMemory()
+        backend.save_to_file(save_file="abc", save_info='{"EnounterList": []}')
+        controller = Controller(backend=backend)
+        controller.run()
+
+        self.assertIs(controller.backend, backend)
+        self.assertEqual(backend.check_saves(), ["abc", "xyz"])
+        self.assertEqual(controller.interface.save_interface.save_file_name, "abc")
+        mock_exit.assert_called_once()
+
+    def test_merge_campaign_saves(self):
+        """
+        Test whether a merged save is written over ours
+        """
+
+        logging.info(
+            "Testing whether a merged save is written over ours"
+        )
+
+        backend = BackendMemory()
+        backend.save_to_file(save_file="abc", save_info='{"EnounterList": []}')
+        backend.save_to_file(
+            save_file="xyz",
+            save_info='{"EnounterList": [{"type": "Donation", "data": {"identifier": 1, "unlockables": []}}]}'
+        )
+        controller = Controller(backend=backend)
+        controller.interface = mock.Mock()
+
+        self.assertIsNone(controller.merge_saves(save_file="abc", other_file="xyz"))
+
+        # a common ancestor can be given when the saves have none recorded
+        self.assertEqual(
+            controller.merge_saves(save_file="abc", other_file="xyz", ancestor={"save": "abc"}),
+            []
+        )
+        self.assertEqual(
+            backend.load_save_file(save_file="abc"),
+            backend.load_save_file(save_file="xyz")
+        )
+        self.assertEqual(controller.interface.list_saves, ["abc", "xyz"])
+
+
+class TestGloomlogSaveWriter(unittest.TestCase):
+    """
+    Test GloomLog's SaveWriter class
+    """
+
+    def test_merge_saves(self):
+        """
+        Test whether pending saves to the same file are written once
+        """
+
+        logging.info(
+            "Testing whether pending saves to the same file are written once"
+        )
+
+        backend = mock.Mock()
+        writing = threading.Event()
+        backend.save_to_file.side_effect = lambda **save_arguments: writing.wait()
+
+        save_writer = SaveWriter(backend=backend)
+        save_writer.submit(save_file="abc", save_info="1", save_records=["1"])
+        # wait for the first save to be written, so the next ones pile up
+        while not save_writer.writing:
+            time.sleep(0.001)
+        save_writer.submit(save_file="abc", save_info="2", save_records=["2"])
+        save_writer.submit(save_file="abc", save_info="3", save_records=["3"])
+        save_writer.submit(save_file="xyz", save_info="4")
+        writing.set()
+        save_writer.close()
+
+        self.assertEqual(
+            backend.save_to_file.mock_calls,
+            [
+                mock.call(save_file="abc", save_info="1", save_records=["1"]),
+                mock.call(save_file="abc", save_info="3", save_records=["2", "3"]),
+                mock.call(save_file="xyz", save_info="4")
+            ]
+        )
+
+        self.assertEqual(
+            SaveWriter.merge_saves(
+                pending_save={"save_file": "abc", "save_info": "1"},
+                save_arguments={"save_file": "abc", "save_info": "2", "save_records": ["2"]}
+            ),
+            {"save_file": "abc", "save_info": "2"}
+        )
+
+    def test_save_errors(self):
+        """
+        Test whether failed saves are reported instead of raised
+        """
+
+        logging.info(
+            "Testing whether failed saves are reported instead of raised"
+        )
+
+        backend = mock.Mock()
+        backend.save_to_file.side_effect = OSError("disk full")
+
+        save_writer = SaveWriter(backend=backend)
+        save_writer.submit(save_file="abc", save_info="def")
+        save_writer.flush()
+
+        save_errors = save_writer.get_errors()
+
+        self.assertEqual(len(save_errors), 1)
+        self.assertEqual(save_errors[0][0], "abc")
+        self.assertIsInstance(save_errors[0][1], OSError)
+        self.assertEqual(save_writer.get_errors(), [])
+
+        # even exiting is reported, the thread keeps writing
+        backend.save_to_file.side_effect = SystemExit
+        save_writer.submit(save_file="abc", save_info="def")
+        save_writer.flush()
+
+        self.assertIsInstance(save_writer.get_errors()[0][1], SystemExit)
+
+        backend.save_to_file.side_effect = None
+        save_writer.submit(save_file="abc", save_info="def")
+        save_writer.flush()
+
+        self.assertEqual(save_writer.get_errors(), [])
+
+        save_writer.close()
+        save_writer.close()
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
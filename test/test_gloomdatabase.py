@@ -0,0 +1,155 @@
+import json
+import logging
+import unittest
+import os
+import sys
+sys.path.insert(0, '../')
+sys.path.insert(0, './')
+from gloomdatabase import BackendSQLite  # noqa
+
+logging.basicConfig(level=logging.WARN, format='')
+
+
+class TestGloomlogBackendSQLite(unittest.TestCase):
+    """
+    Test GloomLog's BackendSQLite class
+    """
+
+    def setUp(self):
+        """
+        Set up variables for testing
+        """
+
+        logging.info(
+            "Setting up variables for testing GloomLog's BackendSQLite class")
+
+        self.backend = BackendSQLite()
+
+        with open("TestLongCampaignSave.json", "r") as file:
+            self.save_text = file.read()
+
+        self.save_dict = json.loads(self.save_text)
+
+        self.backend.save_to_file(save_file="long", save_info=self.save_text)
+
+    def tearDown(self):
+        """
+        Remove the database and the save directory if it is empty
+        """
+
+        os.remove(self.backend.database_name)
+        if not os.listdir(self.backend.save_path):
+            os.rmdir(self.backend.save_path)
+
+    def test_load_save_file(self):
+        """
+        Test whether a campaign comes out of the database as it went in
+        """
+
+        logging.info(
+            "Testing whether a campaign comes out of the database as it went in")
+
+        self.backend.save_to_file(
+            save_file="empty",
+            save_info=iter(['{"EnounterList": ', "[]}"])
+        )
+
+        self.assertEqual(self.backend.check_saves(), ["empty", "long"])
+        self.assertEqual(self.backend.load_save_file_as_text(save_file="long"), self.save_text)
+        self.assertEqual(self.backend.load_save_file(save_file="empty"), {"EnounterList": []})
+        self.assertEqual(
+            list(self.backend.iter_encounters(save_file="long")),
+            self.save_dict["EnounterList"]
+        )
+
+        catalog = self.backend.get_catalog()
+
+        self.assertEqual(catalog["long"]["encounters"], len(self.save_dict["EnounterList"]))
+        self.assertEqual(catalog["empty"]["last_encounter"], None)
+
+    def test_save_records(self):
+        """
+        Test whether save records change single rows without save info
+        """
+
+        logging.info(
+            "Testing whether save records change single rows without save info")
+
+        encounter_as_dict = {"type": "Donation", "data": {"identifier": 99, "unlockables": []}}
+        save_chunks = iter(["not", "consumed"])
+
+        self.backend.save_to_file(
+            save_file="long",
+            save_info=save_chunks,
+            save_records=[
+                json.dumps({"index": 2, "encounter": None}),
+                json.dumps({"index": 2, "encounter": encounter_as_dict})
+            ]
+        )
+
+        self.assertEqual(list(save_chunks), ["not", "consumed"])
+        self.assertEqual(
+            self.backend.load_save_file(save_file="long")["EnounterList"],
+            self.save_dict["EnounterList"][:2] + [encounter_as_dict]
+        )
+        self.assertEqual(
+            self.backend.get_catalog()["long"]["last_encounter"],
+            {"type": "Donation", "identifier": 99}
+        )
+
+        # a failing record leaves the campaign as it was
+        with self.assertRaises(KeyError):
+            self.backend.save_to_file(
+                save_file="long",
+                save_info="",
+                save_records=[
+                    json.dumps({"index": 0, "encounter": None}),
+                    json.dumps({"index": 0})
+                ]
+            )
+
+        self.assertEqual(self.backend.get_catalog()["long"]["encounters"], 3)
+
+    def test_query(self):
+        """
+        Test whether encounters can be found by type, identifier and grid location
+        """
+
+        logging.info(
+            "Testing whether encounters can be found by type, identifier and grid location")
+
+        encounter_list = self.save_dict["EnounterList"]
+
+        scenarios = self.backend.query(save_file="long", encounter_type="Scenario")
+
+        self.assertEqual(
+            [encounter_as_dict for _, encounter_as_dict in scenarios],
+            [
+                encounter_as_dict for encounter_as_dict in encounter_list
+                if encounter_as_dict["type"] == "Scenario"
+            ]
+        )
+
+        position, scenario = scenarios[0]
+        grid_location = scenario["data"]["gridLocation"]["data"]
+
+        self.assertIn(
+            (position, scenario),
+            self.backend.query(
+                save_file="long",
+                grid_location=(grid_location["character"], grid_location["identifier"])
+            )
+        )
+        self.assertEqual(
+            self.backend.query(
+                save_file="long",
+                encounter_type="Scenario",
+                identifier=scenario["data"]["identifier"]
+            )[0],
+            (position, scenario)
+        )
+        self.assertEqual(self.backend.query(save_file="other"), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,188 @@
+import json
+import logging
+import unittest
+import sys
+sys.path.insert(0, '../')
+sys.path.insert(0, './')
+from gloomformat import BinaryCodec, SaveCompression, StreamingJSON  # noqa
+
+logging.basicConfig(level=logging.WARN, format='')
+
+
+class TestGloomlogBinaryCodec(unittest.TestCase):
+    """
+    Test GloomLog's BinaryCodec class
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up variables for testing
+        """
+
+        logging.info(
+            "Setting up variables for testing GloomLog's BinaryCodec class")
+
+        with open("TestLongCampaignSave.json", "r") as file:
+            cls.save_text = file.read()
+
+        cls.save_dict = json.loads(cls.save_text)
+
+    def test_round_trip(self):
+        """
+        Test whether a save survives encoding and decoding unchanged
+        """
+
+        logging.info(
+            "Testing whether a save survives encoding and decoding unchanged")
+
+        save_data = BinaryCodec.encode(self.save_dict)
+
+        self.assertTrue(BinaryCodec.is_binary(save_data))
+        self.assertFalse(BinaryCodec.is_binary(self.save_text.encode()))
+        self.assertEqual(BinaryCodec.decode(save_data), self.save_dict)
+        self.assertLess(len(save_data), len(self.save_text) / 4)
+
+    def test_grid_location(self):
+        """
+        Test whether a GridLocation is packed into a tag and two bytes
+        """
+
+        logging.info(
+            "Testing whether a GridLocation is packed into a tag and two bytes")
+
+        grid_location = {
+            "type": "GridLocation",
+            "data": {"character": "O", "identifier": 18}
+        }
+
+        save_data = BinaryCodec.encode({"gridLocation": grid_location})
+
+        self.assertEqual(len(save_data), len(BinaryCodec.magic) + 1 + 1 + 1 + 3)
+        self.assertEqual(
+            BinaryCodec.decode(save_data),
+            {"gridLocation": grid_location}
+        )
+
+    def test_unknown_names(self):
+        """
+        Test whether unknown field and type names are kept as strings
+        """
+
+        logging.info(
+            "Testing whether unknown field and type names are kept as strings")
+
+        save_dict = {
+            "Other": [{"type": "Mercenary", "data": {"level": -3, "xp": 0.5}}],
+            "name": "",
+            "choice": None
+        }
+
+        self.assertEqual(
+            BinaryCodec.decode(BinaryCodec.encode(save_dict)),
+            save_dict
+        )
+
+
+class TestGloomlogSaveCompression(unittest.TestCase):
+    """
+    Test GloomLog's SaveCompression and StreamingJSON classes
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up variables for testing
+        """
+
+        logging.info(
+            "Setting up variables for testing GloomLog's SaveCompression class")
+
+        with open("TestLongCampaignSave.json", "r") as file:
+            cls.save_text = file.read()
+
+        cls.save_dict = json.loads(cls.save_text)
+
+    def test_compression_round_trip(self):
+        """
+        Test whether compressed saves are detected and decompress unchanged
+        """
+
+        logging.info(
+            "Testing whether compressed saves are detected and decompress unchanged")
+
+        save_data = self.save_text.encode("utf-8")
+
+        self.assertEqual(SaveCompression.detect(save_data), "none")
+
+        for compression in SaveCompression.compressions[1:]:
+            compressor = SaveCompression.make_compressor(compression, level=1)
+            compressed_data = compressor.compress(save_data) + compressor.flush()
+
+            self.assertEqual(SaveCompression.detect(compressed_data), compression)
+            self.assertLess(len(compressed_data), len(save_data))
+            self.assertEqual(
+                b"".join(SaveCompression.iter_decompressed(compressed_data, compression)),
+                save_data
+            )
+            self.assertEqual(
+                SaveCompression.decompress_prefix(compressed_data, compression, 5),
+                save_data[:5]
+            )
+
+            with self.assertRaises(AssertionError):
+                list(SaveCompression.iter_decompressed(compressed_data[:-20], compression))
+
+    def test_streaming_json(self):
+        """
+        Test whether a save parses the same from chunks of any size
+        """
+
+        logging.info(
+            "Testing whether a save parses the same from chunks of any size")
+
+        save_data = self.save_text.encode("utf-8")
+
+        for chunk_size in (1, 7, 4096, len(save_data)):
+            save_chunks = (
+                save_data[offset:offset + chunk_size]
+                for offset in range(0, len(save_data), chunk_size)
+            )
+            self.assertEqual(StreamingJSON.parse_chunks(save_chunks), self.save_dict)
+
+        # split inside a multi byte character and compact separators
+        other_dict = {"EnounterList": [{"type": "Quest", "data": {"name": "Caf\u00e9"}}] * 3}
+        other_data = json.dumps(other_dict, separators=(",", ":")).encode("utf-8")
+        self.assertEqual(
+            StreamingJSON.parse_chunks(other_data[i:i + 1] for i in range(len(other_data))),
+            other_dict
+        )
+
+        # members after the encounter list are parsed with the rest
+        fork_dict = dict(other_dict, ForkOf={"save": "base", "encounters": 2})
+        fork_data = json.dumps(fork_dict, indent=2, sort_keys=True).encode("utf-8")
+        self.assertEqual(
+            StreamingJSON.parse_chunks(fork_data[i:i + 5] for i in range(0, len(fork_data), 5)),
+            fork_dict
+        )
+
+        # streamed encounters come one at a time, the other members at the end
+        fork_encounters = StreamingJSON.iter_encounters(iter([fork_data]))
+        self.assertEqual(next(fork_encounters), other_dict["EnounterList"][0])
+        self.assertEqual(list(fork_encounters), other_dict["EnounterList"][1:])
+        with self.assertRaises(StopIteration) as stop:
+            next(StreamingJSON.iter_encounters(iter([b'{"EnounterList": [], "ForkOf": {}}'])))
+        self.assertEqual(stop.exception.value, {"ForkOf": {}})
+
+        # anything else is parsed whole
+        self.assertEqual(
+            StreamingJSON.parse_chunks([b'{"a": 1, ', b'"EnounterList": []}']),
+            {"a": 1, "EnounterList": []}
+        )
+
+        with self.assertRaises(ValueError):
+            StreamingJSON.parse_chunks([save_data[:len(save_data) // 2]])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
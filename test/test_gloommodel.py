@@ -1,3 +1,4 @@
+import copy
 import json
 import logging
 import unittest
@@ -31,6 +32,14 @@ class EventCopy(gloommodel.Event):
     pass
 
 
+class ThirdPartyEncounter(gloommodel.EncounterByName):
+    """
+    Encounter types from other modules should register themselves
+    """
+
+    friendly_name = "third party encounter"
+
+
 class TestHandlerJSONCopy(unittest.TestCase):
     """
     Test Gloomlog's HandlerJSON class
@@ -87,6 +96,19 @@ class TestHandlerJSONCopy(unittest.TestCase):
 
         self.assertEqual(self.textJSON, self.handlerJSONTest.toJSON())
 
+    def testHandlerJSONToDict(self):
+        """
+        Test whether HandlerJSON can correctly convert itself to a dict
+        """
+
+        logging.info(
+            "Testing whether HandlerJSON can correctly convert itself to a dict")
+
+        self.assertEqual(
+            json.loads(self.textJSON),
+            self.handlerJSONTest.toDict()
+        )
+
 
 class TestGloomlogEncounterCopy(unittest.TestCase):
     """
@@ -271,6 +293,39 @@ class TestGloomlogGridLocation(unittest.TestCase):
 
         self.helperFunctionEqualityAndFromJSON()
 
+    def testGridLocationShared(self):
+        """
+        Test whether every GridLocation on the map is a single shared instance
+        """
+
+        logging.info(
+            "Testing whether every GridLocation on the map is a single shared instance")
+
+        self.assertIs(self.gridLocTest, self.gridLocTestJSON)
+        self.assertIs(self.gridLocTest, copy.deepcopy(self.gridLocTest))
+        self.assertEqual(len(gloommodel.GridLocation.grid_locations), 15 * 18)
+
+        mapQuery = {self.gridLocTest: "Black Barrow"}
+        self.assertEqual(
+            mapQuery[gloommodel.GridLocation(self.gridLocChar, self.gridLocNumb)],
+            "Black Barrow"
+        )
+
+    def testGridLocationImmutable(self):
+        """
+        Test whether GridLocations can be neither changed nor made up
+        """
+
+        logging.info(
+            "Testing whether GridLocations can be neither changed nor made up")
+
+        with self.assertRaises(AttributeError):
+            self.gridLocTest.identifier = 11
+
+        for character, identifier in (("P", 1), ("A", 19), ("A", True), ("AB", 1)):
+            with self.assertRaises(AssertionError):
+                gloommodel.GridLocation(character, identifier)
+
     def testGridLocationString(self):
         """
         Test whether the GridLocation string representation is correct
@@ -343,6 +398,65 @@ class TestGloomlogScenario(unittest.TestCase):
         self.assertEqual(self.scenTestJSON, scenCopy)
         self.assertEqual(self.scenTest, self.scenTestJSON)
 
+    def testScenarioFromDict(self):
+        """
+        Test whether a Scenario can be succesfully generated from a correct dict
+        """
+
+        logging.info(
+            "Testing whether a Scenario can be succesfully generated from a correct dict")
+
+        scenCopy = gloommodel.Scenario(fullDict=json.loads(self.textJSON))
+
+        self.assertEqual(self.scenTest, scenCopy)
+        self.assertEqual(self.scenTest.gridLocation, scenCopy.gridLocation)
+        self.assertEqual(self.textJSON, scenCopy.toJSON())
+
+    def testScenarioFields(self):
+        """
+        Test whether a Scenario serializes its declared fields without a __dict__
+        """
+
+        logging.info(
+            "Testing whether a Scenario serializes its declared fields without a __dict__")
+
+        self.assertFalse(hasattr(self.scenTest, "__dict__"))
+        self.assertFalse(hasattr(self.scenTest.gridLocation, "__dict__"))
+        self.assertEqual(
+            set(self.scenTest.json_fields),
+            set(self.scenTest.toDict()["data"])
+        )
+
+    def testScenarioHashAndDigest(self):
+        """
+        Test whether Scenarios hash like they compare and digest all their fields
+        """
+
+        logging.info(
+            "Testing whether Scenarios hash like they compare and digest all their fields")
+
+        scenSucces = gloommodel.Scenario(
+            self.identifier,
+            self.name,
+            gloommodel.GridLocation(self.gridLocChar, self.gridLocNumb),
+            True
+        )
+
+        self.assertEqual(hash(self.scenTest), hash(scenSucces))
+        self.assertEqual(len({self.scenTest, self.scenTestJSON, scenSucces}), 1)
+        self.assertEqual(self.scenTest.digest(), self.scenTestJSON.digest())
+        self.assertNotEqual(self.scenTest.digest(), scenSucces.digest())
+
+        scenSucces.unlockables.append(gloommodel.Character("Sassy Savvas"))
+        self.assertNotEqual(
+            scenSucces.digest(),
+            gloommodel.Scenario(fullDict=self.scenTest.toDict()).digest()
+        )
+        self.assertEqual(
+            gloommodel.digest_dict(scenSucces.toDict()),
+            scenSucces.digest()
+        )
+
     def testScenarioName(self):
         """
         Test whether the Scenario name has been correctly set
@@ -511,5 +625,521 @@ class TestGloomlogCityEvent(unittest.TestCase):
         self.assertEqual(self.cityEventTest.__str__(), expectedString)
 
 
+class TestGloomlogEncounterRegistry(unittest.TestCase):
+    """
+    Test Gloomlog's EncounterRegistry class
+    """
+
+    def testRegistryTypeName(self):
+        """
+        Test whether Encounter classes can be found by type name
+        """
+
+        logging.info(
+            "Testing whether Encounter classes can be found by type name")
+
+        self.assertIs(
+            gloommodel.encounter_registry.get_type("Scenario"),
+            gloommodel.Scenario
+        )
+        self.assertIs(
+            gloommodel.encounter_registry.get_type("ThirdPartyEncounter"),
+            ThirdPartyEncounter
+        )
+
+    def testRegistryFriendlyName(self):
+        """
+        Test whether Encounter classes can be found by friendly name
+        """
+
+        logging.info(
+            "Testing whether Encounter classes can be found by friendly name")
+
+        self.assertIs(
+            gloommodel.encounter_registry.get_friendly("road event"),
+            gloommodel.RoadEvent
+        )
+        self.assertIs(
+            gloommodel.encounter_registry.get_friendly("third party encounter"),
+            ThirdPartyEncounter
+        )
+
+    def testRegistryTypes(self):
+        """
+        Test whether the registry selects loggable and unlockable types
+        """
+
+        logging.info(
+            "Testing whether the registry selects loggable and unlockable types")
+
+        loggable_types = gloommodel.encounter_registry.get_types("loggable")
+        unlockable_types = gloommodel.encounter_registry.get_types("unlockable")
+
+        self.assertIn(gloommodel.Donation, loggable_types)
+        self.assertNotIn(gloommodel.Donation, unlockable_types)
+        self.assertIn(gloommodel.ItemDesign, unlockable_types)
+        self.assertNotIn(ThirdPartyEncounter, loggable_types)
+        self.assertNotIn(EncounterCopy, unlockable_types)
+
+    def testRegistryUnlockableFromDict(self):
+        """
+        Test whether unlockables of any registered type can be loaded
+        """
+
+        logging.info(
+            "Testing whether unlockables of any registered type can be loaded")
+
+        unlockable = ThirdPartyEncounter("Mercenary")
+        encounter = EncounterCopy(1, [unlockable.toDict()])
+
+        self.assertEqual(encounter.unlockables, [unlockable])
+
+
+class TestGloomlogLazyEncounterList(unittest.TestCase):
+    """
+    Test Gloomlog's LazyEncounterList class
+    """
+
+    def setUp(self):
+        """
+        Set up variables for testing
+        """
+
+        logging.info("Setting up variables for testing LazyEncounterList class")
+
+        with open("TestLongCampaignSave.json", "r") as file:
+            self.encounters_as_dicts = json.load(file)["EnounterList"]
+
+        self.lazy_list = gloommodel.LazyEncounterList(
+            list(self.encounters_as_dicts),
+            resident_limit=3
+        )
+
+    def testLazyBuild(self):
+        """
+        Test whether Encounters are only built when they are used
+        """
+
+        logging.info(
+            "Testing whether Encounters are only built when they are used")
+
+        self.assertEqual(len(self.lazy_list), len(self.encounters_as_dicts))
+        self.assertEqual(len(self.lazy_list.resident), 0)
+
+        self.assertEqual(str(self.lazy_list[-1]), "Road event 24.: A")
+        self.assertEqual(list(self.lazy_list.resident), [len(self.lazy_list) - 1])
+
+    def testLazyEviction(self):
+        """
+        Test whether only the most recently used Encounters stay built
+        """
+
+        logging.info(
+            "Testing whether only the most recently used Encounters stay built")
+
+        encounter_strings = [str(encounter) for encounter in self.lazy_list]
+
+        self.assertEqual(len(encounter_strings), len(self.encounters_as_dicts))
+        self.assertEqual(
+            list(self.lazy_list.resident),
+            [len(self.lazy_list) - 3, len(self.lazy_list) - 2, len(self.lazy_list) - 1]
+        )
+        self.assertEqual(list(self.lazy_list.iter_dicts()), self.encounters_as_dicts)
+
+    def testLazyAppend(self):
+        """
+        Test whether appended Encounters are part of the dicts
+        """
+
+        logging.info("Testing whether appended Encounters are part of the dicts")
+
+        donation = gloommodel.Donation(6)
+        self.lazy_list.append(donation)
+
+        self.assertIs(self.lazy_list[-1], donation)
+        self.assertEqual(list(self.lazy_list.iter_dicts())[-1], donation.toDict())
+
+    def testLazyTypeCheck(self):
+        """
+        Test whether Encounter types are only checked once they are built
+        """
+
+        logging.info(
+            "Testing whether Encounter types are only checked once they are built")
+
+        self.lazy_list.append({"type": "ThirdPartyEncounter", "data": {"identifier": 1}})
+
+        self.assertEqual(self.lazy_list.get_key(-1), ("ThirdPartyEncounter", 1))
+        with self.assertRaises(TypeError):
+            self.lazy_list[-1]
+
+    def testLazyFollow(self):
+        """
+        Test whether a list following versions keeps the Encounters that stay the same
+        """
+
+        logging.info(
+            "Testing whether a list following versions keeps the Encounters that stay the same")
+
+        edit_history = gloommodel.EditHistory(self.lazy_list.iter_dicts())
+        self.lazy_list.follow(edit_history.get_version(), change_index=len(self.lazy_list))
+
+        first_encounter = self.lazy_list[0]
+        last_encounter = self.lazy_list[-1]
+        edit_history.truncate(len(self.lazy_list) - 1)
+        self.lazy_list.follow(edit_history.get_version(), change_index=len(self.lazy_list) - 1)
+
+        self.assertEqual(len(self.lazy_list), len(self.encounters_as_dicts) - 1)
+        self.assertIs(self.lazy_list[0], first_encounter)
+        self.assertNotIn(last_encounter, self.lazy_list.resident.values())
+        self.assertEqual(list(self.lazy_list.iter_dicts()), self.encounters_as_dicts[:-1])
+
+
+class TestGloomlogEncounterIndex(unittest.TestCase):
+    """
+    Test Gloomlog's EncounterIndex class
+    """
+
+    def testEncounterIndex(self):
+        """
+        Test whether the index follows Encounters added to and removed from a list
+        """
+
+        logging.info(
+            "Testing whether the index follows Encounters added to and removed from a list")
+
+        encounterIndex = gloommodel.EncounterIndex(
+            [("Donation", 1), ("Scenario", 12), ("Donation", 2)]
+        )
+        encounterIndex.add("Scenario", 12)
+
+        self.assertTrue(encounterIndex.has("Scenario", 12))
+        self.assertFalse(encounterIndex.has("Scenario", 2))
+        self.assertEqual(encounterIndex.get_positions("Scenario", 12), [1, 3])
+        self.assertEqual(encounterIndex.count("Donation"), 2)
+        self.assertEqual(encounterIndex.get_max_identifier("Donation"), 2)
+
+        encounterIndex.remove("Scenario", 12)
+        encounterIndex.remove("Donation", 2)
+
+        self.assertEqual(encounterIndex.get_positions("Scenario", 12), [1])
+        self.assertEqual(encounterIndex.get_max_identifier("Donation"), 1)
+
+        encounterIndex.remove("Scenario", 12)
+        encounterIndex.remove("Donation", 1)
+
+        self.assertEqual(encounterIndex.get_max_identifier("Donation"), None)
+        self.assertEqual(encounterIndex.count("Donation"), 0)
+
+
+class TestGloomlogUnlockGraph(unittest.TestCase):
+    """
+    Test Gloomlog's UnlockGraph class
+    """
+
+    def testUnlockGraph(self):
+        """
+        Test whether unlocked encounters are available until completed
+        """
+
+        logging.info(
+            "Testing whether unlocked encounters are available until completed")
+
+        gridLocation = gloommodel.GridLocation("G", 10)
+        unlockedEvent = gloommodel.CityEvent(
+            identifier=7,
+            choice="",
+            unlockables=[gloommodel.Scenario(3, "Crypt", gridLocation, "")]
+        )
+        firstScenario = gloommodel.Scenario(
+            1,
+            "Black Barrow",
+            gridLocation,
+            True,
+            unlockables=[gloommodel.Scenario(2, "Barrow Lair", gridLocation, ""), unlockedEvent]
+        )
+
+        unlockGraph = gloommodel.UnlockGraph([firstScenario.toDict()])
+
+        self.assertEqual(list(unlockGraph.get_available("Scenario")), [2, 3])
+        self.assertEqual(list(unlockGraph.get_available("CityEvent")), [7])
+        self.assertEqual(unlockGraph.get_unlocked_by("Scenario", 3), [0])
+
+        # a failed scenario can still be played, a succesful one not
+        unlockGraph.add(gloommodel.Scenario(2, "Barrow Lair", gridLocation, False).toDict())
+
+        self.assertTrue(unlockGraph.is_available("Scenario", 2))
+
+        unlockGraph.add(gloommodel.Scenario(2, "Barrow Lair", gridLocation, True).toDict())
+        unlockGraph.add(gloommodel.CityEvent(identifier=7, choice="B").toDict())
+
+        self.assertFalse(unlockGraph.is_available("Scenario", 2))
+        self.assertEqual(list(unlockGraph.get_available("CityEvent")), [])
+
+        unlockGraph.remove()
+        unlockGraph.remove()
+
+        self.assertTrue(unlockGraph.is_available("Scenario", 2))
+        self.assertTrue(unlockGraph.is_available("CityEvent", 7))
+
+        unlockGraph.remove()
+        unlockGraph.remove()
+
+        self.assertEqual(list(unlockGraph.get_available("Scenario")), [])
+        self.assertFalse(unlockGraph.is_available("Scenario", 1))
+
+
+class TestGloomlogPersistentVector(unittest.TestCase):
+    """
+    Test Gloomlog's PersistentVector class
+    """
+
+    def testVectorVersions(self):
+        """
+        Test whether every version keeps its own entries after changes
+        """
+
+        logging.info(
+            "Testing whether every version keeps its own entries after changes")
+
+        # long enough for a trie of three levels
+        firstVector = gloommodel.PersistentVector(range(40000))
+        appendedVector = firstVector.append(40000)
+        setVector = appendedVector.set(33000, "set")
+        poppedVector = setVector.pop().pop()
+
+        self.assertEqual(list(firstVector), list(range(40000)))
+        self.assertEqual(len(appendedVector), 40001)
+        self.assertEqual(appendedVector[-1], 40000)
+        self.assertEqual(setVector[33000], "set")
+        self.assertEqual(appendedVector[33000], 33000)
+        self.assertEqual(list(poppedVector), list(range(33000)) + ["set"] + list(range(33001, 39999)))
+        self.assertEqual(list(poppedVector.truncate(10)), list(range(10)))
+        self.assertEqual(list(firstVector), list(range(40000)))
+
+        with self.assertRaises(IndexError):
+            firstVector[40000]
+
+        growingVector = gloommodel.PersistentVector()
+        for entry in range(40000):
+            growingVector = growingVector.append(entry)
+
+        self.assertEqual(list(growingVector), list(firstVector))
+        self.assertEqual(len(growingVector.truncate(0)), 0)
+
+    def testVectorSharing(self):
+        """
+        Test whether versions share the parts they have in common
+        """
+
+        logging.info(
+            "Testing whether versions share the parts they have in common")
+
+        firstVector = gloommodel.PersistentVector(range(5000))
+        setVector = firstVector.set(0, "set")
+
+        self.assertIs(setVector.tail, firstVector.tail)
+        self.assertIs(setVector.root[-1], firstVector.root[-1])
+        self.assertIs(firstVector.append(5000).root, firstVector.root)
+
+
+class TestGloomlogEditHistory(unittest.TestCase):
+    """
+    Test Gloomlog's EditHistory class
+    """
+
+    def testUndoRedo(self):
+        """
+        Test whether changes are undone and redone by version
+        """
+
+        logging.info(
+            "Testing whether changes are undone and redone by version")
+
+        editHistory = gloommodel.EditHistory([{"a": 1}], version_limit=3)
+
+        self.assertFalse(editHistory.can_undo())
+
+        editHistory.append({"b": 2})
+        editHistory.replace(0, {"c": 3})
+
+        self.assertEqual(list(editHistory.get_version()), [{"c": 3}, {"b": 2}])
+        self.assertEqual(editHistory.undo(), 0)
+        self.assertEqual(editHistory.undo(), 1)
+        self.assertEqual(list(editHistory.get_version()), [{"a": 1}])
+        self.assertFalse(editHistory.can_undo())
+        self.assertEqual(editHistory.redo(), 1)
+
+        # a new change forgets the undone versions
+        editHistory.truncate(0)
+
+        self.assertFalse(editHistory.can_redo())
+        self.assertEqual(len(editHistory.get_version()), 0)
+
+        editHistory.append({"d": 4})
+
+        # the oldest version is dropped past the limit
+        self.assertEqual(editHistory.undo(), 0)
+        self.assertEqual(editHistory.undo(), 0)
+        self.assertFalse(editHistory.can_undo())
+        self.assertEqual(list(editHistory.get_version()), [{"a": 1}, {"b": 2}])
+
+
+
+class TestGloomlogDiffEncounters(unittest.TestCase):
+    """
+    Test Gloomlog's diff_encounters function
+    """
+
+    def testDiffEncounters(self):
+        """
+        Test whether encounters are found added, removed and changed
+        """
+
+        logging.info(
+            "Testing whether encounters are found added, removed and changed")
+
+        gridLocation = gloommodel.GridLocation("G", 10)
+        scenario = gloommodel.Scenario(1, "Black Barrow", gridLocation, True)
+        event = gloommodel.CityEvent(identifier=2, choice="A")
+        donation = gloommodel.Donation(identifier=3)
+
+        encounterDicts = [
+            scenario.toDict(),
+            event.toDict(),
+            donation.toDict(),
+            scenario.toDict()
+        ]
+
+        self.assertEqual(
+            gloommodel.diff_encounters(iter(encounterDicts), iter(encounterDicts)),
+            []
+        )
+
+        changedScenario = gloommodel.Scenario(
+            1,
+            "Black Barrow",
+            gridLocation,
+            True,
+            unlockables=[gloommodel.Treasure(identifier=4)]
+        )
+        changedEvent = gloommodel.CityEvent(identifier=2, choice="B")
+        otherEncounterDicts = [
+            scenario.toDict(),
+            changedEvent.toDict(),
+            gloommodel.Donation(identifier=5).toDict(),
+            changedScenario.toDict()
+        ]
+
+        self.assertEqual(
+            gloommodel.diff_encounters(iter(encounterDicts), iter(otherEncounterDicts)),
+            [
+                {
+                    "type": "CityEvent",
+                    "identifier": 2,
+                    "change": "changed",
+                    "outcomes": {"choice": ("A", "B")},
+                    "unlockables": False
+                },
+                {"type": "Donation", "identifier": 5, "change": "added"},
+                {
+                    "type": "Scenario",
+                    "identifier": 1,
+                    "change": "changed",
+                    "outcomes": {},
+                    "unlockables": True
+                },
+                {"type": "Donation", "identifier": 3, "change": "removed"}
+            ]
+        )
+
+        # an encounter logged again is matched by digest before by identifier
+        failedScenario = gloommodel.Scenario(1, "Black Barrow", gridLocation, False)
+
+        self.assertEqual(
+            gloommodel.diff_encounters(
+                iter([scenario.toDict(), failedScenario.toDict()]),
+                iter([failedScenario.toDict()])
+            ),
+            [{"type": "Scenario", "identifier": 1, "change": "removed"}]
+        )
+
+
+
+class TestGloomlogMergeEncounters(unittest.TestCase):
+    """
+    Test Gloomlog's merge_encounters function
+    """
+
+    def testMergeEncounters(self):
+        """
+        Test whether the changes of both saves since their ancestor are merged
+        """
+
+        logging.info(
+            "Testing whether the changes of both saves since their ancestor are merged")
+
+        gridLocation = gloommodel.GridLocation("G", 10)
+        won = gloommodel.Scenario(1, "Black Barrow", gridLocation, True).toDict()
+        lost = gloommodel.Scenario(1, "Black Barrow", gridLocation, False).toDict()
+        eventA = gloommodel.CityEvent(identifier=2, choice="A").toDict()
+        eventB = gloommodel.CityEvent(identifier=2, choice="B").toDict()
+        donations = [gloommodel.Donation(identifier=i).toDict() for i in range(5)]
+        achievement = gloommodel.GlobalAchievement(identifier="City Rule: Economic").toDict()
+
+        ancestorDicts = [donations[0], eventA, donations[1]]
+
+        # they change the event and remove a donation, both reach the achievement
+        mergedList, conflicts = gloommodel.merge_encounters(
+            iter(ancestorDicts),
+            iter(ancestorDicts + [achievement, donations[2]]),
+            iter([donations[0], eventB, achievement, donations[3]])
+        )
+
+        self.assertEqual(
+            mergedList,
+            [donations[0], eventB, achievement, donations[2], donations[3]]
+        )
+        self.assertEqual(conflicts, [])
+
+        # the same scenario turned out differently, both changed the event
+        mergedList, conflicts = gloommodel.merge_encounters(
+            iter(ancestorDicts),
+            iter([donations[0], eventB, won]),
+            iter([donations[0], eventB, lost, donations[4]])
+        )
+
+        self.assertEqual(mergedList, [donations[0], eventB, won, donations[4]])
+        self.assertEqual(
+            conflicts,
+            [{
+                "type": "Scenario",
+                "identifier": 1,
+                "ours": won,
+                "theirs": lost,
+                "outcomes": {"succes": (True, False)}
+            }]
+        )
+
+        # one changed what the other removed
+        mergedList, conflicts = gloommodel.merge_encounters(
+            iter(ancestorDicts),
+            iter([donations[0], donations[1]]),
+            iter([donations[0], eventB, donations[1]])
+        )
+
+        self.assertEqual(mergedList, [donations[0], donations[1]])
+        self.assertEqual(
+            conflicts,
+            [{
+                "type": "CityEvent",
+                "identifier": 2,
+                "ours": None,
+                "theirs": eventB,
+                "outcomes": {}
+            }]
+        )
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -6,6 +6,8 @@ import os
 import sys
 sys.path.insert(0, "../")
 sys.path.insert(0, "./")
+from gloombackend import BackendMemory  # noqa
+from gloommodel import Donation, Scenario, UnlockGraph  # noqa
 from gloomview import UserInterface, UserInterfaceMain, UserInterfaceSave  # noqa
 
 
@@ -342,6 +344,356 @@ class TestUserInterfaceMain(unittest.TestCase):
             test_save_interface
         )
 
+    @mock.patch("builtins.print")
+    @mock.patch("builtins.input", side_effect=["base", "base", "Fork"])
+    def test_fork_save(self, mock_input, mock_print):
+        """
+        Test whether a save is forked under a new name and then loaded
+        """
+
+        logging.info(
+            "Testing whether a save is forked under a new name and then loaded"
+        )
+
+        user_interface_main = UserInterfaceMain(["base", "other"])
+
+        self.assertTrue(user_interface_main.fork_campaign_save())
+
+        user_interface_main.fork_save = mock.Mock()
+
+        self.assertEqual(user_interface_main.fork_campaign_save(), "fork")
+        user_interface_main.fork_save.assert_called_once_with(save_file="base", fork_file="fork")
+        mock_print.assert_any_call("Save already exists.")
+
+    @mock.patch("builtins.print")
+    @mock.patch("builtins.input", side_effect=["base", "other", "base", "base"])
+    def test_diff_saves(self, mock_input, mock_print):
+        """
+        Test whether the differences between two saves are printed
+        """
+
+        logging.info(
+            "Testing whether the differences between two saves are printed"
+        )
+
+        user_interface_main = UserInterfaceMain(["base", "other"])
+
+        self.assertTrue(user_interface_main.diff_campaign_saves())
+
+        user_interface_main.diff_saves = mock.Mock(return_value=[
+            {"type": "Scenario", "identifier": 1, "change": "added"},
+            {"type": "Unknown", "identifier": "x", "change": "removed"},
+            {
+                "type": "CityEvent",
+                "identifier": 2,
+                "change": "changed",
+                "outcomes": {"choice": ("A", "B")},
+                "unlockables": True
+            }
+        ])
+
+        self.assertTrue(user_interface_main.diff_campaign_saves())
+        user_interface_main.diff_saves.assert_called_once_with(save_file="base", other_file="other")
+        mock_print.assert_any_call("+ Scenario 1")
+        mock_print.assert_any_call("- Unknown x")
+        mock_print.assert_any_call("~ City event 2: choice 'A' -> 'B', unlockables changed")
+
+        user_interface_main.diff_saves.return_value = []
+
+        self.assertTrue(user_interface_main.diff_campaign_saves())
+        mock_print.assert_any_call("base and base hold the same encounters.")
+
+    @mock.patch("builtins.print")
+    @mock.patch("builtins.input", side_effect=["base", "other", "other", "base"])
+    def test_merge_saves(self, mock_input, mock_print):
+        """
+        Test whether conflicts are printed and the merged save is loaded
+        """
+
+        logging.info(
+            "Testing whether conflicts are printed and the merged save is loaded"
+        )
+
+        user_interface_main = UserInterfaceMain(["base", "other"])
+
+        self.assertTrue(user_interface_main.merge_campaign_saves())
+
+        user_interface_main.merge_saves = mock.Mock(return_value=None)
+
+        self.assertTrue(user_interface_main.merge_campaign_saves())
+        mock_print.assert_any_call("base and other have no common ancestor to merge from.")
+
+        user_interface_main.merge_saves.return_value = [
+            {
+                "type": "Scenario",
+                "identifier": 1,
+                "ours": {},
+                "theirs": {},
+                "outcomes": {"succes": (True, False)}
+            },
+            {"type": "CityEvent", "identifier": 2, "ours": None, "theirs": {}, "outcomes": {}}
+        ]
+
+        self.assertEqual(user_interface_main.merge_campaign_saves(), "other")
+        user_interface_main.merge_saves.assert_called_with(save_file="other", other_file="base")
+        mock_print.assert_any_call("! Scenario 1: succes True here, False there")
+        mock_print.assert_any_call("! City event 2: removed here, changed there")
+
+
+class TestUserInterfaceSave(unittest.TestCase):
+    """
+    Test GloomLog's UserInterfaceSave class
+    """
+
+    def setUp(self):
+        """
+        Set up variables for testing
+        """
+
+        logging.info(
+            "Setting up variables for testing GloomLog's UserInterfaceSave class"
+        )
+
+        with open("TestLongCampaignSave.json", "r") as file:
+            save_text = file.read()
+
+        user_interface_main = UserInterfaceMain([])
+        user_interface_main.prepare_save_interface(
+            save_file="long",
+            save_text=save_text
+        )
+        self.user_interface_save = user_interface_main.save_interface
+
+    def test_has_encounter(self):
+        """
+        Test whether logged encounters can be looked up without building them
+        """
+
+        logging.info(
+            "Testing whether logged encounters can be looked up without building them"
+        )
+
+        self.assertTrue(self.user_interface_save.has_encounter(Scenario, 5))
+        self.assertFalse(self.user_interface_save.has_encounter(Scenario, 18))
+        self.assertEqual(
+            len(self.user_interface_save.encounter_list.resident),
+            0
+        )
+
+    def test_built_on_first_use(self):
+        """
+        Test whether the index, graph and history wait until they are used
+        """
+
+        logging.info(
+            "Testing whether the index, graph and history wait until they are used"
+        )
+
+        for attribute in ("encounter_index", "unlock_graph", "edit_history"):
+            self.assertNotIn(attribute, vars(self.user_interface_save))
+
+        encounter_count = len(self.user_interface_save.encounter_list)
+        self.user_interface_save.append_encounter(new_encounter=Donation(identifier=6))
+
+        self.assertEqual(
+            sum(self.user_interface_save.encounter_index.counts.values()),
+            encounter_count + 1
+        )
+        self.assertEqual(
+            len(self.user_interface_save.edit_history.get_version()),
+            encounter_count + 1
+        )
+        self.assertEqual(len(self.user_interface_save.encounter_list), encounter_count + 1)
+
+    @mock.patch("builtins.print")
+    @mock.patch(
+        "builtins.input",
+        side_effect=[
+            "donation",
+            "yes", "city event", "12",
+            "yes", "scenario", "19", "Lost Island", "A", "1",
+            "no"
+        ]
+    )
+    def test_present_available(self, mock_input, mock_print):
+        """
+        Test whether unlocked encounters left to play are printed and kept up to date
+        """
+
+        logging.info(
+            "Testing whether unlocked encounters left to play are printed and kept up to date"
+        )
+
+        self.assertTrue(self.user_interface_save.present_available_encounters())
+        mock_print.assert_any_call("Scenario: 18")
+        mock_print.assert_any_call("City event: 40, 58, 31, 33")
+        mock_print.assert_any_call("Road event: 40, 58")
+
+        # a donation unlocking a city event and a scenario
+        self.user_interface_save.add_encounter_to_save()
+
+        self.assertIn(12, self.user_interface_save.unlock_graph.get_available("CityEvent"))
+        self.assertIn(19, self.user_interface_save.unlock_graph.get_available("Scenario"))
+
+        # undone and redone changes keep the graph as if built anew
+        for change in ("undo", "redo", "undo"):
+            if change == "undo":
+                self.assertIsInstance(self.user_interface_save.undo_change(), tuple)
+            else:
+                self.assertIsInstance(self.user_interface_save.redo_change(), tuple)
+            for type_name in ("Scenario", "CityEvent", "ItemDesign"):
+                self.assertEqual(
+                    set(self.user_interface_save.unlock_graph.get_available(type_name)),
+                    set(UnlockGraph(
+                        self.user_interface_save.encounter_list.iter_dicts()
+                    ).get_available(type_name))
+                )
+            self.assertEqual(
+                12 in self.user_interface_save.unlock_graph.get_available("CityEvent"),
+                change == "redo"
+            )
+
+        self.user_interface_save.unlock_graph = UnlockGraph()
+
+        self.assertTrue(self.user_interface_save.present_available_encounters())
+        mock_print.assert_called_with("No unlocked encounters are left to play.")
+
+    @mock.patch("builtins.input", side_effect=["donation", "no"])
+    def test_add_incremental(self, mock_input):
+        """
+        Test whether an incremental encounter gets the next identifier
+        """
+
+        logging.info(
+            "Testing whether an incremental encounter gets the next identifier"
+        )
+
+        save_data = self.user_interface_save.add_encounter_to_save()
+
+        self.assertEqual(str(self.user_interface_save.encounter_list[-1]), "Donation 6.")
+        self.assertTrue(self.user_interface_save.has_encounter(Donation, 6))
+        self.assertEqual(
+            json.loads(save_data[2]["save_records"][0])["encounter"]["data"]["identifier"],
+            6
+        )
+
+    def test_save_chunks(self):
+        """
+        Test whether the save chunks join up to the indented JSON of the save
+        """
+
+        logging.info(
+            "Testing whether the save chunks join up to the indented JSON of the save"
+        )
+
+        with open("TestLongCampaignSave.json", "r") as file:
+            save_text = file.read()
+
+        self.assertEqual("".join(self.user_interface_save.get_save_data()[1]), save_text)
+        self.assertEqual(
+            "".join(UserInterfaceSave("empty", []).iter_save_chunks()),
+            json.dumps({"EnounterList": []}, indent=2, sort_keys=True)
+        )
+
+    @mock.patch("builtins.input", side_effect=["donation", "no"])
+    def test_save_chunks_snapshot(self, mock_input):
+        """
+        Test whether save chunks stick to their version when the list changes
+        """
+
+        logging.info(
+            "Testing whether save chunks stick to their version when the list changes"
+        )
+
+        self.user_interface_save.add_encounter_to_save()
+        save_chunks = self.user_interface_save.get_save_data()[1]
+        first_chunk = next(save_chunks)
+
+        # undone while the save is being written
+        self.user_interface_save.undo_change()
+        self.user_interface_save.undo_change()
+
+        save_dict = json.loads(first_chunk + "".join(save_chunks))
+
+        self.assertEqual(save_dict["EnounterList"][-1]["data"]["identifier"], 6)
+        self.assertEqual(
+            len(save_dict["EnounterList"]),
+            len(self.user_interface_save.encounter_list) + 1
+        )
+
+    @mock.patch("builtins.print")
+    @mock.patch("builtins.input", return_value="2")
+    def test_inspect_backups(self, mock_input, mock_print):
+        """
+        Test whether a chosen backup generation is loaded and listed
+        """
+
+        logging.info(
+            "Testing whether a chosen backup generation is loaded and listed"
+        )
+
+        self.assertTrue(self.user_interface_save.inspect_backups())
+        mock_input.assert_not_called()
+
+        backup_dict = {"EnounterList": [self.user_interface_save.encounter_list.get_dict(0)]}
+
+        self.user_interface_save.check_backups = mock.Mock(return_value=3)
+        self.user_interface_save.load_backup = mock.Mock(return_value=backup_dict)
+
+        self.assertTrue(self.user_interface_save.inspect_backups())
+        self.user_interface_save.load_backup.assert_called_once_with(generation=2)
+        self.assertIn(
+            str(self.user_interface_save.encounter_list[0]),
+            [str(call.args[0]) for call in mock_print.call_args_list]
+        )
+
+    @mock.patch("builtins.input", side_effect=["donation", "no", "donation", "no"])
+    def test_undo_redo(self, mock_input):
+        """
+        Test whether undone and redone encounters are saved as records
+        """
+
+        logging.info(
+            "Testing whether undone and redone encounters are saved as records"
+        )
+
+        backend = BackendMemory()
+        backend.save_to_file(*self.user_interface_save.get_save_data()[:2])
+        original_dict = backend.load_save_file(save_file="long")
+
+        self.assertTrue(self.user_interface_save.undo_change())
+
+        for _ in range(2):
+            save_file, save_info, save_options = self.user_interface_save.add_encounter_to_save()
+            backend.save_to_file(save_file=save_file, save_info=save_info, **save_options)
+
+        save_file, save_info, save_options = self.user_interface_save.undo_change()
+        backend.save_to_file(save_file=save_file, save_info=save_info, **save_options)
+        save_file, save_info, save_options = self.user_interface_save.undo_change()
+        backend.save_to_file(save_file=save_file, save_info=save_info, **save_options)
+
+        self.assertEqual(len(save_options["save_records"]), 1)
+        self.assertEqual(backend.load_save_file(save_file="long"), original_dict)
+        self.assertFalse(self.user_interface_save.has_encounter(Donation, 6))
+
+        save_file, save_info, save_options = self.user_interface_save.redo_change()
+        backend.save_to_file(save_file=save_file, save_info=save_info, **save_options)
+
+        self.assertTrue(self.user_interface_save.has_encounter(Donation, 6))
+        self.assertFalse(self.user_interface_save.has_encounter(Donation, 7))
+        self.assertEqual(
+            backend.load_save_file(save_file="long"),
+            json.loads("".join(self.user_interface_save.get_save_data()[1]))
+        )
+
+        # the encounter list holds no encounters of its own next to the history
+        self.assertIs(
+            self.user_interface_save.encounter_list.get_dicts(),
+            self.user_interface_save.edit_history.get_version()
+        )
+        with self.assertRaises(AssertionError):
+            self.user_interface_save.encounter_list.append(Donation(identifier=7))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)